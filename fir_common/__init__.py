@@ -0,0 +1,10 @@
+"""
+Code shared by the FIR Analyser (step_2_FirAnalysis) and the FIR generator
+(microservices_backend).
+
+Nothing here reads configuration. Each service binds these modules to its
+own settings in a thin module of the same name: core/tracing.py and
+tracing.py, core/metrics.py and metrics.py, and so on. Both services put
+the repo root on sys.path for this package (core/__init__.py,
+microservices_backend/shared_path.py).
+"""
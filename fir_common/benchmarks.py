@@ -0,0 +1,17 @@
+"""
+pytest-benchmark settings shared by both services' benchmark suites
+(step_2_FirAnalysis/benchmarks, microservices_backend/benchmarks).
+"""
+
+from pathlib import Path
+
+
+def keep_results(config, results_dir: Path) -> None:
+    """
+    Call from pytest_configure: keep results in results_dir (not the cwd)
+    unless --benchmark-storage was given, and always save them.
+    """
+    if config.getoption("benchmark_storage", None) == "file://./.benchmarks":
+        config.option.benchmark_storage = f"file://{results_dir}"
+    if hasattr(config.option, "benchmark_autosave"):
+        config.option.benchmark_autosave = True
@@ -0,0 +1,104 @@
+"""
+Idempotency-Key support for expensive endpoints, shared by both services.
+
+  - Concurrent requests with the same key share one execution (single-flight):
+    the first starts the work, the rest await the same task.
+  - A successful result is kept for ttl_seconds, so a client retrying after a
+    dropped connection gets the stored response without re-running the LLMs.
+  - Failures are not stored — a retry after an error runs again.
+  - Reusing a key with a different request body raises IdempotencyKeyConflict.
+
+The work runs in its own task, so a client disconnecting mid-request does
+not cancel it for the retries waiting on the same key.
+"""
+
+import asyncio
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
+
+
+class IdempotencyKeyConflict(Exception):
+    pass
+
+
+def fingerprint(*parts: str | bytes) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode("utf-8") if isinstance(part, str) else part)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class IdempotencyStore:
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._results: "OrderedDict[str, tuple[str, Any, float]]" = OrderedDict()
+        self._inflight: dict[str, tuple[asyncio.Task, str]] = {}
+        self.replayed = 0
+        self.joined = 0
+        self.executed = 0
+
+    async def run(
+        self,
+        scope: str,
+        key: str,
+        request_fingerprint: str,
+        func: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        full_key = f"{scope}:{key}"
+        self._purge(time.monotonic())
+
+        stored = self._results.get(full_key)
+        if stored is not None:
+            self._check(full_key, stored[0], request_fingerprint)
+            self.replayed += 1
+            return stored[1]
+
+        inflight = self._inflight.get(full_key)
+        if inflight is not None:
+            self._check(full_key, inflight[1], request_fingerprint)
+            self.joined += 1
+            return await asyncio.shield(inflight[0])
+
+        self.executed += 1
+        task = asyncio.create_task(self._execute(full_key, request_fingerprint, func))
+        self._inflight[full_key] = (task, request_fingerprint)
+        return await asyncio.shield(task)
+
+    async def _execute(self, full_key: str, request_fingerprint: str, func) -> Any:
+        try:
+            result = await func()
+            self._results[full_key] = (request_fingerprint, result, time.monotonic() + self.ttl_seconds)
+            while len(self._results) > self.max_entries:
+                self._results.popitem(last=False)
+            return result
+        finally:
+            self._inflight.pop(full_key, None)
+
+    @staticmethod
+    def _check(full_key: str, expected: str, actual: str) -> None:
+        if expected != actual:
+            raise IdempotencyKeyConflict(
+                f"Idempotency-Key '{full_key.split(':', 1)[1]}' was already used with a different request body."
+            )
+
+    def _purge(self, now: float) -> None:
+        # Insertion order == expiry order, since every entry has the same TTL.
+        while self._results:
+            full_key, (_, _, expires_at) = next(iter(self._results.items()))
+            if expires_at > now:
+                break
+            del self._results[full_key]
+
+    def stats(self) -> dict:
+        return {
+            "stored_results": len(self._results),
+            "in_flight": len(self._inflight),
+            "replayed": self.replayed,
+            "joined": self.joined,
+            "executed": self.executed,
+        }
+
@@ -0,0 +1,82 @@
+"""
+Structured, sampled, non-blocking logging, shared by both services.
+
+  - Records are written as one JSON object per line; anything passed via
+    `extra=` becomes a field.
+  - Request handlers only enqueue records (QueueHandler); a background
+    QueueListener thread does the actual stdout write. If the queue is full
+    the record is dropped rather than blocking the request.
+  - A record may carry extra={"sample_rate": 0.1} to keep only that share
+    of it. WARNING and above are never sampled out.
+
+Never log raw FIR text or narrations. Mask the PII first (the analyser's
+PIIMasker, the generator's anonymiser), then shorten with redact_for_log.
+"""
+
+import json
+import logging
+import logging.handlers
+import queue
+import random
+import sys
+from datetime import datetime, timezone
+
+_RESERVED = set(vars(logging.makeLogRecord({}))) | {"message", "asctime", "sample_rate"}
+
+
+def redact_for_log(text: str, keep_chars: int = 80) -> str:
+    """Shorten already-masked FIR text to one log line. Truncation alone does not remove PII."""
+    return text[:keep_chars].replace("\n", " ") + "…"
+
+
+class JSONFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in record.__dict__.items():
+            if key not in _RESERVED:
+                payload[key] = value
+        if record.exc_info:
+            payload["exc"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = getattr(record, "sample_rate", 1.0)
+        return record.levelno >= logging.WARNING or rate >= 1.0 or random.random() < rate
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _DroppingQueueHandler.dropped += 1
+
+
+def setup_logging(debug: bool = False, queue_size: int = 10_000) -> logging.handlers.QueueListener:
+    """Install the queue-backed JSON handler on the root logger and start it."""
+    log_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JSONFormatter())
+
+    queue_handler = _DroppingQueueHandler(log_queue)
+    queue_handler.addFilter(SamplingFilter())
+
+    root = logging.getLogger()
+    root.handlers = [queue_handler]
+    root.setLevel(logging.DEBUG if debug else logging.INFO)
+
+    listener = logging.handlers.QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    listener.start()
+    return listener
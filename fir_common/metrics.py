@@ -0,0 +1,139 @@
+"""
+Prometheus metrics shared by both services, served at GET /metrics.
+
+ServiceMetrics(prefix) creates the metrics every service exposes:
+
+  <prefix>_http_request_duration_seconds{method,route,status}  histogram
+  <prefix>_errors_total{exception}                 errors returned to clients, by class name
+  <prefix>_cache_{hits,misses}_total{cache}, <prefix>_cache_hit_ratio{cache}
+                                                   read at scrape time from every cache passed
+                                                   to register_cache()
+
+plus histogram() / counter() for service-specific ones and register_counter()
+for totals read at scrape time. instrument(app) adds the request middleware.
+Route labels are the route template, never the raw path, so label
+cardinality stays bounded.
+"""
+
+import asyncio
+import functools
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Callable, Optional, Sequence
+
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, Counter, Histogram, generate_latest
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+from fir_common.tracing import span
+
+
+class ServiceMetrics:
+    def __init__(self, prefix: str, buckets: Sequence[float]):
+        self.prefix = prefix
+        self.buckets = tuple(buckets)
+        self.request_latency = self.histogram(
+            "http_request_duration_seconds", "HTTP request latency by route", ["method", "route", "status"]
+        )
+        self.errors = self.counter("errors", "Errors returned to clients, by exception class", ["exception"])
+        self._caches: dict[str, Callable[[], tuple[int, int]]] = {}
+        self._scrape_counters: dict[str, tuple[str, Callable[[], float]]] = {}
+        REGISTRY.register(_ScrapeTimeCollector(self))
+
+    def histogram(self, name: str, documentation: str, labels: Sequence[str]) -> Histogram:
+        return Histogram(f"{self.prefix}_{name}", documentation, list(labels), buckets=self.buckets)
+
+    def counter(self, name: str, documentation: str, labels: Sequence[str]) -> Counter:
+        return Counter(f"{self.prefix}_{name}", documentation, list(labels))
+
+    def register_cache(self, name: str, hits_and_misses: Callable[[], tuple[int, int]]) -> None:
+        """Expose a cache's (hits, misses) counters; the callable is read on every scrape."""
+        self._caches[name] = hits_and_misses
+
+    def register_counter(self, name: str, documentation: str, read: Callable[[], float]) -> None:
+        """Expose a running total kept elsewhere as <prefix>_<name>_total, read on every scrape."""
+        self._scrape_counters[name] = (documentation, read)
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        self.request_latency.labels(method, route, str(status)).observe(seconds)
+
+    def record_error(self, exc: BaseException) -> None:
+        self.errors.labels(type(exc).__name__).inc()
+
+    def instrument(self, app) -> None:
+        """Time every request by route template and count the errors returned to clients."""
+        from fastapi.exception_handlers import http_exception_handler
+        from starlette.exceptions import HTTPException as StarletteHTTPException
+
+        @app.middleware("http")
+        async def record_request_metrics(request, call_next):
+            started = time.perf_counter()
+            status_code = 500
+            try:
+                response = await call_next(request)
+                status_code = response.status_code
+                return response
+            except Exception as exc:
+                self.record_error(exc)
+                raise
+            finally:
+                route = request.scope.get("route")
+                self.observe_request(
+                    request.method,
+                    route.path if route is not None else "unmatched",
+                    status_code,
+                    time.perf_counter() - started,
+                )
+
+        @app.exception_handler(StarletteHTTPException)
+        async def count_http_errors(request, exc):
+            self.record_error(exc)
+            return await http_exception_handler(request, exc)
+
+
+class _ScrapeTimeCollector:
+    def __init__(self, metrics: ServiceMetrics):
+        self.metrics = metrics
+
+    def collect(self):
+        prefix = self.metrics.prefix
+        hits = CounterMetricFamily(f"{prefix}_cache_hits", "Cache hits", labels=["cache"])
+        misses = CounterMetricFamily(f"{prefix}_cache_misses", "Cache misses", labels=["cache"])
+        ratio = GaugeMetricFamily(f"{prefix}_cache_hit_ratio", "Lifetime cache hit ratio", labels=["cache"])
+        for name, read in self.metrics._caches.items():
+            hit_count, miss_count = read()
+            hits.add_metric([name], hit_count)
+            misses.add_metric([name], miss_count)
+            total = hit_count + miss_count
+            ratio.add_metric([name], hit_count / total if total else 0.0)
+        yield hits
+        yield misses
+        yield ratio
+        for name, (documentation, read) in self.metrics._scrape_counters.items():
+            yield CounterMetricFamily(f"{prefix}_{name}", documentation, value=read())
+
+
+def timed(histogram: Histogram, label: str, span_name: Optional[str] = None):
+    """Record the decorated function's duration (sync or async) under `label`, optionally inside a span."""
+    @contextmanager
+    def measure():
+        with span(span_name) if span_name else nullcontext(), histogram.labels(label).time():
+            yield
+
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with measure():
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with measure():
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def render() -> tuple[bytes, str]:
+    return generate_latest(REGISTRY), CONTENT_TYPE_LATEST
@@ -0,0 +1,190 @@
+"""
+OpenTelemetry tracing (optional dependency), shared by both services.
+
+  - span(name, **attributes) wraps a unit of work — LLM call, OCR page, FAISS
+    search, Chroma read/write, masking step — and @traced(name) does the same
+    for a whole function (sync, async or async generator). Exceptions are
+    recorded on the span and re-raised.
+  - trace_requests(app) adds the request middleware. It continues the
+    caller's trace from an incoming `traceparent` header (W3C Trace Context)
+    and echoes the request's own `traceparent` on the response.
+  - inject_headers() adds `traceparent` to outbound calls.
+
+The services never call each other, so the client carries the trace: the
+frontend (frontend/src/services/tracing.js) starts one trace ID per officer
+workflow and sends it as `traceparent` on every call to /FIR_filing and
+/api/v1/fir/*. Any other client that wants the two services' spans in one
+trace must do the same; without the header each request starts its own.
+
+setup_tracing(exporter=...) picks where spans go:
+    none     spans are created but not exported (default)
+    console  one JSON span per line on stdout
+    file     one JSON span per line appended to `file`
+    otlp     OTLP/HTTP to `otlp_endpoint` (a local collector or stand-in)
+
+Without `opentelemetry-sdk` installed every helper here is a no-op, and the
+middleware just passes an incoming traceparent back unchanged.
+"""
+
+import functools
+import inspect
+import logging
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, TextIO
+
+logger = logging.getLogger(__name__)
+
+try:
+    from opentelemetry import propagate, trace
+except ImportError:  # pragma: no cover - optional dependency
+    trace = None
+    propagate = None
+
+_provider = None
+_exporter_file: Optional[TextIO] = None
+_tracer_name = __name__
+
+
+def setup_tracing(
+    service_name: str,
+    tracer_name: str,
+    exporter: str = "none",
+    file: str = "traces.jsonl",
+    otlp_endpoint: str = "http://localhost:4318/v1/traces",
+    sample_ratio: float = 1.0,
+) -> None:
+    """Install the tracer provider and exporter. Call once at startup."""
+    global _provider, _exporter_file, _tracer_name
+    _tracer_name = tracer_name
+    exporter = exporter.lower()
+    if trace is None or exporter == "none" or _provider is not None:
+        return
+
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+    from opentelemetry.sdk.trace.sampling import ParentBased, TraceIdRatioBased
+
+    if exporter == "console":
+        span_exporter = ConsoleSpanExporter(formatter=_one_line)
+    elif exporter == "file":
+        _exporter_file = open(file, "a", encoding="utf-8")
+        span_exporter = ConsoleSpanExporter(out=_exporter_file, formatter=_one_line)
+    elif exporter == "otlp":
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter
+        except ImportError:
+            logger.warning("TRACING_EXPORTER=otlp needs opentelemetry-exporter-otlp-proto-http; tracing disabled")
+            return
+        span_exporter = OTLPSpanExporter(endpoint=otlp_endpoint)
+    else:
+        logger.warning("Unknown TRACING_EXPORTER", extra={"exporter": exporter})
+        return
+
+    _provider = TracerProvider(
+        resource=Resource.create({"service.name": service_name}),
+        sampler=ParentBased(TraceIdRatioBased(sample_ratio)),
+    )
+    _provider.add_span_processor(BatchSpanProcessor(span_exporter))
+    trace.set_tracer_provider(_provider)
+
+
+def shutdown_tracing() -> None:
+    """Flush pending spans and close the file exporter's output."""
+    global _provider, _exporter_file
+    if _provider is not None:
+        _provider.shutdown()
+        _provider = None
+    if _exporter_file is not None:
+        _exporter_file.close()
+        _exporter_file = None
+
+
+def _one_line(span) -> str:
+    return span.to_json(indent=None) + "\n"
+
+
+@contextmanager
+def span(name: str, **attributes: Any) -> Iterator[Optional[Any]]:
+    if trace is None:
+        yield None
+        return
+    tracer = trace.get_tracer(_tracer_name)
+    clean = {key: value for key, value in attributes.items() if value is not None}
+    with tracer.start_as_current_span(name, attributes=clean) as current:
+        yield current
+
+
+def traced(name: str):
+    def decorator(func):
+        if inspect.isasyncgenfunction(func):
+            @functools.wraps(func)
+            async def agen_wrapper(*args, **kwargs):
+                with span(name):
+                    async for item in func(*args, **kwargs):
+                        yield item
+            return agen_wrapper
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+@contextmanager
+def server_span(name: str, headers: dict[str, str], **attributes: Any) -> Iterator[Optional[Any]]:
+    """Server span continuing the trace described by the incoming headers."""
+    if trace is None:
+        yield None
+        return
+    tracer = trace.get_tracer(_tracer_name)
+    with tracer.start_as_current_span(
+        name,
+        context=propagate.extract(headers),
+        kind=trace.SpanKind.SERVER,
+        attributes={key: value for key, value in attributes.items() if value is not None},
+    ) as current:
+        yield current
+
+
+def inject_headers(headers: dict[str, str]) -> dict[str, str]:
+    """Add traceparent (and tracestate) for the current span to outbound headers."""
+    if propagate is not None:
+        propagate.inject(headers)
+    return headers
+
+
+def current_traceparent() -> Optional[str]:
+    return inject_headers({}).get("traceparent")
+
+
+def trace_requests(app) -> None:
+    """Add the request tracing middleware to a FastAPI app."""
+
+    @app.middleware("http")
+    async def trace_request(request, call_next):
+        """Continue the caller's trace (traceparent header) and echo this request's traceparent back."""
+        with server_span(
+            f"{request.method} {request.url.path}",
+            dict(request.headers),
+            **{"http.method": request.method, "http.target": request.url.path},
+        ) as current:
+            response = await call_next(request)
+            route = request.scope.get("route")
+            if current is not None:
+                if route is not None:
+                    current.update_name(f"{request.method} {route.path}")
+                current.set_attribute("http.status_code", response.status_code)
+            traceparent = current_traceparent() or request.headers.get("traceparent")
+            if traceparent:
+                response.headers["traceparent"] = traceparent
+            return response
@@ -2,6 +2,7 @@ import { useState, useRef } from "react";
 import axios from "axios";
 import Navbar from "../components/Navbar";
 import Footer from "../components/Footer";
+import { traceHeaders } from "../services/tracing";
 
 const API_BASE = "http://localhost:9000/api/v1/fir";
 
@@ -55,7 +56,7 @@ export default function FIRAnalysisPage() {
       const form = new FormData();
       form.append("file", file);
       const { data } = await axios.post(`${API_BASE}/analyse-pdf`, form, {
-        headers: { "Content-Type": "multipart/form-data" },
+        headers: { "Content-Type": "multipart/form-data", ...traceHeaders() },
       });
       setReport(data);
       setStage("done");
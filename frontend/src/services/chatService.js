@@ -1,5 +1,6 @@
 
 import axios from "axios";
+import { startTrace, traceHeaders } from "./tracing";
 const API_URL = "http://127.0.0.1:8000/FIR_filing";
 
 const GREETING = {
@@ -54,6 +55,7 @@ class ChatBot {
     this._awaiting = "statement"; 
     this.isComplete = false;
     this._firReport = null;
+    startTrace();
   }
 
   setLanguage(lang) {
@@ -98,7 +100,7 @@ class ChatBot {
   async _callAPI(statement) {
   const response = await axios.post(API_URL, {
     FIR_TEXT: statement,
-  });
+  }, { headers: traceHeaders() });
 
   console.log("API raw response:", response.data);
 
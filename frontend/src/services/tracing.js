@@ -0,0 +1,23 @@
+// W3C Trace Context for one officer workflow.
+//
+// Every call the frontend makes to the FIR generator (/FIR_filing) and the
+// FIR Analyser (/api/v1/fir/*) carries a `traceparent` header with the same
+// trace ID, so the backends' server spans join one trace. startTrace() begins
+// a new workflow (a new FIR); until it is called again each request gets a
+// fresh parent span ID under the current trace ID.
+
+const randomHex = (bytes) =>
+  Array.from(crypto.getRandomValues(new Uint8Array(bytes)), (b) =>
+    b.toString(16).padStart(2, "0")
+  ).join("");
+
+let traceId = randomHex(16);
+
+export function startTrace() {
+  traceId = randomHex(16);
+}
+
+export function traceHeaders() {
+  // version 00, sampled flag 01: the backends' ParentBased sampler follows it.
+  return { traceparent: `00-${traceId}-${randomHex(8)}-01` };
+}
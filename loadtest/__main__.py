@@ -0,0 +1,93 @@
+"""
+Replay a synthetic FIR corpus against the analyser, RAG chat and FIR
+generator endpoints and report latency percentiles, throughput, error rates
+and worker memory.
+
+Fully local (spawns the mock LLM server and the services):
+    python loadtest --spawn --rate 5 --duration 60 --concurrency 32
+
+Against running services (pass their PIDs to sample memory):
+    python loadtest --analyser-url http://localhost:8000 --generator-url http://localhost:8001 \\
+        --mix analyse=3,analyse-pdf=1,fir-filing=1 --pid analyser=12345
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from corpus import build_corpus  # noqa: E402
+from runner import format_report, run, scenarios, summarise  # noqa: E402
+from services import LocalStack  # noqa: E402
+
+SERVICE_OF = {"analyse": "analyser", "analyse-pdf": "analyser", "rag-generate": "rag", "fir-filing": "generator"}
+
+
+def _mix(value: str) -> dict[str, float]:
+    weights = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in SERVICE_OF:
+            raise argparse.ArgumentTypeError(f"unknown scenario {name!r} (choose from {', '.join(SERVICE_OF)})")
+        weights[name] = float(weight or 1)
+    return weights
+
+
+def _pid(value: str) -> tuple[str, int]:
+    name, _, pid = value.rpartition("=")
+    return name or f"pid-{pid}", int(pid)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rate", type=float, default=2.0, help="mean arrivals per second (Poisson)")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of arrivals")
+    parser.add_argument("--concurrency", type=int, default=32, help="max in-flight requests")
+    parser.add_argument("--timeout", type=float, default=300.0, help="per-request timeout in seconds")
+    parser.add_argument("--mix", type=_mix, default=_mix("analyse=4,analyse-pdf=2,rag-generate=3,fir-filing=1"))
+    parser.add_argument("--corpus-size", type=int, default=50)
+    parser.add_argument("--raster-pdfs", type=int, default=5, help="rasterised PDFs (OCR path) in the corpus")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spawn", action="store_true", help="start the mock LLM server and the services locally")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers per spawned service")
+    parser.add_argument("--mock-latency-ms", type=float, default=200.0)
+    parser.add_argument("--analyser-url")
+    parser.add_argument("--rag-url")
+    parser.add_argument("--generator-url")
+    parser.add_argument("--pid", type=_pid, action="append", default=[], help="NAME=PID to sample memory of")
+    parser.add_argument("--memory-interval", type=float, default=1.0)
+    parser.add_argument("--json", type=Path, help="also write the report as JSON")
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.corpus_size, raster=args.raster_pdfs, seed=args.seed)
+    urls = {"analyser": args.analyser_url, "rag": args.rag_url, "generator": args.generator_url}
+    pids = dict(args.pid)
+
+    async def go(urls, pids):
+        plan = scenarios(corpus, urls, args.mix)
+        if not plan:
+            parser.error("no scenario has both a weight in --mix and a service URL (or use --spawn)")
+        return await run(plan, args.rate, args.duration, args.concurrency, args.timeout,
+                         pids=pids, memory_interval=args.memory_interval, seed=args.seed)
+
+    if args.spawn:
+        targets = {SERVICE_OF[name] for name, weight in args.mix.items() if weight > 0}
+        with LocalStack(targets, workers=args.workers, mock_latency_ms=args.mock_latency_ms) as stack:
+            for name, service in stack.services.items():
+                urls[name] = urls.get(name) or service.url
+                pids.setdefault(name, service.pid)
+            result = asyncio.run(go(urls, pids))
+    else:
+        result = asyncio.run(go(urls, pids))
+
+    report = summarise(result)
+    print(format_report(report))
+    if args.json:
+        args.json.write_text(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
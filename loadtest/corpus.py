@@ -0,0 +1,151 @@
+"""
+Synthetic FIR corpus for load testing: narratives of varying length, digital
+(text-layer) PDFs and rasterised PDFs that force the OCR path.
+"""
+
+import io
+import random
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "step_2_FirAnalysis" / "benchmarks"))
+
+from samples import make_text_pdf  # noqa: E402
+
+FIRST_NAMES = [
+    "Rahul", "Suresh", "Anita", "Priya", "Venkat", "Lakshmi", "Arjun", "Fatima", "Kiran", "Meena",
+    "Ravi", "Sunita", "Imran", "Deepa", "Naveen", "Swathi",
+]
+SURNAMES = ["Mehta", "Kumar", "Rao", "Reddy", "Sharma", "Naidu", "Khan", "Iyer", "Patel", "Varma"]
+PLACES = [
+    "Gandhi Nagar, Secunderabad", "Dwaraka Nagar, Visakhapatnam", "MVP Colony, Visakhapatnam",
+    "Ameerpet, Hyderabad", "Benz Circle, Vijayawada", "Gajuwaka, Visakhapatnam",
+]
+
+CRIMES = [
+    {
+        "sections": "Section 420 IPC, u/s 406 IPC and Section 66D of the IT Act",
+        "story": (
+            "received repeated calls from {accused} who claimed to be a bank officer, obtained the "
+            "debit card details and OTP of the complainant and transferred Rs {amount}/- online in "
+            "{count} transactions."
+        ),
+    },
+    {
+        "sections": "Section 379 IPC",
+        "story": (
+            "parked a motorcycle bearing registration {vehicle} in front of the house at about "
+            "22:00 hrs and found it missing the next morning. {accused} was seen near the vehicle "
+            "by the watchman."
+        ),
+    },
+    {
+        "sections": "Section 323, 324 and 506 IPC",
+        "story": (
+            "was attacked by {accused} with an iron rod over a boundary dispute, sustaining injuries "
+            "to the left arm, and was threatened with dire consequences if a complaint was lodged."
+        ),
+    },
+    {
+        "sections": "Section 498A IPC and Section 4 of the Dowry Prohibition Act",
+        "story": (
+            "has been harassed by her husband {accused} and his family members for additional dowry "
+            "of Rs {amount}/- since the marriage and was sent back to her parents' house."
+        ),
+    },
+]
+
+FILLER = (
+    "The complainant further stated that the matter was discussed with the elders of the "
+    "locality on {date} but no settlement was reached, and a copy of the relevant documents "
+    "is enclosed with this complaint for verification by the investigating officer."
+)
+
+
+def _person(rng: random.Random) -> str:
+    return f"{rng.choice(FIRST_NAMES)} {rng.choice(SURNAMES)}"
+
+
+def narrative(rng: random.Random, paragraphs: int = 1) -> str:
+    """One FIR narrative; `paragraphs` extra filler paragraphs vary its length."""
+    crime = rng.choice(CRIMES)
+    complainant, accused, witness = _person(rng), _person(rng), _person(rng)
+    day = rng.randint(1, 28)
+    date = f"{day:02d}-{rng.randint(1, 12):02d}-2025"
+    story = crime["story"].format(
+        accused=accused,
+        amount=f"{rng.randint(5, 500) * 1000:,}",
+        count=rng.randint(1, 6),
+        vehicle=f"AP{rng.randint(10, 39)}{rng.choice('ABCDEFGH')}{rng.choice('KLMNPQ')}{rng.randint(1000, 9999)}",
+    )
+    text = [
+        "FIRST INFORMATION REPORT (Under Section 154 Cr.P.C.)",
+        f"District: Visakhapatnam    P.S.: {rng.choice(['II Town', 'Cyber Crime', 'MVP'])} Police Station    Year: 2025",
+        "",
+        f"On {date} at about {rng.randint(6, 22)}:{rng.choice(['00', '15', '30', '45'])} hrs, the complainant "
+        f"{complainant}, aged {rng.randint(19, 70)} years, resident of {rng.randint(1, 40)}-{rng.randint(1, 99)} "
+        f"{rng.choice(PLACES)}, mobile 9{rng.randint(100000000, 999999999)}, {story} "
+        f"The neighbour {witness} witnessed the incident.",
+    ]
+    text += [FILLER.format(date=date) for _ in range(paragraphs)]
+    text.append(f"The complainant requests action under {crime['sections']}.")
+    return "\n".join(text)
+
+
+def _wrap(text: str, width: int = 95) -> list[str]:
+    lines = []
+    for paragraph in text.splitlines():
+        words, line = paragraph.split(), ""
+        for word in words:
+            if line and len(line) + len(word) + 1 > width:
+                lines.append(line)
+                line = word
+            else:
+                line = f"{line} {word}".strip()
+        lines.append(line)
+    return lines
+
+
+def digital_pdf(text: str, pages: int = 1) -> bytes:
+    return make_text_pdf([_wrap(text) for _ in range(pages)])
+
+
+def raster_pdf(text: str, pages: int = 1) -> bytes:
+    """A scanned-looking PDF (no text layer) — needs Pillow."""
+    from PIL import Image, ImageDraw
+
+    images = []
+    for _ in range(pages):
+        image = Image.new("L", (1240, 1754), color=255)
+        draw = ImageDraw.Draw(image)
+        for i, line in enumerate(_wrap(text, width=110)):
+            draw.text((60, 60 + i * 28), line, fill=0)
+        images.append(image)
+    buffer = io.BytesIO()
+    images[0].save(buffer, format="PDF", save_all=True, append_images=images[1:], resolution=150)
+    return buffer.getvalue()
+
+
+@dataclass
+class Corpus:
+    narratives: list[str] = field(default_factory=list)
+    digital_pdfs: list[bytes] = field(default_factory=list)
+    raster_pdfs: list[bytes] = field(default_factory=list)
+
+    @property
+    def pdfs(self) -> list[bytes]:
+        return self.digital_pdfs + self.raster_pdfs
+
+
+def build_corpus(size: int = 50, raster: int = 5, max_pages: int = 4, seed: int = 0) -> Corpus:
+    """`size` narratives, one digital PDF per narrative and `raster` rasterised PDFs."""
+    rng = random.Random(seed)
+    corpus = Corpus(narratives=[narrative(rng, paragraphs=rng.randint(0, 6)) for _ in range(size)])
+    corpus.digital_pdfs = [digital_pdf(text, pages=rng.randint(1, max_pages)) for text in corpus.narratives]
+    if raster:
+        try:
+            corpus.raster_pdfs = [raster_pdf(rng.choice(corpus.narratives)) for _ in range(raster)]
+        except ImportError:
+            print("Pillow is not installed — skipping rasterised PDFs", file=sys.stderr)
+    return corpus
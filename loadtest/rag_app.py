@@ -0,0 +1,32 @@
+"""
+Standalone host for the rag_chat router — main.py does not mount it, so the
+load test serves /rag/* from here.
+
+    python -m uvicorn rag_app:app --app-dir loadtest
+"""
+
+import asyncio
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "step_2_FirAnalysis"))
+
+from fastapi import FastAPI  # noqa: E402
+
+from rag_chat.config import RAG_WARM_UP  # noqa: E402
+from rag_chat.controllers import warm_up  # noqa: E402
+from rag_chat.llm import aclose_http_client  # noqa: E402
+from rag_chat.routes import router  # noqa: E402
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if RAG_WARM_UP:
+        await asyncio.to_thread(warm_up)
+    yield
+    await aclose_http_client()
+
+
+app = FastAPI(title="RAG Chat", lifespan=lifespan)
+app.include_router(router)
@@ -0,0 +1,215 @@
+"""
+Open-loop load generator.
+
+Arrivals follow a Poisson process at the requested rate regardless of how
+fast responses come back; `concurrency` caps in-flight requests. Latency is
+measured from the scheduled arrival time, so time spent waiting for a free
+slot counts — a saturated service shows up as growing latency rather than
+as a quietly reduced offered load.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable
+
+import httpx
+
+from corpus import Corpus
+from services import process_tree_rss
+
+QUESTIONS = [
+    "Who is the accused in this FIR?",
+    "Which sections of law were invoked?",
+    "When and where did the incident happen?",
+    "What property was lost and what is its value?",
+    "Summarise the complaint in two lines.",
+]
+
+
+@dataclass
+class Scenario:
+    name: str
+    base_url: str
+    build: Callable[[random.Random], dict]  # -> httpx.request kwargs
+    weight: float = 1.0
+    setup: Callable[[httpx.AsyncClient], Awaitable[None]] | None = None
+
+
+@dataclass
+class Sample:
+    scenario: str
+    started: float
+    latency: float
+    status: int | None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.status is not None and self.status < 400
+
+
+@dataclass
+class RunResult:
+    duration: float
+    samples: list[Sample] = field(default_factory=list)
+    memory: list[tuple[float, dict[str, int]]] = field(default_factory=list)
+
+
+def scenarios(corpus: Corpus, urls: dict[str, str], weights: dict[str, float], rag_docs: int = 5) -> list[Scenario]:
+    """Request builders for each endpoint whose service URL and weight are given."""
+    rag_ids = [f"loadtest-{i}" for i in range(min(rag_docs, len(corpus.narratives)))]
+    built = []
+
+    def analyse(rng):
+        return {"method": "POST", "url": "/api/v1/fir/analyse", "json": {"fir_text": rng.choice(corpus.narratives)}}
+
+    def analyse_pdf(rng):
+        pdf = rng.choice(corpus.pdfs)
+        return {"method": "POST", "url": "/api/v1/fir/analyse-pdf",
+                "files": {"file": ("fir.pdf", pdf, "application/pdf")}}
+
+    def rag_generate(rng):
+        return {"method": "POST", "url": "/rag/generate",
+                "json": {"pdfId": rng.choice(rag_ids), "message": rng.choice(QUESTIONS),
+                         "sessionId": f"s{rng.randint(0, 999)}"}}
+
+    async def rag_setup(client: httpx.AsyncClient):
+        for pdf_id, text in zip(rag_ids, corpus.narratives):
+            response = await client.post(f"{urls['rag']}/rag/embed", json={"text": text, "pdfId": pdf_id}, timeout=300)
+            response.raise_for_status()
+
+    def fir_filing(rng):
+        return {"method": "POST", "url": "/FIR_filing", "json": {"FIR_TEXT": rng.choice(corpus.narratives)}}
+
+    table = [
+        ("analyse", "analyser", analyse, None),
+        ("analyse-pdf", "analyser", analyse_pdf, None),
+        ("rag-generate", "rag", rag_generate, rag_setup),
+        ("fir-filing", "generator", fir_filing, None),
+    ]
+    for name, service, build, setup in table:
+        if weights.get(name, 0) > 0 and urls.get(service):
+            built.append(Scenario(name, urls[service], build, weights[name], setup))
+    return built
+
+
+async def _send(client: httpx.AsyncClient, scenario: Scenario, request: dict, scheduled: float,
+                slots: asyncio.Semaphore, timeout: float, sink: list[Sample]) -> None:
+    async with slots:
+        request = {**request, "url": scenario.base_url + request["url"]}
+        try:
+            response = await client.request(**request, timeout=timeout)
+            await response.aread()
+            sink.append(Sample(scenario.name, scheduled, time.perf_counter() - scheduled, response.status_code))
+        except Exception as exc:  # noqa: BLE001 — every failure is a data point
+            sink.append(Sample(scenario.name, scheduled, time.perf_counter() - scheduled, None, type(exc).__name__))
+
+
+async def _sample_memory(pids: dict[str, int], interval: float, started: float, sink: list, stop: asyncio.Event):
+    while not stop.is_set():
+        sink.append((time.perf_counter() - started, {name: process_tree_rss(pid) for name, pid in pids.items()}))
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=interval)
+        except asyncio.TimeoutError:
+            pass
+    sink.append((time.perf_counter() - started, {name: process_tree_rss(pid) for name, pid in pids.items()}))
+
+
+async def run(
+    scenarios: list[Scenario],
+    rate: float,
+    duration: float,
+    concurrency: int,
+    timeout: float = 300.0,
+    pids: dict[str, int] | None = None,
+    memory_interval: float = 1.0,
+    seed: int = 0,
+) -> RunResult:
+    rng = random.Random(seed)
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(limits=limits) as client:
+        for scenario in scenarios:
+            if scenario.setup:
+                await scenario.setup(client)
+
+        result = RunResult(duration=duration)
+        slots = asyncio.Semaphore(concurrency)
+        stop = asyncio.Event()
+        started = time.perf_counter()
+        sampler = asyncio.create_task(_sample_memory(pids or {}, memory_interval, started, result.memory, stop))
+
+        tasks = []
+        weights = [s.weight for s in scenarios]
+        next_arrival = started
+        while next_arrival - started < duration:
+            delay = next_arrival - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            scenario = rng.choices(scenarios, weights)[0]
+            tasks.append(asyncio.create_task(
+                _send(client, scenario, scenario.build(rng), next_arrival, slots, timeout, result.samples)
+            ))
+            next_arrival += rng.expovariate(rate)
+
+        await asyncio.gather(*tasks)
+        result.duration = time.perf_counter() - started
+        stop.set()
+        await sampler
+    return result
+
+
+def _percentile(sorted_values: list[float], q: float) -> float:
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def summarise(result: RunResult) -> dict:
+    by_scenario: dict[str, list[Sample]] = {}
+    for sample in result.samples:
+        by_scenario.setdefault(sample.scenario, []).append(sample)
+    by_scenario["all"] = result.samples
+
+    report = {"duration_seconds": round(result.duration, 2), "endpoints": {}, "memory": []}
+    for name, samples in by_scenario.items():
+        ok = sorted(s.latency for s in samples if s.ok)
+        errors: dict[str, int] = {}
+        for s in samples:
+            if not s.ok:
+                key = s.error or str(s.status)
+                errors[key] = errors.get(key, 0) + 1
+        report["endpoints"][name] = {
+            "sent": len(samples),
+            "ok": len(ok),
+            "error_rate": round(1 - len(ok) / len(samples), 4) if samples else 0.0,
+            "errors": errors,
+            "throughput_rps": round(len(ok) / result.duration, 2) if result.duration else 0.0,
+            **{f"p{q}_ms": round(_percentile(ok, q) * 1000, 1) for q in (50, 90, 95, 99)},
+            "max_ms": round(ok[-1] * 1000, 1) if ok else float("nan"),
+        }
+    report["memory"] = [
+        {"t": round(t, 1), **{name: round(rss / 2**20, 1) for name, rss in rss_by_name.items()}}
+        for t, rss_by_name in result.memory
+    ]
+    return report
+
+
+def format_report(report: dict) -> str:
+    header = f"{'endpoint':<14}{'sent':>7}{'ok':>7}{'err%':>7}{'rps':>8}{'p50':>9}{'p90':>9}{'p95':>9}{'p99':>9}{'max':>9}"
+    lines = [f"duration {report['duration_seconds']}s   (latencies in ms)", header, "-" * len(header)]
+    for name, row in report["endpoints"].items():
+        lines.append(
+            f"{name:<14}{row['sent']:>7}{row['ok']:>7}{row['error_rate'] * 100:>7.1f}{row['throughput_rps']:>8.2f}"
+            f"{row['p50_ms']:>9.0f}{row['p90_ms']:>9.0f}{row['p95_ms']:>9.0f}{row['p99_ms']:>9.0f}{row['max_ms']:>9.0f}"
+        )
+        if row["errors"]:
+            lines.append(f"{'':<14}errors: {row['errors']}")
+    if report["memory"]:
+        names = [k for k in report["memory"][0] if k != "t"]
+        lines += ["", "worker RSS (MiB)", f"{'t(s)':>7}" + "".join(f"{n:>12}" for n in names)]
+        for point in report["memory"]:
+            lines.append(f"{point['t']:>7.1f}" + "".join(f"{point[n]:>12.1f}" for n in names))
+    return "\n".join(lines)
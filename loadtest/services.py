@@ -0,0 +1,189 @@
+"""
+Local stack for load tests: the mock LLM server plus the FIR analyser, the
+RAG chat app and the FIR generator, each in its own uvicorn process pointed
+at the mock — and worker RSS sampling for any of them.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+ANALYSER_DIR = ROOT / "step_2_FirAnalysis"
+GENERATOR_DIR = ROOT / "microservices_backend"
+MOCK_SERVER = ANALYSER_DIR / "benchmarks" / "mock_llm_server.py"
+
+sys.path.insert(0, str(MOCK_SERVER.parent))
+
+from mock_llm_server import free_port  # noqa: E402
+
+
+@dataclass
+class Service:
+    name: str
+    url: str
+    process: subprocess.Popen
+
+    @property
+    def pid(self) -> int:
+        return self.process.pid
+
+
+def _wait_ready(url: str, process: subprocess.Popen, timeout: float) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{url}: process exited with code {process.returncode}")
+        try:
+            httpx.get(f"{url}/openapi.json", timeout=1.0)
+            return
+        except httpx.TransportError:
+            time.sleep(0.2)
+    raise RuntimeError(f"{url}: not ready after {timeout:.0f}s")
+
+
+def spawn(name: str, args: list[str], cwd: Path, env: dict[str, str], timeout: float = 60.0) -> Service:
+    port = free_port()
+    url = f"http://127.0.0.1:{port}"
+    process = subprocess.Popen(
+        [sys.executable, *args, "--port", str(port)],
+        cwd=cwd,
+        env={**os.environ, **env},
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    try:
+        _wait_ready(url, process, timeout)
+    except Exception:
+        process.terminate()
+        raise
+    return Service(name, url, process)
+
+
+def _uvicorn(app: str, app_dir: Path, workers: int) -> list[str]:
+    return ["-m", "uvicorn", app, "--app-dir", str(app_dir), "--host", "127.0.0.1",
+            "--workers", str(workers), "--log-level", "warning"]
+
+
+class LocalStack:
+    """
+    Starts the selected services against a mock LLM server; use as a context
+    manager. `services` maps target names ("analyser", "rag", "generator") to
+    running Service objects.
+    """
+
+    def __init__(self, targets: set[str], workers: int = 1, mock_latency_ms: float = 200.0):
+        self.targets = targets
+        self.workers = workers
+        self.mock_latency_ms = mock_latency_ms
+        self.services: dict[str, Service] = {}
+        self._scratch = tempfile.TemporaryDirectory(prefix="fir-loadtest-")
+
+    def __enter__(self) -> "LocalStack":
+        try:
+            self._start()
+        except Exception:
+            self.__exit__(None, None, None)
+            raise
+        return self
+
+    def _start(self) -> None:
+        mock = spawn(
+            "mock-llm",
+            [str(MOCK_SERVER), "--host", "127.0.0.1", "--latency-ms", str(self.mock_latency_ms),
+             "--jitter-ms", str(self.mock_latency_ms / 10)],
+            cwd=ANALYSER_DIR, env={},
+        )
+        self.services["mock-llm"] = mock
+        llm_env = {
+            "OLLAMA_BASE_URL": mock.url,
+            "OLLAMA_BACKENDS": "",
+            "GEMINI_API_KEY": "mock",
+            "GEMINI_API_ENDPOINT": mock.url,
+            "TRACING_EXPORTER": "none",
+        }
+        scratch = Path(self._scratch.name)
+        if "analyser" in self.targets:
+            self.services["analyser"] = spawn(
+                "analyser", _uvicorn("main:app", ANALYSER_DIR, self.workers), cwd=ANALYSER_DIR, env=llm_env,
+            )
+        if "rag" in self.targets:
+            # main.py does not mount rag_chat, so it gets its own host app; its
+            # chroma_db/ and vectorstores_storage/ land in the scratch dir.
+            self.services["rag"] = spawn(
+                "rag", _uvicorn("rag_app:app", Path(__file__).resolve().parent, self.workers),
+                cwd=scratch, env=llm_env,
+            )
+        if "generator" in self.targets:
+            self.services["generator"] = spawn(
+                "generator", _uvicorn("app:app", GENERATOR_DIR, self.workers), cwd=GENERATOR_DIR,
+                env={
+                    "GROQ_API_KEY": "mock",
+                    "GROQ_BASE_URL": mock.url,
+                    "GROQ_REQUESTS_PER_MINUTE": "1000000",
+                    "GROQ_TOKENS_PER_MINUTE": "1000000000",
+                    "FIR_SEQUENCE_DB": str(scratch / "fir_sequences.db"),
+                    "TRACING_EXPORTER": "none",
+                },
+            )
+
+    def __exit__(self, *exc) -> None:
+        for service in reversed(list(self.services.values())):
+            service.process.terminate()
+        for service in self.services.values():
+            try:
+                service.process.wait(timeout=10)
+            except subprocess.TimeoutExpired:
+                service.process.kill()
+        self._scratch.cleanup()
+
+
+def _children(pid: int) -> list[int]:
+    try:
+        with open(f"/proc/{pid}/task/{pid}/children") as fh:
+            return [int(child) for child in fh.read().split()]
+    except OSError:
+        return []
+
+
+def _rss_bytes(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/status") as fh:
+            for line in fh:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return 0
+
+
+def process_tree_rss(pid: int) -> int:
+    """RSS of a process and its descendants (uvicorn --workers forks children)."""
+    try:
+        import psutil
+    except ImportError:
+        pending, total = [pid], 0
+        while pending:
+            current = pending.pop()
+            total += _rss_bytes(current)
+            pending.extend(_children(current))
+        return total
+
+    try:
+        parent = psutil.Process(pid)
+        processes = [parent, *parent.children(recursive=True)]
+    except psutil.NoSuchProcess:
+        return 0
+    total = 0
+    for process in processes:
+        try:
+            total += process.memory_info().rss
+        except psutil.NoSuchProcess:
+            pass
+    return total
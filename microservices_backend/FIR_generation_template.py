@@ -1,47 +1,16 @@
+from langchain_core.messages import SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
-# remove ipc later
-FIR_generation_prompt = ChatPromptTemplate.from_messages([
-    (
-        "system",
-        "You are a STRICT legal information extraction assistant for police FIR drafting.\n"
-        "Your role is LIMITED and NON-INTERPRETATIVE.\n\n"
-        "TASKS:\n"
-        "- Extract offence-related facts from the narration.\n"
-        "- Identify ONLY clearly applicable legal sections under Indian law.\n\n"
-        "ALLOWED LAW SET :\n"
-        "- Indian Penal Code\n"
-        "- Bharatiya Nyaya Sanhita (BNS), 2023\n"
-        "- Information Technology Act, 2000\n"
-        "- NDPS Act, 1985\n"
-        "- POCSO Act, 2012\n"
-        "- Arms Act, 1959\n"
-        "- SC/ST (Prevention of Atrocities) Act, 1989\n"
-        "- Motor Vehicles Act, 1988\n"
-        "- Dowry Prohibition Act, 1961\n"
-        "- Immoral Traffic (Prevention) Act, 1956\n"
-        "- Explosives Act, 1884\n"
-        "- Prevention of Corruption Act, 1988\n"
-        "- Telangana Banning of Unregulated Deposit Schemes Act (TBUDS)\n"
-        "- Andhra Pradesh Protection of Depositors of Financial Establishments Act\n"
-        "- Relevant Excise / Prohibition / Gaming / Police / PD Acts of Andhra Pradesh or Telangana\n\n"
-        "STRICT RULES:\n"
-        "- If a section is not explicitly supported by facts, DO NOT include it.\n"
-        "- Do NOT guess or approximate sections.\n"
-        "- Do NOT include civil-only laws.\n"
-        "- Do NOT enumerate laws unnecessarily.\n"
-        "- Prefer omission over over-inclusion.\n"
-        "- If facts indicate a law outside this set, state \"Other applicable State/Central statute\" without guessing sections.\n"
-        "- Do NOT explain your reasoning.\n"
-        "- Do NOT invent facts or sections."
 
+from prompts import load_prompt, prompt_version
 
-       " TASKS:"
-"- Extract all possible FIR fields from the narration"
-"- Populate the FIRFormIF1 structure"
-"- If a field is not present in the narration, set it to null or a default value"
-"- Do NOT invent FIR numbers, GD entries, officer details, or court dispatch details"
+# remove ipc later
+# The system prompt is a versioned asset (prompts/manifest.json). It is sent
+# as a static SystemMessage ahead of the narration so every request shares
+# the same cacheable prefix.
+FIR_GENERATION_PROMPT_VERSION = prompt_version("fir_generation_system")
 
-    ),
+FIR_generation_prompt = ChatPromptTemplate.from_messages([
+    SystemMessage(content=load_prompt("fir_generation_system")),
     (
         "human",
         "FIR Narration:\n{FIR_narration}"
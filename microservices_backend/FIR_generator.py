@@ -4,18 +4,29 @@ from pydantic import BaseModel, Field
 from typing import List, Optional, Dict, Any, Union
 from dotenv import load_dotenv
 from datetime import datetime
-import uuid
 import os
 import json
 
 from encryption_template import encryption_prompt
 from FIR_generation_template import FIR_generation_prompt
+from anonymiser import anonymise, replace_secured_fields
+from rate_limit import groq_limiter, estimate_tokens
+from sequences import next_fir_number, next_gd_entry_number
+from metrics import timed_node, record_usage
+from tracing import span
 
 load_dotenv()
 
+# "local" — regex/gazetteer anonymiser only (no LLM call)
+# "llm"   — original Groq-based anonymisation
+# "auto"  — local first, Groq only when no person name was found locally
+ANONYMISER_MODE = os.getenv("ANONYMISER_MODE", "local").lower()
+
 model = ChatGroq(
     model="llama-3.3-70b-versatile",
     api_key=os.getenv("GROQ_API_KEY"),
+    # Unset → api.groq.com. Point at benchmarks/mock_llm_server.py for offline runs.
+    base_url=os.getenv("GROQ_BASE_URL") or None,
     temperature=0
 )
 
@@ -101,60 +112,77 @@ def get_current_datetime():
     }
 
 
-def generate_fir_number():
-    return f"FIR-{uuid.uuid4().hex[:8].upper()}"
+def generate_fir_number(station_code: str, year: str):
+    return next_fir_number(station_code, year)
+
+
+def generate_gd_entry_number(station_code: str, date: str):
+    return next_gd_entry_number(station_code, date)
 
 
 def get_device_location():
     return {
         "district": "Visakhapatnam",
         "police_station": "Cyber Crime Police Station",
+        "station_code": os.getenv("FIR_STATION_CODE", "CCPS-VSP"),
         "distance_and_direction_from_ps": "2 KM North"
     }
 
 
 
-encrypt_llm = model.with_structured_output(NarrationEncrypted)
-llm_extraction = model.with_structured_output(LLMFIRExtraction)
+# include_raw keeps the AIMessage alongside the parsed model so token usage
+# can be counted.
+encrypt_llm = model.with_structured_output(NarrationEncrypted, include_raw=True)
+llm_extraction = model.with_structured_output(LLMFIRExtraction, include_raw=True)
+
+
+def _parsed(node: str, output: dict):
+    record_usage(node, output["raw"])
+    if output["parsing_error"] is not None:
+        raise output["parsing_error"]
+    return output["parsed"]
+
 
 
+@timed_node("encrypt_narration")
+async def encrypt_narration(state: dict):
+    if ANONYMISER_MODE != "llm":
+        with span("mask.anonymise", mode=ANONYMISER_MODE):
+            encrypted_narration, mapping = anonymise(state["fir_text"])
+        result = NarrationEncrypted(encrypted_narration=encrypted_narration, mapping=mapping)
+        found_person = any(p.startswith("PERSON_") for p in mapping)
+        if ANONYMISER_MODE == "local" or found_person:
+            return {
+                "encrypted_narration": result.encrypted_narration,
+                "mapping": result.mapping
+            }
 
-def encrypt_narration(state: dict):
     msg = encryption_prompt.format_messages(
         text=state["fir_text"]
     )
-    result = encrypt_llm.invoke(msg)
+    await groq_limiter.acquire(estimate_tokens(msg))
+    with span("llm.groq.anonymise"):
+        result = _parsed("encrypt_narration", await encrypt_llm.ainvoke(msg))
     return {
         "encrypted_narration": result.encrypted_narration,
         "mapping": result.mapping
     }
 
 
-def llm_extract_fields(state: dict):
+@timed_node("llm_extract_fields")
+async def llm_extract_fields(state: dict):
     msg = FIR_generation_prompt.format_messages(
         FIR_narration=state["encrypted_narration"]
     )
-    extracted = llm_extraction.invoke(msg)
+    await groq_limiter.acquire(estimate_tokens(msg))
+    with span("llm.groq.extract"):
+        extracted = _parsed("llm_extract_fields", await llm_extraction.ainvoke(msg))
     return {
         "llm_data": extracted,
         "mapping": state["mapping"]
     }
 
-def replace_secured_fields(value, mapping: dict):
-    if isinstance(value, str):
-        for placeholder, original in mapping.items():
-            value = value.replace(placeholder, str(original))
-        return value
-
-    if isinstance(value, list):
-        return [replace_secured_fields(v, mapping) for v in value]
-
-    if isinstance(value, dict):
-        return {k: replace_secured_fields(v, mapping) for k, v in value.items()}
-
-    return value
-
-
+@timed_node("mapping_function")
 def mapping_function(state: dict):
     llm_data = state["llm_data"]      
     mapping = state["mapping"]       
@@ -168,6 +196,7 @@ def mapping_function(state: dict):
     }
 
 
+@timed_node("build_final_fir")
 def build_final_fir(state: dict):
     dt = get_current_datetime()
     loc = get_device_location()
@@ -178,13 +207,13 @@ def build_final_fir(state: dict):
         district=loc["district"],
         police_station=loc["police_station"],
         year=dt["year"],
-        fir_number=generate_fir_number(),
+        fir_number=generate_fir_number(loc["station_code"], dt["year"]),
         date_of_occurrence=llm.date_of_occurrence,
         time_of_occurrence=llm.time_of_occurrence,
         fir_date=dt["date"],
         information_received_date=dt["date"],
         information_received_time=dt["time"],
-        general_diary_entry_numbers="AUTO",
+        general_diary_entry_numbers=generate_gd_entry_number(loc["station_code"], dt["date"]),
         general_diary_time=dt["time"],
         distance_and_direction_from_ps=loc["distance_and_direction_from_ps"],
         place_of_occurrence=llm.place_of_occurrence,
@@ -228,6 +257,6 @@ compiled_graph = graph.compile()
 # ₹1,20,000/- online. The accused threatened false cases if reported.
 # """
 
-# output = compiled_graph.invoke({"fir_text": FIR_TEXT})
+# output = asyncio.run(compiled_graph.ainvoke({"fir_text": FIR_TEXT}))
 
 # print(json.dumps(output["fir"].model_dump(), indent=2))
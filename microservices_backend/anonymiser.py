@@ -0,0 +1,195 @@
+"""
+Local, deterministic anonymiser for FIR narrations.
+
+Finds phone numbers, Aadhaar numbers, vehicle registrations and e-mail
+addresses with regexes, and person names / places with cue-word rules
+(honorifics, "complainant", "s/o", "resident of" …) plus an optional
+gazetteer file and an optional spaCy NER model. Every detected value is
+replaced with a placeholder such as PERSON_1 and the placeholder → value
+mapping is returned, the same shape the LLM-based encrypt_narration
+produced.
+
+Environment:
+    ANONYMISER_GAZETTEER    path to a text file, one "TYPE<TAB>value" per line
+    ANONYMISER_SPACY_MODEL  e.g. en_core_web_sm (only used if spaCy is installed)
+"""
+
+import os
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Tuple
+
+PHONE_RE = re.compile(r"(?<![\w+])(?:\+91[\s-]?|0)?[6-9]\d{4}[\s-]?\d{5}(?!\w)")
+AADHAAR_RE = re.compile(r"(?<!\w)[2-9]\d{3}[\s-]?\d{4}[\s-]?\d{4}(?!\w)")
+VEHICLE_RE = re.compile(r"(?<!\w)[A-Z]{2}[\s-]?\d{1,2}[\s-]?[A-Z]{1,3}[\s-]?\d{4}(?!\w)")
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+# One to three capitalised words, e.g. "Rahul", "Rahul Mehta", "K. Srinivasa Rao".
+_NAME = r"((?:[A-Z]\.\s?)*[A-Z][a-z]+(?:\s(?:[A-Z]\.\s?)*[A-Z][a-z]+){0,2})"
+
+PERSON_CUE_RE = re.compile(
+    r"(?:\b(?:Mr|Mrs|Ms|Dr|Sri|Shri|Smt|Kumari|Kum)\.?\s+"
+    r"|\b(?i:complainant|accused|victim|witness|deceased|informant|named|namely|"
+    r"son of|daughter of|wife of|husband of|[SDW]/O)\s*"
+    # "Accused No. 1 Suresh", "Witness No.2: Anita"
+    r"(?:(?i:no)\.?\s*\d+\s*[:,-]?\s*)?"
+    r"(?:is\s+|was\s+|one\s+|Mr\.?\s+|Mrs\.?\s+|Smt\.?\s+|Sri\.?\s+)?)"
+    + _NAME
+)
+LOCATION_CUE_RE = re.compile(
+    r"\b(?i:resident of|residing at|r/o|near|opposite|village|colony of)\s+" + _NAME
+)
+
+# Capitalised words the cue rules commonly pick up that are not names.
+_STOPWORDS = {
+    "The", "He", "She", "They", "His", "Her", "It", "On", "At", "In", "And",
+    "Unknown", "Police", "Station", "Bank", "Officer", "Complainant", "Accused",
+    "No",
+}
+
+ENTITY_ORDER = ("PERSON", "LOCATION", "PHONE", "AADHAAR", "VEHICLE", "EMAIL")
+
+
+@lru_cache(maxsize=1)
+def _gazetteer() -> Tuple[Tuple[str, str], ...]:
+    path = os.getenv("ANONYMISER_GAZETTEER")
+    if not path or not os.path.exists(path):
+        return ()
+    entries = []
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            entity_type, _, value = line.rstrip("\n").partition("\t")
+            if value.strip():
+                entries.append((entity_type.strip().upper(), value.strip()))
+    return tuple(entries)
+
+
+@lru_cache(maxsize=1)
+def _spacy_model():
+    model_name = os.getenv("ANONYMISER_SPACY_MODEL")
+    if not model_name:
+        return None
+    try:
+        import spacy
+        return spacy.load(model_name, disable=["parser", "lemmatizer"])
+    except (ImportError, OSError):
+        return None
+
+
+_SPACY_LABELS = {"PERSON": "PERSON", "GPE": "LOCATION", "LOC": "LOCATION", "FAC": "LOCATION"}
+
+
+def _clean_name(value: str) -> str:
+    words = value.split()
+    while words and words[0] in _STOPWORDS:
+        words.pop(0)
+    while words and words[-1] in _STOPWORDS:
+        words.pop()
+    return " ".join(words)
+
+
+def detect_entities(text: str) -> Dict[str, List[str]]:
+    """Return detected values grouped by entity type, in order of first appearance."""
+    found: Dict[str, List[str]] = {entity_type: [] for entity_type in ENTITY_ORDER}
+
+    def add(entity_type: str, value: str) -> None:
+        value = value.strip()
+        if value and value not in found.setdefault(entity_type, []):
+            found[entity_type].append(value)
+
+    for entity_type, pattern in (
+        ("PHONE", PHONE_RE),
+        ("AADHAAR", AADHAAR_RE),
+        ("VEHICLE", VEHICLE_RE),
+        ("EMAIL", EMAIL_RE),
+    ):
+        for match in pattern.finditer(text):
+            add(entity_type, match.group(0))
+
+    for match in PERSON_CUE_RE.finditer(text):
+        add("PERSON", _clean_name(match.group(1)))
+    for match in LOCATION_CUE_RE.finditer(text):
+        add("LOCATION", _clean_name(match.group(1)))
+
+    for entity_type, value in _gazetteer():
+        if value in text:
+            add(entity_type, value)
+
+    nlp = _spacy_model()
+    if nlp is not None:
+        for ent in nlp(text).ents:
+            if ent.label_ in _SPACY_LABELS:
+                add(_SPACY_LABELS[ent.label_], ent.text)
+
+    return {k: v for k, v in found.items() if v}
+
+
+def anonymise(text: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Replace every detected entity with a placeholder.
+
+    Returns (anonymised_text, mapping) where mapping is placeholder → original.
+    All occurrences of a value share one placeholder, and longer values are
+    matched first so "Rahul Mehta" is not split into "Rahul" + "Mehta".
+    Values only match as whole words, so "Ravi" leaves "Ravindra" alone.
+    """
+    entities = detect_entities(text)
+
+    value_to_placeholder: Dict[str, str] = {}
+    counters: Dict[str, int] = {}
+    for entity_type, values in entities.items():
+        for value in values:
+            if value not in value_to_placeholder:
+                counters[entity_type] = counters.get(entity_type, 0) + 1
+                value_to_placeholder[value] = f"{entity_type}_{counters[entity_type]}"
+
+    if not value_to_placeholder:
+        return text, {}
+
+    pattern = re.compile(
+        "|".join(
+            rf"(?<!\w){re.escape(v)}(?!\w)"
+            for v in sorted(value_to_placeholder, key=len, reverse=True)
+        )
+    )
+    anonymised = pattern.sub(lambda m: value_to_placeholder[m.group(0)], text)
+    mapping = {placeholder: value for value, placeholder in value_to_placeholder.items()}
+    return anonymised, mapping
+
+
+def build_restorer(mapping: Dict[str, Any]) -> Callable[[str], str]:
+    """
+    Compile placeholder → original mapping into a single-pass replacer.
+
+    Placeholders are alternated longest first, so PERSON_10 is never read as
+    PERSON_1 followed by "0", and restored values are never rescanned.
+    """
+    if not mapping:
+        return lambda text: text
+
+    lookup = {placeholder: str(original) for placeholder, original in mapping.items()}
+    pattern = re.compile("|".join(re.escape(p) for p in sorted(lookup, key=len, reverse=True)))
+    return lambda text: pattern.sub(lambda m: lookup[m.group(0)], text)
+
+
+def restore_placeholders(value: Any, restore: Callable[[str], str]) -> Any:
+    """Apply restore to every string inside nested lists / dicts."""
+    if isinstance(value, str):
+        return restore(value)
+
+    if isinstance(value, list):
+        return [restore_placeholders(v, restore) for v in value]
+
+    if isinstance(value, dict):
+        return {k: restore_placeholders(v, restore) for k, v in value.items()}
+
+    return value
+
+
+def replace_secured_fields(value: Any, mapping: Dict[str, Any]) -> Any:
+    """
+    Restore every placeholder inside an extraction dump. The restorer regex
+    is compiled once per call, then each string is rewritten in a single
+    linear pass.
+    """
+    return restore_placeholders(value, build_restorer(mapping))
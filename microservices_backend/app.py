@@ -1,26 +1,89 @@
-import json
+import asyncio
+import logging
+import os
+import time
+from contextlib import asynccontextmanager
+from typing import List, Optional
 
-from fastapi import FastAPI, Body
+from fastapi import FastAPI, Body, HTTPException, Header, Response
 from FIR_generator import compiled_graph
+from rate_limit import groq_limiter, measure_wait
+from idempotency import idempotency_store, fingerprint, IdempotencyKeyConflict
+from logging_config import setup_logging, log_narration, LOG_SAMPLE_RATE
+import metrics
+import tracing
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-app = FastAPI()
+from pydantic import BaseModel, Field
+
+# Upper bound on FIR drafts running through the graph at once in this worker;
+# extra requests wait their turn instead of piling onto Groq.
+FIR_MAX_CONCURRENCY = int(os.getenv("FIR_MAX_CONCURRENCY", "8"))
+fir_semaphore = asyncio.Semaphore(FIR_MAX_CONCURRENCY)
+
+# Batch uploads get their own, smaller lane so a backlog import cannot take
+# every slot from officers filing interactively.
+FIR_BATCH_CONCURRENCY = int(os.getenv("FIR_BATCH_CONCURRENCY", "4"))
+FIR_BATCH_MAX_ITEMS = int(os.getenv("FIR_BATCH_MAX_ITEMS", "100"))
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    log_listener = setup_logging()
+    tracing.setup_tracing("fir-generator", tracer_name="fir_generator")
+    yield
+    tracing.shutdown_tracing()
+    log_listener.stop()
+
+
+app = FastAPI(lifespan=lifespan)
+
+metrics.register_cache(
+    "idempotency",
+    lambda: (idempotency_store.replayed + idempotency_store.joined, idempotency_store.executed),
+)
+metrics.register_rate_limit_wait(lambda: groq_limiter.total_wait_seconds)
+
+
+metrics.instrument(app)
+
+
 class FIRRequest(BaseModel):
     FIR_TEXT: str
+class FIRBatchRequest(BaseModel):
+    FIR_TEXTS: List[str] = Field(..., min_length=1)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],  # or ["http://localhost:3000"]
     allow_credentials=True,
     allow_methods=["*"],  # IMPORTANT: allows OPTIONS
     allow_headers=["*"],
+    expose_headers=["traceparent"],
 )
+tracing.trace_requests(app)
+
+@app.get("/metrics", include_in_schema=False)
+def prometheus_metrics():
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
 @app.get("/")
 def read_root():
     return {"Hello": "World"}
 
+async def _draft_fir(text: str):
+    async with fir_semaphore:
+        output = await compiled_graph.ainvoke({"fir_text": text})
+    return output["fir"]
+
 @app.post("/FIR_filing")
-async def FIR_generator(req: FIRRequest):
-    print("Received FIR text:",req.FIR_TEXT)
+async def FIR_generator(
+    req: FIRRequest,
+    idempotency_key: Optional[str] = Header(default=None, alias="Idempotency-Key"),
+):
+    logger.info("FIR narration received", extra={"chars": len(req.FIR_TEXT), "sample_rate": LOG_SAMPLE_RATE})
+    log_narration(logger, req.FIR_TEXT)
       # FIR_TEXT = """
       #       On 15th April 2025, the complainant Rahul Mehta, aged 32 years,
       #       resident of Secunderabad, received multiple phone calls and WhatsApp
@@ -28,6 +91,59 @@ async def FIR_generator(req: FIRRequest):
       #       The accused obtained debit card details and OTP and transferred
       #       ₹1,30,000/- online. The accused threatened false cases if reported.
       #       """
-    output = compiled_graph.invoke({"fir_text": req.FIR_TEXT})
-    print(json.dumps(output["fir"].model_dump(), indent=2))
-    return {"message":output["fir"]}
+    if not idempotency_key:
+        fir = await _draft_fir(req.FIR_TEXT)
+    else:
+        # Client retries with the same key share one draft (and one FIR number).
+        try:
+            fir = await idempotency_store.run(
+                scope="FIR_filing",
+                key=idempotency_key,
+                request_fingerprint=fingerprint(req.FIR_TEXT),
+                func=lambda: _draft_fir(req.FIR_TEXT),
+            )
+        except IdempotencyKeyConflict as exc:
+            raise HTTPException(status_code=409, detail=str(exc))
+    logger.info("FIR drafted", extra={"fir_number": fir.fir_number, "sample_rate": LOG_SAMPLE_RATE})
+    return {"message":fir}
+
+@app.post("/FIR_filing/batch")
+async def FIR_generator_batch(req: FIRBatchRequest):
+    if len(req.FIR_TEXTS) > FIR_BATCH_MAX_ITEMS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch has {len(req.FIR_TEXTS)} narrations; limit is {FIR_BATCH_MAX_ITEMS}.",
+        )
+
+    batch_semaphore = asyncio.Semaphore(FIR_BATCH_CONCURRENCY)
+    started = time.perf_counter()
+
+    # Each draft tallies its own Groq waits; other requests share the limiter.
+    waits = [0.0] * len(req.FIR_TEXTS)
+
+    async def draft(index: int, text: str) -> dict:
+        async with batch_semaphore, fir_semaphore:
+            with measure_wait() as waited:
+                try:
+                    output = await compiled_graph.ainvoke({"fir_text": text})
+                except Exception as exc:
+                    metrics.record_error(exc)
+                    return {"index": index, "status": "error", "error": f"{type(exc).__name__}: {exc}"}
+                finally:
+                    waits[index] = waited.seconds
+        return {"index": index, "status": "ok", "fir": output["fir"]}
+
+    results = await asyncio.gather(*(draft(i, text) for i, text in enumerate(req.FIR_TEXTS)))
+
+    elapsed = time.perf_counter() - started
+    succeeded = sum(1 for r in results if r["status"] == "ok")
+    stats = {
+        "total": len(results),
+        "succeeded": succeeded,
+        "failed": len(results) - succeeded,
+        "elapsed_seconds": round(elapsed, 2),
+        "firs_per_minute": round(succeeded * 60 / elapsed, 2) if elapsed else None,
+        "rate_limit_wait_seconds": round(sum(waits), 2),
+    }
+    logger.info("FIR batch drafted", extra=stats)
+    return {"results": results, "stats": stats}
@@ -0,0 +1,107 @@
+"""
+Benchmark placeholder restoration on large FIR extractions.
+
+Compares the old per-mapping str.replace loop with the compiled single-pass
+restorer used by replace_secured_fields, on synthetic LLMFIRExtraction dumps
+with dozens of parties and property items.
+
+Run from microservices_backend/:
+    python benchmarks/bench_replace_secured_fields.py
+    python benchmarks/bench_replace_secured_fields.py --parties 80 --items 60
+"""
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from anonymiser import replace_secured_fields
+
+
+def legacy_replace(value, mapping: dict):
+    """The previous implementation, kept here for comparison only."""
+    if isinstance(value, str):
+        for placeholder, original in mapping.items():
+            value = value.replace(placeholder, str(original))
+        return value
+    if isinstance(value, list):
+        return [legacy_replace(v, mapping) for v in value]
+    if isinstance(value, dict):
+        return {k: legacy_replace(v, mapping) for k, v in value.items()}
+    return value
+
+
+def make_case(parties: int, items: int) -> tuple[dict, dict]:
+    mapping = {}
+    for i in range(1, parties + 1):
+        mapping[f"PERSON_{i}"] = f"Person Name {i} Kumar"
+        mapping[f"LOCATION_{i}"] = f"{i}-{i * 7} Gandhi Nagar, Ward {i}"
+        mapping[f"PHONE_{i}"] = f"98{i:08d}"
+
+    accused = [
+        {
+            "name": f"PERSON_{i}",
+            "known_status": "known",
+            "address": f"LOCATION_{i}",
+            "description": f"PERSON_{i} was seen with PERSON_{(i % parties) + 1} near LOCATION_{i}",
+        }
+        for i in range(1, parties + 1)
+    ]
+    property_details = [
+        {
+            "description": f"Mobile phone handed over by PERSON_{(i % parties) + 1} (PHONE_{(i % parties) + 1})",
+            "quantity": 1,
+            "value": f"Rs {1000 * i}",
+            "identification_marks": f"IMEI 35{i:013d}",
+        }
+        for i in range(1, items + 1)
+    ]
+    narrative = " ".join(
+        f"PERSON_{i} residing at LOCATION_{i} called PHONE_{i}." for i in range(1, parties + 1)
+    )
+    data = {
+        "acts_and_sections": [{"act_name": "Indian Penal Code", "sections": ["420", "406"]}],
+        "accused_list": accused,
+        "complainant_name": "PERSON_1",
+        "complainant_address": "LOCATION_1",
+        "fir_contents": narrative,
+        "property_details": property_details,
+        "total_property_value": "Rs 1,00,000",
+        "delay_in_reporting_reason": None,
+        "action_taken_description": "Registered and taken up for investigation",
+        "date_of_occurrence": "15-04-2025",
+        "time_of_occurrence": "10:00",
+        "place_of_occurrence": "LOCATION_2",
+    }
+    return data, mapping
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--parties", type=int, default=40)
+    parser.add_argument("--items", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    data, mapping = make_case(args.parties, args.items)
+
+    restored = replace_secured_fields(data, mapping)
+    assert restored["accused_list"][9]["name"] == mapping["PERSON_10"], "PERSON_10 restored incorrectly"
+
+    legacy = legacy_replace(data, mapping)
+    legacy_wrong = legacy["accused_list"][9]["name"] != mapping["PERSON_10"]
+
+    legacy_s = min(timeit.repeat(lambda: legacy_replace(data, mapping), number=1, repeat=args.repeat))
+    single_s = min(timeit.repeat(lambda: replace_secured_fields(data, mapping), number=1, repeat=args.repeat))
+
+    print(f"parties={args.parties} items={args.items} mapping_entries={len(mapping)}")
+    print(f"legacy str.replace loop : {legacy_s * 1000:8.2f} ms"
+          f"{'  (PERSON_10 restored WRONG)' if legacy_wrong else ''}")
+    print(f"single-pass restorer    : {single_s * 1000:8.2f} ms")
+    print(f"speed-up                : {legacy_s / single_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
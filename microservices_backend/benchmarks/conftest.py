@@ -0,0 +1,21 @@
+"""
+pytest-benchmark suite for the FIR generator.
+
+Run from microservices_backend/:
+    pytest benchmarks                        # run, save results to benchmarks/.results
+    pytest benchmarks --benchmark-compare    # compare against the previous saved run
+"""
+
+import sys
+from pathlib import Path
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+
+import shared_path  # noqa: E402,F401 - puts fir_common on sys.path
+from fir_common.benchmarks import keep_results  # noqa: E402
+
+
+def pytest_configure(config):
+    keep_results(config, BENCH_DIR / ".results")
@@ -0,0 +1,17 @@
+import pytest
+
+from anonymiser import replace_secured_fields
+from bench_replace_secured_fields import legacy_replace, make_case
+
+
+@pytest.mark.parametrize("parties,items", [(5, 5), (40, 40)])
+def test_replace_secured_fields(benchmark, parties, items):
+    data, mapping = make_case(parties, items)
+    restored = benchmark(replace_secured_fields, data, mapping)
+    assert restored["accused_list"][parties - 1]["name"] == mapping[f"PERSON_{parties}"]
+
+
+@pytest.mark.parametrize("parties,items", [(5, 5), (40, 40)])
+def test_legacy_replace_baseline(benchmark, parties, items):
+    data, mapping = make_case(parties, items)
+    benchmark(legacy_replace, data, mapping)
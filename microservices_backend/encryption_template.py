@@ -1,13 +1,13 @@
+from langchain_core.messages import SystemMessage
 from langchain_core.prompts import ChatPromptTemplate
 
+from prompts import load_prompt, prompt_version
+
+ENCRYPTION_PROMPT_VERSION = prompt_version("encryption_system")
+
 encryption_prompt = ChatPromptTemplate.from_messages(
       [
-            ("system", "you are a mapping assistant that identifies the sensitive parts of the text like names,"
-            " locations and dates nad replace them with placeholders like person_A , person_B, etc , si"
-            "milarly for locations and dates with location_A, location_B and date_A, date_B respectively."
-            " you should also maintain a mapping of the placeholders to the original values in a dictionary format and return that as well"),
+            SystemMessage(content=load_prompt("encryption_system")),
             ("human", "Here is the text that needs to be anonymized: {text}")
       ]
 )
-
-
@@ -0,0 +1,26 @@
+"""
+Idempotency-Key store for the FIR generator: fir_common.idempotency sized
+from the environment.
+
+Environment:
+    IDEMPOTENCY_TTL_SECONDS  default 600
+    IDEMPOTENCY_MAX_ENTRIES  default 1000
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+import shared_path  # noqa: F401 - puts fir_common on sys.path
+from fir_common.idempotency import (  # noqa: F401 - re-exported for app.py
+    IdempotencyKeyConflict,
+    IdempotencyStore,
+    fingerprint,
+)
+
+load_dotenv()
+
+idempotency_store = IdempotencyStore(
+    ttl_seconds=float(os.getenv("IDEMPOTENCY_TTL_SECONDS", "600")),
+    max_entries=int(os.getenv("IDEMPOTENCY_MAX_ENTRIES", "1000")),
+)
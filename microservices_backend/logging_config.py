@@ -0,0 +1,38 @@
+"""
+Logging for the FIR generator: fir_common.logging_config configured from
+the environment.
+
+Never log raw narrations — use log_narration, which anonymises them first.
+
+Environment:
+    DEBUG            default false
+    LOG_SAMPLE_RATE  default 0.1    share of routine per-request logs kept
+    LOG_QUEUE_SIZE   default 10000
+"""
+
+import logging
+import os
+
+from dotenv import load_dotenv
+
+import shared_path  # noqa: F401 - puts fir_common on sys.path
+from anonymiser import anonymise
+from fir_common import logging_config as _logging_config
+from fir_common.logging_config import redact_for_log
+
+load_dotenv()
+
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+LOG_SAMPLE_RATE = float(os.getenv("LOG_SAMPLE_RATE", "0.1"))
+LOG_QUEUE_SIZE = int(os.getenv("LOG_QUEUE_SIZE", "10000"))
+
+
+def setup_logging():
+    """Install the queue-backed JSON handler on the root logger and start it."""
+    return _logging_config.setup_logging(debug=DEBUG, queue_size=LOG_QUEUE_SIZE)
+
+
+def log_narration(logger: logging.Logger, text: str) -> None:
+    """DEBUG-log the start of a narration with names, phones etc. replaced by placeholders."""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("FIR narration", extra={"narration": redact_for_log(anonymise(text)[0])})
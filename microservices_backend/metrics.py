@@ -0,0 +1,51 @@
+"""
+Prometheus metrics for the FIR generator, served at GET /metrics
+(fir_common.metrics with the fir_generator prefix).
+
+  fir_generator_http_request_duration_seconds{method,route,status}  histogram
+  fir_generator_node_duration_seconds{node}        one per LangGraph node
+  fir_generator_llm_tokens_total{node,kind}        Groq usage, kind = prompt / completion
+  fir_generator_errors_total{exception}            errors returned to clients, by class name
+  fir_generator_groq_rate_limit_wait_seconds_total time spent waiting on the client-side limiter
+  fir_generator_cache_{hits,misses}_total{cache}, fir_generator_cache_hit_ratio{cache}
+                                                   read at scrape time from every cache passed
+                                                   to register_cache()
+"""
+
+from typing import Callable
+
+import shared_path  # noqa: F401 - puts fir_common on sys.path
+from fir_common.metrics import ServiceMetrics, render, timed  # noqa: F401 - render is re-exported
+
+# Groq calls take seconds; the default buckets stop at 10s.
+LATENCY_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 120)
+
+_metrics = ServiceMetrics("fir_generator", LATENCY_BUCKETS)
+
+NODE_LATENCY = _metrics.histogram("node_duration_seconds", "FIR generation graph node latency", ["node"])
+LLM_TOKENS = _metrics.counter("llm_tokens", "Tokens reported by Groq", ["node", "kind"])
+
+instrument = _metrics.instrument
+register_cache = _metrics.register_cache
+observe_request = _metrics.observe_request
+record_error = _metrics.record_error
+
+
+def register_rate_limit_wait(read_seconds: Callable[[], float]) -> None:
+    _metrics.register_counter(
+        "groq_rate_limit_wait_seconds", "Seconds spent waiting on the client-side Groq rate limiter", read_seconds
+    )
+
+
+def timed_node(node: str):
+    """Record the decorated graph node's duration (sync or async) under `node`, inside a node.<name> span."""
+    return timed(NODE_LATENCY, node, span_name=f"node.{node}")
+
+
+def record_usage(node: str, message) -> None:
+    """Count tokens from a LangChain AIMessage's usage_metadata, if the provider sent any."""
+    usage = getattr(message, "usage_metadata", None) or {}
+    if usage.get("input_tokens"):
+        LLM_TOKENS.labels(node, "prompt").inc(usage["input_tokens"])
+    if usage.get("output_tokens"):
+        LLM_TOKENS.labels(node, "completion").inc(usage["output_tokens"])
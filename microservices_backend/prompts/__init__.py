@@ -0,0 +1,48 @@
+"""
+Versioned prompt assets.
+
+Each system prompt lives in its own <name>.v<version>.txt file and is listed
+in manifest.json with its estimated token count (estimate_tokens, not the
+provider's tokenizer) when that version was cut and the budget it must stay
+under (checked in test.py). Prompts are read
+once at import and sent as a static system message first in every call, so
+the prefix is byte-identical across requests and providers that cache
+repeated prompt prefixes can reuse it.
+
+To change a prompt: add a new version file, point the manifest at it and
+record its estimated token count.
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+
+PROMPTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+_TOKEN_RE = re.compile(r"\w+|[^\w\s]")
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Tokenizer-free estimate: one token per word or punctuation mark.
+    Close to Llama-3 BPE counts for English prompts; used for budgets, not billing.
+    """
+    return len(_TOKEN_RE.findall(text))
+
+
+@lru_cache(maxsize=1)
+def manifest() -> dict:
+    with open(os.path.join(PROMPTS_DIR, "manifest.json"), encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+@lru_cache(maxsize=None)
+def load_prompt(name: str) -> str:
+    entry = manifest()[name]
+    with open(os.path.join(PROMPTS_DIR, entry["file"]), encoding="utf-8") as fh:
+        return fh.read().strip()
+
+
+def prompt_version(name: str) -> str:
+    return f"{name}.v{manifest()[name]['version']}"
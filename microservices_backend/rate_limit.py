@@ -0,0 +1,105 @@
+"""
+Client-side Groq rate limiting.
+
+Groq enforces requests-per-minute and tokens-per-minute quotas per key.
+GroqRateLimiter keeps one token bucket for each and makes callers wait for
+capacity before a call is sent, instead of letting bursts (e.g. a batch
+upload) run into 429s. measure_wait() tallies the time the calls made
+inside it spent waiting, e.g. for one FIR of a batch.
+
+Environment:
+    GROQ_REQUESTS_PER_MINUTE  default 30     (0 disables the limit)
+    GROQ_TOKENS_PER_MINUTE    default 12000  (0 disables the limit)
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class WaitTally:
+    def __init__(self):
+        self.seconds = 0.0
+
+
+_wait_tally: contextvars.ContextVar[Optional[WaitTally]] = contextvars.ContextVar("rate_limit_wait", default=None)
+
+
+@contextmanager
+def measure_wait() -> Iterator[WaitTally]:
+    """Tally the rate-limit waits of the calls made inside, including tasks they start."""
+    tally = WaitTally()
+    token = _wait_tally.set(tally)
+    try:
+        yield tally
+    finally:
+        _wait_tally.reset(token)
+
+
+class TokenBucket:
+    """Continuously refilling bucket holding up to `per_minute` units."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Wait until `amount` units are available and take them. Returns seconds waited."""
+        if self.capacity <= 0:
+            return 0.0
+        # A single request larger than the whole bucket still has to go through.
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self._lock:
+            self._refill()
+            while self.tokens < amount:
+                delay = (amount - self.tokens) / self.rate
+                await asyncio.sleep(delay)
+                waited += delay
+                self._refill()
+            self.tokens -= amount
+        return waited
+
+
+class GroqRateLimiter:
+    def __init__(self, requests_per_minute: float, tokens_per_minute: float):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.total_wait_seconds = 0.0
+
+    async def acquire(self, estimated_tokens: int) -> float:
+        """Wait for one request and `estimated_tokens` of quota. Returns seconds waited."""
+        waited = await self.requests.acquire(1)
+        waited += await self.tokens.acquire(estimated_tokens)
+        self.total_wait_seconds += waited
+        tally = _wait_tally.get()
+        if tally is not None:
+            tally.seconds += waited
+        return waited
+
+
+def estimate_tokens(messages, completion_tokens: int = 1024) -> int:
+    """Rough prompt size (≈4 characters per token) plus an allowance for the reply."""
+    chars = sum(len(getattr(m, "content", str(m))) for m in messages)
+    return chars // 4 + completion_tokens
+
+
+groq_limiter = GroqRateLimiter(
+    requests_per_minute=float(os.getenv("GROQ_REQUESTS_PER_MINUTE", "30")),
+    tokens_per_minute=float(os.getenv("GROQ_TOKENS_PER_MINUTE", "12000")),
+)
@@ -0,0 +1,94 @@
+"""
+Durable FIR / General Diary number allocation.
+
+Numbers come from per-station sequences kept in a small SQLite file shared
+by every worker on the host. Each worker reserves a block of numbers in one
+short write transaction (BEGIN IMMEDIATE takes SQLite's write lock, so two
+workers can never reserve the same block) and then hands numbers out of the
+block from memory. Only one request in every FIR_SEQUENCE_BLOCK_SIZE touches
+the database.
+
+Numbers are unique and increasing per worker, but a worker that restarts
+abandons the rest of its block, so the series can have gaps.
+
+Environment:
+    FIR_SEQUENCE_DB          default fir_sequences.db
+    FIR_SEQUENCE_BLOCK_SIZE  default 20
+"""
+
+import os
+import sqlite3
+import threading
+from typing import Dict, List
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+class SequenceAllocator:
+    def __init__(self, db_path: str, block_size: int = 20):
+        self.db_path = db_path
+        self.block_size = max(1, block_size)
+        self._blocks: Dict[str, List[int]] = {}   # name -> [next, end_exclusive]
+        self._lock = threading.Lock()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sequences ("
+                " name TEXT PRIMARY KEY,"
+                " next_value INTEGER NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=30)
+
+    def _reserve_block(self, name: str) -> List[int]:
+        conn = self._connect()
+        try:
+            conn.isolation_level = None
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT next_value FROM sequences WHERE name = ?", (name,)
+            ).fetchone()
+            start = row[0] if row else 1
+            conn.execute(
+                "INSERT INTO sequences (name, next_value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET next_value = excluded.next_value",
+                (name, start + self.block_size),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        finally:
+            conn.close()
+        return [start, start + self.block_size]
+
+    def next_value(self, name: str) -> int:
+        with self._lock:
+            block = self._blocks.get(name)
+            if block is None or block[0] >= block[1]:
+                block = self._reserve_block(name)
+                self._blocks[name] = block
+            value = block[0]
+            block[0] += 1
+            return value
+
+
+allocator = SequenceAllocator(
+    db_path=os.getenv("FIR_SEQUENCE_DB", "fir_sequences.db"),
+    block_size=int(os.getenv("FIR_SEQUENCE_BLOCK_SIZE", "20")),
+)
+
+
+def next_fir_number(station_code: str, year: str) -> str:
+    """e.g. CCPS-VSP/2025/00042 — restarts at 1 each year."""
+    seq = allocator.next_value(f"fir:{station_code}:{year}")
+    return f"{station_code}/{year}/{seq:05d}"
+
+
+def next_gd_entry_number(station_code: str, date: str) -> str:
+    """General Diary entries restart at 1 every day, e.g. CCPS-VSP/GD/15-04-2025/007."""
+    seq = allocator.next_value(f"gd:{station_code}:{date}")
+    return f"{station_code}/GD/{date}/{seq:03d}"
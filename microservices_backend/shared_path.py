@@ -0,0 +1,11 @@
+"""
+Puts the repo root on sys.path so fir_common, the package shared with the
+FIR Analyser, imports when this service runs from microservices_backend/.
+"""
+
+import sys
+from pathlib import Path
+
+REPO_ROOT = str(Path(__file__).resolve().parent.parent)
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
@@ -0,0 +1,117 @@
+"""
+Prompt budget, anonymiser, log redaction and rate-limit checks — run with: python -m pytest test.py
+"""
+
+import asyncio
+import logging
+import re
+
+import pytest
+
+from anonymiser import anonymise, detect_entities
+from logging_config import log_narration
+from prompts import estimate_tokens, load_prompt, manifest
+from rate_limit import GroqRateLimiter, measure_wait
+
+
+@pytest.mark.parametrize("name", sorted(manifest()))
+def test_prompt_within_token_budget(name):
+    entry = manifest()[name]
+    tokens = estimate_tokens(load_prompt(name))
+    assert tokens <= entry["budget_tokens"], (
+        f"{name}.v{entry['version']} is {tokens} tokens, budget is {entry['budget_tokens']}. "
+        f"Trim it, or cut a new version and update prompts/manifest.json."
+    )
+
+
+@pytest.mark.parametrize("name", sorted(manifest()))
+def test_prompt_has_no_duplicate_sections(name):
+    headings = re.findall(r"^([A-Z][A-Z /]+):\s*$", load_prompt(name), flags=re.MULTILINE)
+    assert len(headings) == len(set(headings)), f"{name} repeats a section: {headings}"
+
+
+def test_generation_prompt_renders_narration_last():
+    from FIR_generation_template import FIR_generation_prompt
+
+    messages = FIR_generation_prompt.format_messages(FIR_narration="PERSON_1 lost a phone.")
+    assert messages[0].content == load_prompt("fir_generation_system")
+    assert messages[-1].content.endswith("PERSON_1 lost a phone.")
+
+
+def test_anonymise_keeps_words_that_contain_a_value():
+    text = (
+        "The complainant Rahul Mehta of North Colony reported on 5 November "
+        "that Accused No. 1 Suresh Kumar snatched his phone."
+    )
+    anonymised, mapping = anonymise(text)
+    assert mapping == {"PERSON_1": "Rahul Mehta", "PERSON_2": "Suresh Kumar"}
+    assert anonymised == (
+        "The complainant PERSON_1 of North Colony reported on 5 November "
+        "that Accused No. 1 PERSON_2 snatched his phone."
+    )
+
+
+def test_anonymise_matches_whole_words_only():
+    anonymised, mapping = anonymise("Witness Ravi said Ravindra and Ravi's brother left.")
+    assert mapping == {"PERSON_1": "Ravi"}
+    assert anonymised == "Witness PERSON_1 said Ravindra and PERSON_1's brother left."
+
+
+@pytest.mark.parametrize(
+    "entity_type, text, expected",
+    [
+        ("PHONE", "Call him on 9876543210 today.", ["9876543210"]),
+        ("PHONE", "Mobile: +91 98765 43210.", ["+91 98765 43210"]),
+        ("PHONE", "Landline 098765-43210 only.", ["098765-43210"]),
+        ("PHONE", "Order 19876543210 is not a phone.", []),
+        ("AADHAAR", "Aadhaar 2345 6789 0123 was shown.", ["2345 6789 0123"]),
+        ("AADHAAR", "Aadhaar 1234 5678 9012 is invalid.", []),
+        ("VEHICLE", "A car bearing TS09AB1234 was seen.", ["TS09AB1234"]),
+        ("VEHICLE", "Bike AP 31 BK 4567 fled.", ["AP 31 BK 4567"]),
+        ("EMAIL", "Mail rahul.mehta+fir@example.co.in now.", ["rahul.mehta+fir@example.co.in"]),
+    ],
+)
+def test_detect_entities_regexes(entity_type, text, expected):
+    assert detect_entities(text).get(entity_type, []) == expected
+
+
+def test_anonymise_round_trips_through_mapping():
+    text = "Accused Suresh Kumar (9876543210, suresh@example.com) drove TS09AB1234."
+    anonymised, mapping = anonymise(text)
+    for value in ("Suresh Kumar", "9876543210", "suresh@example.com", "TS09AB1234"):
+        assert value not in anonymised
+    for placeholder, value in mapping.items():
+        anonymised = anonymised.replace(placeholder, value)
+    assert anonymised == text
+
+
+def test_logged_narration_has_no_names_or_phones(caplog):
+    text = "The complainant Rahul Mehta (9876543210) reported that his phone was stolen."
+    logger = logging.getLogger("test.narration")
+    with caplog.at_level(logging.DEBUG, logger=logger.name):
+        log_narration(logger, text)
+    [record] = caplog.records
+    logged = caplog.text + str(vars(record))
+    for value in ("Rahul", "Mehta", "9876543210"):
+        assert value not in logged
+    assert "PERSON_1" in record.narration
+
+
+def test_measure_wait_counts_only_its_own_calls():
+    # Bucket of one request refilling every 0.1s, shared with other traffic.
+    limiter = GroqRateLimiter(requests_per_minute=600, tokens_per_minute=0)
+    limiter.requests.capacity = limiter.requests.tokens = 1
+
+    async def drafted(calls: int) -> tuple[float, float]:
+        with measure_wait() as waited:
+            # Calls made from tasks started inside the block count too.
+            own = await asyncio.gather(*(limiter.acquire(0) for _ in range(calls)))
+        return waited.seconds, sum(own)
+
+    async def run():
+        return await asyncio.gather(drafted(2), drafted(1), *(limiter.acquire(0) for _ in range(2)))
+
+    (first, first_own), (second, second_own), *other = asyncio.run(run())
+    assert first == pytest.approx(first_own) and second == pytest.approx(second_own)
+    assert limiter.total_wait_seconds == pytest.approx(first + second + sum(other))
+    assert sum(other) > 0
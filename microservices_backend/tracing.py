@@ -0,0 +1,44 @@
+"""
+Tracing for the FIR generator: fir_common.tracing configured from the
+environment.
+
+Environment:
+    TRACING_EXPORTER       none (default) | console | file | otlp
+    TRACING_FILE           default traces.jsonl   (file exporter, one JSON span per line)
+    TRACING_OTLP_ENDPOINT  default http://localhost:4318/v1/traces
+    TRACING_SAMPLE_RATIO   default 1.0
+"""
+
+import os
+
+from dotenv import load_dotenv
+
+import shared_path  # noqa: F401 - puts fir_common on sys.path
+from fir_common import tracing as _tracing
+from fir_common.tracing import (  # noqa: F401 - re-exported for the service's modules
+    current_traceparent,
+    inject_headers,
+    server_span,
+    shutdown_tracing,
+    span,
+    trace_requests,
+    traced,
+)
+
+load_dotenv()
+
+TRACING_EXPORTER = os.getenv("TRACING_EXPORTER", "none").lower()
+TRACING_FILE = os.getenv("TRACING_FILE", "traces.jsonl")
+TRACING_OTLP_ENDPOINT = os.getenv("TRACING_OTLP_ENDPOINT", "http://localhost:4318/v1/traces")
+TRACING_SAMPLE_RATIO = float(os.getenv("TRACING_SAMPLE_RATIO", "1.0"))
+
+
+def setup_tracing(service_name: str, tracer_name: str) -> None:
+    _tracing.setup_tracing(
+        service_name,
+        tracer_name,
+        exporter=TRACING_EXPORTER,
+        file=TRACING_FILE,
+        otlp_endpoint=TRACING_OTLP_ENDPOINT,
+        sample_ratio=TRACING_SAMPLE_RATIO,
+    )
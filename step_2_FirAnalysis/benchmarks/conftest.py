@@ -0,0 +1,60 @@
+"""
+Offline benchmark suite (pytest-benchmark).
+
+Run from step_2_FirAnalysis/:
+    pytest benchmarks                                  # run, save results to benchmarks/.results
+    pytest benchmarks --benchmark-compare              # compare against the previous saved run
+    pytest benchmarks --benchmark-compare --benchmark-compare-fail=mean:15%
+
+Nothing leaves the machine: before `core` is imported the LLM clients are
+pointed at benchmarks/mock_llm_server.py, started once per session on a
+free port. BENCH_MOCK_LATENCY_MS (default 0) adds emulated provider latency
+to the pipeline benchmark.
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR.parent))
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.append(str(BENCH_DIR.parents[1]))  # repo root, for fir_common
+
+from fir_common.benchmarks import keep_results  # noqa: E402
+from mock_llm_server import MockLLMServer, Profile, free_port  # noqa: E402
+
+MOCK_PORT = free_port()
+MOCK_URL = f"http://127.0.0.1:{MOCK_PORT}"
+
+os.environ.update({
+    "OLLAMA_BASE_URL": MOCK_URL,
+    "OLLAMA_BACKENDS": "",
+    "OLLAMA_HEALTH_INTERVAL_SECONDS": "0",
+    "OLLAMA_HEDGE_ENABLED": "false",
+    "GEMINI_API_KEY": "mock",
+    "GEMINI_API_ENDPOINT": MOCK_URL,
+    "TRACING_EXPORTER": "none",
+})
+
+
+def pytest_configure(config):
+    keep_results(config, BENCH_DIR / ".results")
+
+
+@pytest.fixture(scope="session")
+def mock_llm():
+    latency = float(os.getenv("BENCH_MOCK_LATENCY_MS", "0"))
+    with MockLLMServer(Profile(latency_ms=latency, jitter_ms=latency / 10, seed=7), port=MOCK_PORT) as url:
+        yield url
+
+
+@pytest.fixture(scope="session")
+def event_loop_runner():
+    """One event loop for the whole session, so pooled HTTP clients are reused across rounds."""
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
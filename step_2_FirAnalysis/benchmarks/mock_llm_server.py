@@ -0,0 +1,394 @@
+"""
+Local stand-in for every LLM provider the two services call, for offline
+benchmarks and load tests.
+
+Emulated endpoints:
+    POST /v1/chat/completions                          OpenAI-compatible (Ollama, LM Studio, vLLM)
+    POST /openai/v1/chat/completions                   Groq — tool_calls or response_format JSON
+    POST /v1beta/models/{model}:generateContent        Gemini
+    POST /v1beta/models/{model}:streamGenerateContent  Gemini, SSE when ?alt=sse
+    GET  /stats                                        request / injected-error counters
+    POST /config                                       change the profile at runtime
+
+Responses are canned but shaped by the request:
+  - extraction echoes the FIR text back as incident_description, so PII
+    masking downstream has real work to do;
+  - Gemini returns the legal-analysis JSON when JSON output was requested
+    and a plain chat answer otherwise;
+  - Groq answers whichever tool / schema it was asked for
+    (NarrationEncrypted, LLMFIRExtraction).
+
+Every call is delayed by max(0, normal(latency_ms, jitter_ms)); with
+probability tail_rate an extra tail_ms is added (the stuck-call tail), and
+with probability error_rate the call fails with error_status.
+
+Run standalone:
+    python benchmarks/mock_llm_server.py --port 8900 --latency-ms 800 --jitter-ms 200 --error-rate 0.02
+
+then point the services at it:
+    OLLAMA_BASE_URL=http://127.0.0.1:8900
+    GEMINI_API_ENDPOINT=http://127.0.0.1:8900   GEMINI_API_KEY=mock
+    GROQ_BASE_URL=http://127.0.0.1:8900         GROQ_API_KEY=mock
+
+In tests, `with MockLLMServer(profile) as url:` runs it on a free port in a
+background thread.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import socket
+import threading
+import time
+from collections import Counter
+from dataclasses import asdict, dataclass
+from typing import Optional
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+
+
+@dataclass
+class Profile:
+    latency_ms: float = 50.0
+    jitter_ms: float = 10.0
+    tail_rate: float = 0.0
+    tail_ms: float = 2000.0
+    error_rate: float = 0.0
+    error_status: int = 503
+    seed: Optional[int] = None
+
+
+# ── Canned payloads ─────────────────────────────────────────────────────
+
+CANNED_ENTITIES = {
+    "person": ["Rahul Mehta"],
+    "accused": ["Suresh Kumar"],
+    "witness": ["Anita Rao"],
+    "location": ["Secunderabad"],
+    "phone": ["9876543210"],
+    "aadhaar": [],
+    "address": ["12-4 Gandhi Nagar, Secunderabad"],
+    "vehicle": ["TS09AB1234"],
+}
+
+CANNED_EXTRACTION = {
+    "fir_number": "CCPS-VSP/2025/00042",
+    "police_station": "Cyber Crime Police Station",
+    "district": "Visakhapatnam",
+    "date_of_filing": "2025-04-16",
+    "date_of_incident": "2025-04-15",
+    "time_of_incident": "10:30",
+    "victim_name": "Rahul Mehta",
+    "victim_age": "32",
+    "victim_gender": "Male",
+    "victim_address": "12-4 Gandhi Nagar, Secunderabad",
+    "victim_contact": "9876543210",
+    "accused_names": ["Suresh Kumar"],
+    "witness_names": ["Anita Rao"],
+    "incident_location": "Secunderabad",
+    "incident_description": "",
+    "ipc_sections": ["Section 420 IPC", "u/s 406"],
+    "other_acts": ["IT Act 66D"],
+    "case_nature": None,
+    "entities_for_masking": CANNED_ENTITIES,
+}
+
+CANNED_LEGAL_ANALYSIS = {
+    "estimated_duration_months": {
+        "district_court_min": 18,
+        "district_court_typical": 36,
+        "district_court_max": 60,
+        "including_appeals_typical": 72,
+        "notes": "Cyber fraud trials depend heavily on bank and telecom records.",
+    },
+    "cost_estimate_inr": {
+        "advocate_fees_min": 50000,
+        "advocate_fees_max": 300000,
+        "court_fees_approx": 5000,
+        "miscellaneous_min": 10000,
+        "miscellaneous_max": 40000,
+        "total_min": 65000,
+        "total_max": 345000,
+        "notes": "Ranges assume a district-court trial in a metro city.",
+    },
+    "win_probability_percent": 62,
+    "win_probability_reasoning": (
+        "The money trail is documented. The accused used a bank-officer pretext. "
+        "Call records link the accused to the complainant. Recovery is uncertain."
+    ),
+    "key_strengths": ["Bank transaction trail", "Call detail records"],
+    "key_weaknesses": ["Accused identity not yet verified"],
+    "recommended_action": "Proceed to Trial",
+    "recommended_action_reasoning": "The documentary evidence is strong enough to sustain the charges.",
+    "similar_past_cases": [],
+    "required_documents": ["Bank statement", "Call records"],
+    "optional_but_helpful_documents": ["Screenshots of messages"],
+    "immediate_next_steps": [
+        "Inform the bank",
+        "Report on the cybercrime portal",
+        "Preserve messages",
+        "Follow up with the IO",
+    ],
+    "important_caveats": ["This is not legal advice."],
+}
+
+CANNED_FIR_EXTRACTION = {
+    "acts_and_sections": [{"act_name": "Indian Penal Code", "sections": ["420", "406"]}],
+    "accused_list": [{"name": "PERSON_2", "known_status": "unknown", "address": None, "description": None}],
+    "complainant_name": "PERSON_1",
+    "complainant_address": "LOCATION_1",
+    "fir_contents": "PERSON_1 was cheated of Rs 1,30,000 by a caller posing as a bank officer.",
+    "property_details": [{"description": "Cash transferred online", "quantity": 1, "value": "Rs 1,30,000", "identification_marks": None}],
+    "total_property_value": "Rs 1,30,000",
+    "delay_in_reporting_reason": None,
+    "action_taken_description": "Registered and taken up for investigation",
+    "date_of_occurrence": "15-04-2025",
+    "time_of_occurrence": "10:30",
+    "place_of_occurrence": "LOCATION_1",
+}
+
+RAG_ANSWER = (
+    "Section 420 IPC deals with cheating and dishonestly inducing delivery of property. "
+    "Based on the document, the complainant should preserve all transaction records."
+)
+
+
+def _tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _messages_text(messages: list[dict]) -> str:
+    return "\n".join(str(m.get("content") or "") for m in messages)
+
+
+def _user_text(messages: list[dict]) -> str:
+    users = [str(m.get("content") or "") for m in messages if m.get("role") == "user"]
+    return users[-1] if users else ""
+
+
+def _extraction_for(prompt: str) -> dict:
+    data = json.loads(json.dumps(CANNED_EXTRACTION))
+    _, _, fir_text = prompt.partition("FIR TEXT:")
+    data["incident_description"] = fir_text.strip() or "Complainant reported online fraud."
+    return data
+
+
+def _groq_payload(name: str, user_text: str) -> dict:
+    if name == "NarrationEncrypted":
+        return {"encrypted_narration": user_text, "mapping": {}}
+    return CANNED_FIR_EXTRACTION
+
+
+# ── App ────────────────────────────────────────────────────────────────
+
+def create_app(profile: Profile) -> FastAPI:
+    app = FastAPI(title="Mock LLM server")
+    app.state.profile = profile
+    app.state.rng = random.Random(profile.seed)
+    app.state.stats = Counter()
+
+    async def behave(route: str) -> Optional[JSONResponse]:
+        """Sleep for the sampled latency; return an error response if one was drawn."""
+        prof: Profile = app.state.profile
+        rng: random.Random = app.state.rng
+        app.state.stats[f"requests:{route}"] += 1
+        delay = max(0.0, rng.gauss(prof.latency_ms, prof.jitter_ms))
+        if prof.tail_rate and rng.random() < prof.tail_rate:
+            delay += prof.tail_ms
+            app.state.stats["tail_injected"] += 1
+        await asyncio.sleep(delay / 1000.0)
+        if prof.error_rate and rng.random() < prof.error_rate:
+            app.state.stats["errors_injected"] += 1
+            return JSONResponse(
+                {"error": {"message": "mock overloaded", "code": prof.error_status}},
+                status_code=prof.error_status,
+            )
+        return None
+
+    def chat_completion(content: Optional[str], prompt_text: str, tool_calls: Optional[list] = None) -> dict:
+        message = {"role": "assistant", "content": content}
+        if tool_calls:
+            message["tool_calls"] = tool_calls
+        completion = content or json.dumps(tool_calls)
+        return {
+            "id": f"mock-{time.time_ns()}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": "mock",
+            "choices": [{
+                "index": 0,
+                "message": message,
+                "finish_reason": "tool_calls" if tool_calls else "stop",
+            }],
+            "usage": {
+                "prompt_tokens": _tokens(prompt_text),
+                "completion_tokens": _tokens(completion),
+                "total_tokens": _tokens(prompt_text) + _tokens(completion),
+            },
+        }
+
+    @app.post("/v1/chat/completions")
+    async def openai_chat(request: Request):
+        body = await request.json()
+        if (error := await behave("openai")) is not None:
+            return error
+        messages = body.get("messages", [])
+        prompt_text = _messages_text(messages)
+        if "PONG" in prompt_text:
+            return chat_completion("PONG", prompt_text)
+        return chat_completion(json.dumps(_extraction_for(_user_text(messages))), prompt_text)
+
+    @app.post("/openai/v1/chat/completions")
+    async def groq_chat(request: Request):
+        body = await request.json()
+        if (error := await behave("groq")) is not None:
+            return error
+        messages = body.get("messages", [])
+        prompt_text = _messages_text(messages)
+        user_text = _user_text(messages)
+
+        tools = body.get("tools") or []
+        if tools:
+            name = tools[0]["function"]["name"]
+            call = {
+                "id": f"call_{time.time_ns()}",
+                "type": "function",
+                "function": {"name": name, "arguments": json.dumps(_groq_payload(name, user_text))},
+            }
+            return chat_completion(None, prompt_text, tool_calls=[call])
+
+        schema = (body.get("response_format") or {}).get("json_schema") or {}
+        name = schema.get("name", "LLMFIRExtraction")
+        return chat_completion(json.dumps(_groq_payload(name, user_text)), prompt_text)
+
+    def gemini_response(text: str, prompt_text: str, finished: bool = True) -> dict:
+        candidate = {"content": {"parts": [{"text": text}], "role": "model"}, "index": 0}
+        if finished:
+            candidate["finishReason"] = "STOP"
+        return {
+            "candidates": [candidate],
+            "usageMetadata": {
+                "promptTokenCount": _tokens(prompt_text),
+                "candidatesTokenCount": _tokens(text),
+                "totalTokenCount": _tokens(prompt_text) + _tokens(text),
+            },
+        }
+
+    def gemini_answer(body: dict) -> tuple[str, str]:
+        prompt_text = "\n".join(
+            part.get("text", "")
+            for content in body.get("contents", [])
+            for part in content.get("parts", [])
+        )
+        config = body.get("generationConfig") or body.get("generation_config") or {}
+        mime = config.get("responseMimeType") or config.get("response_mime_type")
+        if mime == "application/json" or "legal analyst" in prompt_text:
+            return json.dumps(CANNED_LEGAL_ANALYSIS), prompt_text
+        return RAG_ANSWER, prompt_text
+
+    @app.post("/v1beta/models/{model_method:path}")
+    async def gemini(model_method: str, request: Request):
+        body = await request.json()
+        streaming = model_method.endswith(":streamGenerateContent")
+        if (error := await behave("gemini_stream" if streaming else "gemini")) is not None:
+            return error
+        text, prompt_text = gemini_answer(body)
+        if not streaming:
+            return gemini_response(text, prompt_text)
+
+        words = text.split(" ")
+        pieces = [" ".join(words[i:i + 8]) + (" " if i + 8 < len(words) else "") for i in range(0, len(words), 8)]
+
+        async def events():
+            for i, piece in enumerate(pieces):
+                await asyncio.sleep(0.005)
+                chunk = gemini_response(piece, prompt_text, finished=i == len(pieces) - 1)
+                if request.query_params.get("alt") == "sse":
+                    yield f"data: {json.dumps(chunk)}\r\n\r\n"
+                else:
+                    yield json.dumps(chunk)
+
+        media_type = "text/event-stream" if request.query_params.get("alt") == "sse" else "application/json"
+        return StreamingResponse(events(), media_type=media_type)
+
+    @app.get("/stats")
+    async def stats():
+        return {"profile": asdict(app.state.profile), "counters": dict(app.state.stats)}
+
+    @app.post("/config")
+    async def configure(request: Request):
+        updates = await request.json()
+        app.state.profile = Profile(**{**asdict(app.state.profile), **updates})
+        app.state.rng = random.Random(app.state.profile.seed)
+        return asdict(app.state.profile)
+
+    return app
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+class MockLLMServer:
+    """Run the mock in a background thread: `with MockLLMServer(profile, port) as url: ...`."""
+
+    def __init__(self, profile: Optional[Profile] = None, port: Optional[int] = None):
+        self.port = port or free_port()
+        self.url = f"http://127.0.0.1:{self.port}"
+        config = uvicorn.Config(
+            create_app(profile or Profile()),
+            host="127.0.0.1",
+            port=self.port,
+            log_level="warning",
+            lifespan="off",
+        )
+        self._server = uvicorn.Server(config)
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def __enter__(self) -> str:
+        self._thread.start()
+        deadline = time.monotonic() + 10
+        while not self._server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("mock LLM server did not start")
+            time.sleep(0.01)
+        return self.url
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=5)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in for Ollama / Groq / Gemini.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    defaults = Profile()
+    parser.add_argument("--latency-ms", type=float, default=defaults.latency_ms)
+    parser.add_argument("--jitter-ms", type=float, default=defaults.jitter_ms)
+    parser.add_argument("--tail-rate", type=float, default=defaults.tail_rate)
+    parser.add_argument("--tail-ms", type=float, default=defaults.tail_ms)
+    parser.add_argument("--error-rate", type=float, default=defaults.error_rate)
+    parser.add_argument("--error-status", type=int, default=defaults.error_status)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    profile = Profile(
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        tail_rate=args.tail_rate,
+        tail_ms=args.tail_ms,
+        error_rate=args.error_rate,
+        error_status=args.error_status,
+        seed=args.seed,
+    )
+    uvicorn.run(create_app(profile), host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
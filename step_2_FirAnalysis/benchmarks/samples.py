@@ -0,0 +1,108 @@
+"""
+Synthetic inputs shared by the benchmarks (and the load-test corpus): a
+realistic FIR narrative and a dependency-free builder for digital
+(text-layer) PDFs.
+"""
+
+SAMPLE_FIR_TEXT = """FIRST INFORMATION REPORT (Under Section 154 Cr.P.C.)
+District: Visakhapatnam    P.S.: Cyber Crime Police Station    Year: 2025
+
+On 15th April 2025 at about 10:30 hrs, the complainant Rahul Mehta, aged 32 years,
+S/o Late Ramesh Mehta, resident of 12-4 Gandhi Nagar, Secunderabad, mobile 9876543210,
+received multiple phone calls and WhatsApp messages from an unknown person who claimed
+to be a bank officer. The caller, later identified as Suresh Kumar, obtained the debit
+card details and OTP of the complainant and transferred Rs 1,30,000/- online in four
+transactions. The accused threatened to register false cases if the matter was reported.
+The complainant's neighbour Anita Rao witnessed the calls. The accused was seen leaving
+in a car bearing registration TS09AB1234 near the Secunderabad railway station.
+
+The complainant requests action under Section 420 IPC, u/s 406 IPC and Section 66D of
+the IT Act. Delay in reporting: the complainant first approached the bank on 15-04-2025.
+"""
+
+
+def long_fir_text(repeat: int = 4) -> str:
+    """A longer narrative — the sample repeated — for size-sensitive benchmarks."""
+    return "\n".join([SAMPLE_FIR_TEXT] * repeat)
+
+
+def if1_form_text(narrative_repeat: int = 3) -> str:
+    """The sample as a generated IF1 form, with pdf_extractor's page markers."""
+    narrative = " ".join(" ".join(SAMPLE_FIR_TEXT.split()[30:]) for _ in range(narrative_repeat))
+    return "\n".join([
+        "--- Page 1 ---",
+        "FIRST INFORMATION REPORT (Under Section 154 Cr.P.C.)",
+        "1. Dist: Visakhapatnam P.S.: Cyber Crime Police Station Year: 2025 F.I.R. No.: CCPS-VSP/2025/0012 Date: 16-04-2025",
+        "2. Acts & Sections:",
+        "Indian Penal Code: 420, 406",
+        "Information Technology Act: 66D",
+        "3. Occurrence of Offence: Tuesday 15-04-2025 10:30",
+        "Info received: 16-04-2025 11:00",
+        "G.D.: GD-0042 / 11:05",
+        "4. Type of Information: Written",
+        "5. Place of Occurrence: Gandhi Nagar, Secunderabad (2 KM North)",
+        "6. Complainant / Informant:",
+        "Name: Rahul Mehta",
+        "Father/Husband: Ramesh Mehta",
+        "Address: 12-4 Gandhi Nagar, Secunderabad",
+        "7. Details of Known/Suspected/Unknown Accused:",
+        "1. Suresh Kumar (known) - claimed to be a bank officer, Secunderabad",
+        "--- Page 2 ---",
+        "8. Reasons for Delay in Reporting: Complainant first approached the bank on 15-04-2025.",
+        "9. Particulars of Properties Stolen/Involved:",
+        "1. Cash transferred online in four transactions - Rs 1,30,000",
+        "10. Total Value: Rs 1,30,000",
+        "11. Inquest Report / U.D. Case No.: ",
+        "12. FIR Contents:",
+        narrative,
+        "--- Page 3 ---",
+        "13. Action Taken: Registered and investigation taken up.",
+        "14. Signature / Thumb-impression of Complainant",
+        "15. Date & Time of Despatch to the Court: ____________________________",
+    ])
+
+
+def _escape(line: str) -> str:
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_text_pdf(pages: list[list[str]]) -> bytes:
+    """
+    Build a minimal digital PDF (Helvetica text layer, one line per string).
+    Text must be latin-1 encodable.
+    """
+    objects: dict[int, str] = {
+        1: "<< /Type /Catalog /Pages 2 0 R >>",
+        3: "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    next_id = 4
+    for lines in pages:
+        page_id, content_id = next_id, next_id + 1
+        next_id += 2
+        shown = " ".join(f"({_escape(line)}) '" for line in lines)
+        stream = f"BT /F1 10 Tf 14 TL 40 810 Td {shown} ET"
+        objects[content_id] = f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream"
+        objects[page_id] = (
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        )
+        kids.append(page_id)
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(f'{k} 0 R' for k in kids)}] /Count {len(kids)} >>"
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in range(1, next_id):
+        offsets[obj_id] = len(out)
+        out += f"{obj_id} 0 obj\n{objects[obj_id]}\nendobj\n".encode("latin-1")
+    xref_at = len(out)
+    out += f"xref\n0 {next_id}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offsets[i]:010d} 00000 n \n" for i in range(1, next_id)).encode()
+    out += f"trailer\n<< /Size {next_id} /Root 1 0 R >>\nstartxref\n{xref_at}\n%%EOF\n".encode()
+    return bytes(out)
+
+
+def fir_pdf(pages: int = 3) -> bytes:
+    """The sample narrative laid out over `pages` pages."""
+    lines = [line for line in SAMPLE_FIR_TEXT.splitlines() if line.strip()]
+    return make_text_pdf([lines for _ in range(pages)])
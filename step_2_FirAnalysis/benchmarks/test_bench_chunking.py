@@ -0,0 +1,55 @@
+"""
+FIR-layout-aware chunking vs the generic recursive splitter on an IF1 form:
+chunk count and indexed characters (extra_info), plus splitting speed.
+"""
+
+import pytest
+
+from rag_chat.chunking import split_fir_text
+
+from samples import if1_form_text
+
+pytest.importorskip("langchain_text_splitters")
+from langchain_text_splitters import RecursiveCharacterTextSplitter  # noqa: E402
+
+TEXT = if1_form_text(narrative_repeat=6)
+
+
+def _record(benchmark, docs):
+    benchmark.extra_info.update({
+        "chunks": len(docs),
+        "indexed_chars": sum(len(doc.page_content) for doc in docs),
+        "source_chars": len(TEXT),
+    })
+
+
+def test_recursive_splitter(benchmark):
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+    docs = benchmark(splitter.create_documents, [TEXT])
+    _record(benchmark, docs)
+
+
+def test_fir_splitter(benchmark):
+    docs = benchmark(split_fir_text, TEXT, 1000)
+    _record(benchmark, docs)
+
+    recursive = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100).create_documents([TEXT])
+    assert len(docs) < len(recursive)
+    assert sum(len(d.page_content) for d in docs) < sum(len(d.page_content) for d in recursive)
+    assert "--- Page" not in "".join(d.page_content for d in docs)
+    sections = {name for doc in docs for name in doc.metadata["sections"]}
+    assert {"acts_sections", "complainant", "accused", "property", "narrative"} <= sections
+    assert "despatch" not in sections
+
+
+def test_numbered_narrative_is_not_a_form():
+    text = (
+        "--- Page 1 ---\n"
+        "The complainant was walking home from the market when:\n"
+        "1. A man on a bike snatched her chain near the bus stop.\n"
+        "2. Sections of the crowd chased the thief.\n"
+        "3. He escaped towards the railway station."
+    )
+    docs = split_fir_text(text, 1000)
+    assert [doc.metadata for doc in docs] == [{"sections": ["narrative"], "page_start": 1, "page_end": 1}]
+    assert "--- Page" not in docs[0].page_content
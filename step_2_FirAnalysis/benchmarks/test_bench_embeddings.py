@@ -0,0 +1,65 @@
+"""
+Torch vs ONNX int8 embeddings: cosine parity on FIR text, plus ingest
+throughput for both backends. Skipped unless sentence-transformers and
+onnxruntime are installed and the ONNX model has been exported
+(python -m rag_chat.export_onnx).
+"""
+
+import os
+
+import numpy as np
+import pytest
+
+from samples import long_fir_text
+
+pytest.importorskip("onnxruntime")
+pytest.importorskip("tokenizers")
+pytest.importorskip("langchain_huggingface")
+pytest.importorskip("langchain_text_splitters")
+
+from rag_chat.config import RAG_ONNX_MODEL_DIR  # noqa: E402
+from rag_chat.embeddings import load_embeddings  # noqa: E402
+
+if not os.path.exists(os.path.join(RAG_ONNX_MODEL_DIR, "model.onnx")):
+    pytest.skip(f"no exported model in {RAG_ONNX_MODEL_DIR}", allow_module_level=True)
+
+MIN_COSINE = float(os.getenv("EMBEDDING_PARITY_MIN_COSINE", "0.98"))
+
+
+@pytest.fixture(scope="module")
+def chunks():
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+
+    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
+    return splitter.split_text(long_fir_text(repeat=12)) + [
+        "Who is the accused?", "Which IPC sections apply?", "What was stolen and when?",
+    ]
+
+
+@pytest.fixture(scope="module")
+def torch_backend():
+    return load_embeddings("torch")
+
+
+@pytest.fixture(scope="module")
+def onnx_backend():
+    return load_embeddings("onnx")
+
+
+def test_cosine_parity(chunks, torch_backend, onnx_backend):
+    baseline = np.array(torch_backend.embed_documents(chunks))
+    quantised = np.array(onnx_backend.embed_documents(chunks))
+    cosine = (baseline * quantised).sum(axis=1) / (
+        np.linalg.norm(baseline, axis=1) * np.linalg.norm(quantised, axis=1)
+    )
+    assert cosine.min() >= MIN_COSINE, f"min cosine {cosine.min():.4f} (mean {cosine.mean():.4f})"
+    # Neighbour order must survive quantisation for retrieval to be unchanged.
+    query = len(chunks) - 3
+    assert np.argsort(-baseline[:query] @ baseline[query])[0] == np.argsort(-quantised[:query] @ quantised[query])[0]
+
+
+@pytest.mark.parametrize("backend", ["torch", "onnx"])
+def test_embed_documents(benchmark, chunks, backend, request):
+    embeddings = request.getfixturevalue(f"{backend}_backend")
+    vectors = benchmark(embeddings.embed_documents, chunks)
+    assert len(vectors) == len(chunks)
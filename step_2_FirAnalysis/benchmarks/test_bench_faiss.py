@@ -0,0 +1,63 @@
+"""
+Recall vs latency vs memory for the RAG_FAISS_INDEX kinds on a synthetic,
+clustered set of unit vectors shaped like MiniLM embeddings. Recall@k is
+measured against exact (flat) search; build time, recall and index size
+land in each benchmark's extra_info (see --benchmark-json).
+
+BENCH_FAISS_VECTORS (default 20000) sets the store size.
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+
+faiss = pytest.importorskip("faiss")
+
+from rag_chat.faiss_index import INDEX_KINDS, build_index  # noqa: E402
+
+DIM = 384
+K = 10
+VECTORS = int(os.getenv("BENCH_FAISS_VECTORS", "20000"))
+QUERIES = 200
+MIN_RECALL = {"flat": 1.0, "hnsw": 0.95, "ivfpq": 0.7}
+
+
+def _unit(x: np.ndarray) -> np.ndarray:
+    return (x / np.linalg.norm(x, axis=1, keepdims=True)).astype(np.float32)
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    # Sentence embeddings occupy a low-dimensional part of the space: draw
+    # clustered points in a 32-d latent space and project them up.
+    rng = np.random.default_rng(0)
+    projection = rng.standard_normal((32, DIM))
+    centres = rng.standard_normal((VECTORS // 50, 32))
+    latent = centres[rng.integers(0, len(centres), VECTORS)] + 0.5 * rng.standard_normal((VECTORS, 32))
+    data = _unit(latent @ projection + 0.5 * rng.standard_normal((VECTORS, DIM)))
+    query_latent = latent[rng.integers(0, VECTORS, QUERIES)] + 0.2 * rng.standard_normal((QUERIES, 32))
+    queries = _unit(query_latent @ projection)
+    exact = faiss.IndexFlatL2(DIM)
+    exact.add(data)
+    _, truth = exact.search(queries, K)
+    return data, queries, truth
+
+
+@pytest.mark.parametrize("kind", INDEX_KINDS)
+def test_search(benchmark, corpus, kind):
+    data, queries, truth = corpus
+    started = time.perf_counter()
+    index = build_index(data, kind)
+    build_seconds = time.perf_counter() - started
+
+    _, found = benchmark(index.search, queries, K)
+    recall = np.mean([len(set(f) & set(t)) / K for f, t in zip(found, truth)])
+    benchmark.extra_info.update({
+        "recall_at_k": round(float(recall), 4),
+        "build_seconds": round(build_seconds, 2),
+        "index_bytes": int(faiss.serialize_index(index).nbytes),
+        "vectors": VECTORS,
+    })
+    assert recall >= MIN_RECALL[kind]
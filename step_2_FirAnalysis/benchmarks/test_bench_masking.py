@@ -0,0 +1,29 @@
+from core.security import PIIMasker
+from fir_analysis import utils
+
+from mock_llm_server import CANNED_ENTITIES
+from samples import SAMPLE_FIR_TEXT, long_fir_text
+
+RAW_SECTIONS = [
+    "Section 420 IPC", "u/s 406", "IPC 34", "sec. 120-B", "498A IPC", "302", "Sections 323, 324 & 506",
+    "S.379 of IPC", "u/s 66D IT Act", "Section 354-A", "509 IPC", "Sec 34 r/w 149",
+] * 4
+
+
+def _mask(text: str) -> str:
+    return PIIMasker().mask(text, CANNED_ENTITIES)
+
+
+def test_pii_masker_single_fir(benchmark):
+    masked = benchmark(_mask, SAMPLE_FIR_TEXT)
+    assert "Rahul Mehta" not in masked
+
+
+def test_pii_masker_long_fir(benchmark):
+    masked = benchmark(_mask, long_fir_text(repeat=20))
+    assert "9876543210" not in masked
+
+
+def test_normalise_sections(benchmark):
+    sections = benchmark(utils.normalise_sections, RAW_SECTIONS)
+    assert "IPC 420" in sections and "IPC 120B" in sections
@@ -0,0 +1,41 @@
+import io
+import shutil
+
+import pytest
+
+from fir_analysis.pdf_extractor import extract_text_from_pdf
+
+from samples import SAMPLE_FIR_TEXT, fir_pdf
+
+
+def test_extract_digital_pdf(benchmark):
+    pytest.importorskip("pdfplumber")
+    pdf = fir_pdf(pages=3)
+    text, method = benchmark(extract_text_from_pdf, pdf)
+    assert method == "digital"
+    assert "Rahul Mehta" in text
+
+
+def _raster_pdf(pages: int) -> bytes:
+    from PIL import Image, ImageDraw
+
+    images = []
+    for _ in range(pages):
+        image = Image.new("L", (1240, 1754), color=255)
+        draw = ImageDraw.Draw(image)
+        for i, line in enumerate(SAMPLE_FIR_TEXT.splitlines()):
+            draw.text((60, 60 + i * 28), line, fill=0)
+        images.append(image)
+    buffer = io.BytesIO()
+    images[0].save(buffer, format="PDF", save_all=True, append_images=images[1:], resolution=150)
+    return buffer.getvalue()
+
+
+def test_extract_scanned_pdf_ocr(benchmark):
+    pytest.importorskip("pytesseract")
+    pytest.importorskip("pdf2image")
+    if not shutil.which("tesseract") or not shutil.which("pdftoppm"):
+        pytest.skip("tesseract / poppler binaries not installed")
+    pdf = _raster_pdf(pages=1)
+    text, method = benchmark.pedantic(extract_text_from_pdf, args=(pdf,), rounds=3, iterations=1)
+    assert method == "ocr"
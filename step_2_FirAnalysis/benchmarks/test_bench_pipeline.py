@@ -0,0 +1,17 @@
+from core.llm import gemini_client, ollama_client
+from fir_analysis.service import FIRAnalysisService
+
+from samples import SAMPLE_FIR_TEXT, long_fir_text
+
+
+def test_analyse_pipeline(benchmark, mock_llm, event_loop_runner):
+    service = FIRAnalysisService(ollama_client, gemini_client)
+    response = benchmark(lambda: event_loop_runner(service.analyse(SAMPLE_FIR_TEXT)))
+    assert "Rahul Mehta" not in response.masked_payload.masked_description
+    assert response.legal_analysis.recommended_action == "Proceed to Trial"
+
+
+def test_mask_preview_long_fir(benchmark, mock_llm, event_loop_runner):
+    service = FIRAnalysisService(ollama_client, gemini_client)
+    preview = benchmark(lambda: event_loop_runner(service.mask_preview(long_fir_text(repeat=10))))
+    assert preview.masking_table
@@ -0,0 +1,79 @@
+"""
+Import-time budget: importing an app module must not load the heavy SDKs
+and models, which are built lazily on first use or in the lifespan warm-up,
+and must stay within IMPORT_BUDGET_RATIO (default 4) times a bare
+`import fastapi` measured in the same run, so a slow or busy machine moves
+the budget with it.
+
+A module is only checked when all of its lazy dependencies are installed;
+otherwise "not loaded" would hold trivially and the test is skipped.
+"""
+
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+APP_DIR = Path(__file__).resolve().parent.parent
+BUDGET_RATIO = float(os.getenv("IMPORT_BUDGET_RATIO", "4"))
+RUNS = 3
+
+PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import {module}
+elapsed = time.perf_counter() - started
+print(json.dumps({{"seconds": elapsed, "loaded": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+RAG_HEAVY = [
+    "google.generativeai", "chromadb", "langchain_huggingface", "sentence_transformers", "torch",
+    "langchain_community",
+]
+
+
+def _import_fresh(module: str, heavy: list[str]) -> dict:
+    proc = subprocess.run(
+        [sys.executable, "-W", "ignore", "-c", PROBE.format(module=module, heavy=heavy)],
+        cwd=APP_DIR, capture_output=True, text=True, timeout=120,
+    )
+    if proc.returncode != 0:
+        pytest.fail(proc.stderr)
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+@lru_cache(maxsize=1)
+def _baseline_seconds() -> float:
+    return min(_import_fresh("fastapi", [])["seconds"] for _ in range(RUNS))
+
+
+def _missing(modules: list[str]) -> list[str]:
+    missing = []
+    for name in modules:
+        try:
+            if importlib.util.find_spec(name) is None:
+                missing.append(name)
+        except ModuleNotFoundError:  # parent package missing, e.g. google for google.generativeai
+            missing.append(name)
+    return missing
+
+
+@pytest.mark.parametrize("module, heavy", [("main", ["google.generativeai"]), ("rag_chat.routes", RAG_HEAVY)])
+def test_import_budget(module, heavy):
+    missing = _missing(heavy)
+    if missing:
+        pytest.skip(f"lazy dependencies of {module} not installed: {', '.join(missing)}")
+
+    runs = [_import_fresh(module, heavy) for _ in range(RUNS)]
+    assert runs[0]["loaded"] == [], f"{module} eagerly imports {runs[0]['loaded']}"
+    fastest = min(run["seconds"] for run in runs)
+    budget = BUDGET_RATIO * _baseline_seconds()
+    assert fastest < budget, (
+        f"import {module} took {fastest:.2f}s, budget {budget:.2f}s "
+        f"({BUDGET_RATIO:g} x {_baseline_seconds():.2f}s for import fastapi)"
+    )
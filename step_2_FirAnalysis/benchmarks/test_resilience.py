@@ -0,0 +1,70 @@
+"""
+Checks for the tail-latency controls in core/resilience.py and the way the
+Ollama backend pool feeds them.
+"""
+
+import asyncio
+
+import httpx
+import pytest
+
+from core.llm_pool import BackendPool
+from core.resilience import CircuitBreaker, DeadlineExceeded, hedged, stage
+
+
+def _tracked_call(started: list):
+    async def call():
+        task = asyncio.current_task()
+        started.append(task)
+        await asyncio.sleep(10)
+    return call
+
+
+def test_stage_deadline_during_hedge_delay_cancels_first_attempt(event_loop_runner):
+    started: list = []
+
+    async def run():
+        with pytest.raises(DeadlineExceeded):
+            await stage("extract", 0.05, hedged(_tracked_call(started), 1.0))
+        await asyncio.sleep(0)
+
+    event_loop_runner(run())
+    assert len(started) == 1
+    assert all(task.cancelled() for task in started)
+
+
+def test_cancel_after_hedge_cancels_both_attempts(event_loop_runner):
+    started: list = []
+
+    async def run():
+        with pytest.raises(DeadlineExceeded):
+            await stage("extract", 0.1, hedged(_tracked_call(started), 0.02))
+        await asyncio.sleep(0)
+
+    event_loop_runner(run())
+    assert len(started) == 2
+    assert all(task.cancelled() for task in started)
+
+
+def test_successful_probe_does_not_close_an_open_circuit(event_loop_runner):
+    pool = BackendPool(["http://backend.test"], api_key="test")
+    backend = pool.backends[0]
+    pool._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(
+            lambda request: httpx.Response(200, json={"choices": [{"message": {"content": "PONG"}}]})
+        )
+    )
+    for _ in range(backend.breaker.min_calls):
+        backend.breaker.record(ok=False)
+    assert backend.breaker.state == CircuitBreaker.OPEN
+
+    async def run():
+        try:
+            for _ in range(3):
+                assert (await pool.probe(backend, "model"))["status"] == "ok"
+        finally:
+            await pool.aclose()
+
+    event_loop_runner(run())
+    assert backend.breaker.state == CircuitBreaker.OPEN
+    assert backend.breaker.stats()["recent_calls"] == 0
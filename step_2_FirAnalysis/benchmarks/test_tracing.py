@@ -0,0 +1,74 @@
+"""
+End-to-end check of the trace propagation contract in fir_common.tracing:
+calls that carry the frontend's traceparent (frontend/src/services/tracing.js)
+land in one trace on both services.
+"""
+
+import json
+import secrets
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fir_common import tracing
+
+pytest.importorskip("opentelemetry.sdk", reason="opentelemetry-sdk is not installed")
+
+
+def _generator_stand_in() -> FastAPI:
+    """The FIR generator wires tracing the same way; its app needs Groq/LangGraph to import."""
+    app = FastAPI()
+    tracing.trace_requests(app)
+
+    @app.post("/FIR_filing")
+    async def file_fir():
+        return {"message": {}}
+
+    return app
+
+
+def test_workflow_shares_one_trace_across_both_services(tmp_path):
+    import main
+
+    spans_file = tmp_path / "spans.jsonl"
+    tracing.setup_tracing("fir-e2e", tracer_name="fir_e2e", exporter="file", file=str(spans_file))
+    trace_id = secrets.token_hex(16)
+    sent = [secrets.token_hex(8), secrets.token_hex(8)]
+    try:
+        responses = [
+            TestClient(_generator_stand_in()).post("/FIR_filing", headers={"traceparent": f"00-{trace_id}-{sent[0]}-01"}),
+            TestClient(main.app).get("/health", headers={"traceparent": f"00-{trace_id}-{sent[1]}-01"}),
+        ]
+    finally:
+        tracing.shutdown_tracing()
+
+    for response, parent in zip(responses, sent):
+        _, returned_trace, returned_span, _ = response.headers["traceparent"].split("-")
+        assert returned_trace == trace_id
+        assert returned_span != parent
+
+    # Only the spans opened by trace_requests; some FastAPI releases add their own server span.
+    server_spans = [
+        span
+        for span in map(json.loads, spans_file.read_text().splitlines())
+        if span["kind"] == "SpanKind.SERVER" and "http.target" in span["attributes"]
+    ]
+    assert sorted(span["parent_id"] for span in server_spans) == sorted(f"0x{p}" for p in sent)
+    assert {span["context"]["trace_id"] for span in server_spans} == {f"0x{trace_id}"}
+
+
+def test_browser_may_send_and_read_traceparent():
+    import main
+
+    preflight = TestClient(main.app).options(
+        "/api/v1/fir/analyse-pdf",
+        headers={
+            "Origin": "http://localhost:5173",
+            "Access-Control-Request-Method": "POST",
+            "Access-Control-Request-Headers": "traceparent",
+        },
+    )
+    assert "traceparent" in preflight.headers["access-control-allow-headers"].lower()
+    response = TestClient(main.app).get("/health", headers={"Origin": "http://localhost:5173"})
+    assert "traceparent" in response.headers["access-control-expose-headers"].lower()
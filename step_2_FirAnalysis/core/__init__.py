@@ -0,0 +1,7 @@
+import sys
+from pathlib import Path
+
+# fir_common, the package shared with microservices_backend, lives at the repo root.
+_REPO_ROOT = str(Path(__file__).resolve().parents[2])
+if _REPO_ROOT not in sys.path:
+    sys.path.append(_REPO_ROOT)
@@ -6,14 +6,68 @@ class Settings(BaseSettings):
     OLLAMA_BASE_URL: str = "http://localhost:11434"   
     OLLAMA_MODEL: str = "llama3.1:8b"                
     OLLAMA_API_KEY: str = "ollama"                   
+
+    # Extra OpenAI-compatible backends for extraction, comma-separated base URLs,
+    # balanced together with OLLAMA_BASE_URL. Empty → OLLAMA_BASE_URL only.
+    # See core/llm_pool.py.
+    OLLAMA_BACKENDS: str = ""
+    OLLAMA_EJECT_AFTER_FAILURES: int = 3
+    OLLAMA_EJECT_SECONDS: float = 30.0
+    OLLAMA_HEALTH_INTERVAL_SECONDS: float = 15.0   # 0 disables background probes
+    OLLAMA_TIMEOUT_SECONDS: float = 120.0
+
+    # Tail-latency controls (core/resilience.py).
+    # Hedging: if a call has not returned after the observed p-quantile latency
+    # (HEDGE_DELAY_SECONDS until enough samples exist), send a second one.
+    OLLAMA_HEDGE_ENABLED: bool = True
+    OLLAMA_HEDGE_QUANTILE: float = 0.95
+    OLLAMA_HEDGE_DELAY_SECONDS: float = 20.0
+    GEMINI_HEDGE_ENABLED: bool = False     # a hedge is a second paid call
+    GEMINI_HEDGE_QUANTILE: float = 0.95
+    GEMINI_HEDGE_DELAY_SECONDS: float = 30.0
+    GEMINI_TIMEOUT_SECONDS: float = 60.0
+    # Circuit breakers open when CIRCUIT_FAILURE_RATIO of the last CIRCUIT_WINDOW
+    # calls failed or exceeded the latency budget (0 = no latency budget).
+    OLLAMA_LATENCY_BUDGET_SECONDS: float = 60.0
+    GEMINI_LATENCY_BUDGET_SECONDS: float = 45.0
+    CIRCUIT_FAILURE_RATIO: float = 0.5
+    CIRCUIT_WINDOW: int = 20
+    CIRCUIT_MIN_CALLS: int = 5
+    CIRCUIT_OPEN_SECONDS: float = 30.0
+    # Deadlines: a request may ask for less with an X-Request-Timeout header (seconds).
+    REQUEST_DEADLINE_SECONDS: float = 150.0
+    EXTRACT_STAGE_TIMEOUT_SECONDS: float = 90.0
+    LEGAL_STAGE_TIMEOUT_SECONDS: float = 90.0
+
     GEMINI_API_KEY: str = ""
     GEMINI_MODEL: str = "gemini-1.5-pro"
+    # Override the Gemini API host, e.g. http://127.0.0.1:8900 for benchmarks/mock_llm_server.py.
+    GEMINI_API_ENDPOINT: str = ""
+
+    # Native structured output. OLLAMA_JSON_MODE: "json_schema" (response_format
+    # with the Pydantic schema), "json_object" (JSON mode only) or "off".
+    OLLAMA_JSON_MODE: str = "json_schema"
+    GEMINI_JSON_MODE: bool = True
 
     SECRET_KEY: str = "change-me-in-production-32-chars!"
     MASK_SALT: str = "fir-mask-salt-2024"
 
     MAX_FIR_SIZE_BYTES: int = 500_000     
     DEBUG: bool = False
+    # Build the Gemini client during startup instead of on the first request.
+    WARM_UP_ON_STARTUP: bool = False
+
+    LOG_SAMPLE_RATE: float = 0.1          # share of routine per-request logs kept
+    LOG_QUEUE_SIZE: int = 10_000          # records buffered before new ones are dropped
+
+    IDEMPOTENCY_TTL_SECONDS: int = 600    # how long a finished result can be replayed
+    IDEMPOTENCY_MAX_ENTRIES: int = 1_000
+
+    # Tracing (core/tracing.py): none | console | file | otlp
+    TRACING_EXPORTER: str = "none"
+    TRACING_FILE: str = "traces.jsonl"
+    TRACING_OTLP_ENDPOINT: str = "http://localhost:4318/v1/traces"
+    TRACING_SAMPLE_RATIO: float = 1.0
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,17 @@
+"""
+Idempotency-Key store for the FIR Analyser: fir_common.idempotency sized
+from Settings (IDEMPOTENCY_TTL_SECONDS, IDEMPOTENCY_MAX_ENTRIES).
+"""
+
+from fir_common.idempotency import (  # noqa: F401 - re-exported for the router
+    IdempotencyKeyConflict,
+    IdempotencyStore,
+    fingerprint,
+)
+
+from core.config import settings
+
+idempotency_store = IdempotencyStore(
+    ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+    max_entries=settings.IDEMPOTENCY_MAX_ENTRIES,
+)
@@ -0,0 +1,154 @@
+"""
+Tolerant JSON parsing for LLM output.
+
+parse_json_lenient() accepts what models actually return and recovers a
+JSON object whenever one is reasonably present:
+  - prose before / after the object, and ```json fences anywhere
+    (including an opening fence that is never closed)
+  - trailing commas before } or ]
+  - output truncated mid-string / mid-array / mid-object — open strings and
+    brackets are closed, and an incomplete trailing member is dropped
+    (partial-object recovery)
+
+Raises ValueError when no JSON object can be recovered.
+"""
+
+import json
+import re
+
+_FENCE_RE = re.compile(r"```(?:json|JSON)?\s*(.*?)(?:```|$)", re.DOTALL)
+_MAX_TRIMS = 50
+
+
+def parse_json_lenient(raw: str) -> dict:
+    text = raw.strip()
+    try:
+        data = json.loads(text)
+        if isinstance(data, dict):
+            return data
+    except json.JSONDecodeError:
+        pass
+
+    fenced = _FENCE_RE.search(text)
+    if fenced and "{" in fenced.group(1):
+        text = fenced.group(1)
+
+    start = text.find("{")
+    if start == -1:
+        raise ValueError("no JSON object found")
+    text = _strip_trailing_commas(_first_object(text[start:]))
+
+    for _ in range(_MAX_TRIMS):
+        try:
+            data = json.loads(_close(text))
+            if isinstance(data, dict):
+                return data
+        except json.JSONDecodeError:
+            pass
+        # Drop the last (incomplete) member and try again.
+        cut = _last_separator(text)
+        if cut <= 0:
+            break
+        text = text[:cut]
+
+    raise ValueError("could not repair JSON object")
+
+
+def _first_object(text: str) -> str:
+    """Return text up to the end of the first balanced object (or all of it if truncated)."""
+    depth = 0
+    in_string = escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            depth += 1
+        elif ch in "}]":
+            depth -= 1
+            if depth == 0:
+                return text[: i + 1]
+    return text
+
+
+def _strip_trailing_commas(text: str) -> str:
+    out = []
+    in_string = escaped = False
+    pending_comma = False
+    for ch in text:
+        if in_string:
+            out.append(ch)
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+            continue
+        if ch == ",":
+            if pending_comma:
+                continue
+            pending_comma = True
+            continue
+        if pending_comma and not ch.isspace():
+            if ch not in "}]":
+                out.append(",")
+            pending_comma = False
+        if ch == '"':
+            in_string = True
+        out.append(ch)
+    return "".join(out)
+
+
+def _close(text: str) -> str:
+    """Close an unterminated string and any open brackets."""
+    stack = []
+    in_string = escaped = False
+    for ch in text:
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "{[":
+            stack.append("}" if ch == "{" else "]")
+        elif ch in "}]" and stack:
+            stack.pop()
+
+    if in_string:
+        text += '"'
+    text = text.rstrip()
+    while text and text[-1] in ",:":
+        text = text[:-1].rstrip()
+    return text + "".join(reversed(stack))
+
+
+def _last_separator(text: str) -> int:
+    """Index of the last comma / opening bracket outside a string."""
+    last = -1
+    in_string = escaped = False
+    for i, ch in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"':
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch == ",":
+            last = i
+        elif ch in "{[":
+            last = i + 1
+    return last if last < len(text) else -1
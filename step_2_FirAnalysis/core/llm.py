@@ -1,19 +1,52 @@
 """
 LLM clients:
-  - OllamaClient  → OpenAI-compatible /v1/chat/completions endpoint
-                    (works with ngrok tunnel, LM Studio, Ollama, vLLM, etc.)
+  - OllamaClient  → OpenAI-compatible /v1/chat/completions endpoints
+                    (works with ngrok tunnel, LM Studio, Ollama, vLLM, etc.),
+                    load-balanced across core.llm_pool.ollama_pool
   - GeminiClient  → Google Gemini via google-generativeai SDK (legal analysis)
 
 All config (URLs, keys, model names) is read from Settings — nothing hardcoded.
+
+generate_json() takes an optional JSON schema (see core.schema) and uses the
+provider's native structured output for it: `response_format` json_schema on
+OpenAI-compatible servers, `response_schema` on Gemini. When native mode is
+turned off in Settings the schema is appended to the prompt instead.
+
+Both clients hedge slow calls and respect the request deadline
+(core.resilience). Gemini calls also time out after GEMINI_TIMEOUT_SECONDS
+and go through a circuit breaker.
+
+google-generativeai is imported and configured on first use (or in
+GeminiClient.warm_up()), so importing this module stays cheap.
 """
 
+import asyncio
 import json
-import httpx
+import threading
+import time
 from typing import Any
 
-import google.generativeai as genai
-
+from core import metrics
 from core.config import settings
+from core.json_repair import parse_json_lenient
+from core.llm_pool import BackendPool, ollama_pool
+from core.resilience import (
+    CircuitBreaker,
+    CircuitOpenError,
+    LatencyTracker,
+    hedge_delay,
+    hedged,
+    remaining,
+)
+from core.schema import to_gemini_schema
+from core.tracing import traced
+
+
+def _schema_hint(schema: dict) -> str:
+    return (
+        "\n\nRespond with a JSON object matching this JSON schema — no prose, no markdown fences:\n"
+        + json.dumps(schema, separators=(",", ":"))
+    )
 
 
 
@@ -22,61 +55,77 @@ class OllamaClient:
     Calls any OpenAI-compatible endpoint.
     Reads from .env:
         OLLAMA_BASE_URL  — e.g. https://xxxx.ngrok-free.app
+        OLLAMA_BACKENDS  — optional comma-separated extra base URLs to balance across
         OLLAMA_MODEL     — e.g. llama3.1:8b
         OLLAMA_API_KEY   — bearer token if your proxy requires one
     """
 
-    def __init__(self):
-        self.base_url = settings.OLLAMA_BASE_URL.rstrip("/")
+    def __init__(self, pool: BackendPool = ollama_pool):
+        self.pool = pool
         self.model = settings.OLLAMA_MODEL
-        self.api_key = settings.OLLAMA_API_KEY
 
-    def _headers(self) -> dict[str, str]:
-        return {
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {self.api_key}",
-        }
-
-    def _payload(self, messages: list[dict], temperature: float = 0.1) -> dict[str, Any]:
-        return {
+    def _payload(
+        self,
+        messages: list[dict],
+        temperature: float = 0.1,
+        response_format: dict | None = None,
+    ) -> dict[str, Any]:
+        payload = {
             "model": self.model,
             "messages": messages,
             "temperature": temperature,
         }
+        if response_format:
+            payload["response_format"] = response_format
+        return payload
 
-    async def generate(self, prompt: str, system: str = "") -> str:
+    @traced("llm.ollama.generate")
+    async def generate(
+        self, prompt: str, system: str = "", response_format: dict | None = None
+    ) -> str:
         """Send a prompt and return the assistant text response."""
         messages = []
         if system:
             messages.append({"role": "system", "content": system})
         messages.append({"role": "user", "content": prompt})
 
-        async with httpx.AsyncClient(timeout=120.0) as client:
-            resp = await client.post(
-                f"{self.base_url}/v1/chat/completions",
-                headers=self._headers(),
-                json=self._payload(messages),
+        payload = self._payload(messages, response_format=response_format)
+        delay = None
+        if settings.OLLAMA_HEDGE_ENABLED:
+            delay = hedge_delay(
+                self.pool.latency, settings.OLLAMA_HEDGE_QUANTILE, settings.OLLAMA_HEDGE_DELAY_SECONDS
             )
-            resp.raise_for_status()
-
-        data = resp.json()
+        data = await hedged(lambda: self.pool.chat_completion(payload), delay)
+        usage = data.get("usage") or {}
+        metrics.record_tokens("ollama", usage.get("prompt_tokens"), usage.get("completion_tokens"))
         return data["choices"][0]["message"]["content"].strip()
 
-    async def generate_json(self, prompt: str, system: str = "") -> dict:
-        """Call generate() and parse the JSON response."""
-        raw = await self.generate(prompt, system)
+    async def ping(self) -> list[dict]:
+        """Probe every backend with the PONG prompt."""
+        return await self.pool.probe_all(self.model)
+
+    async def generate_json(
+        self, prompt: str, system: str = "", schema: dict | None = None
+    ) -> dict:
+        """Call generate() with JSON output constrained to `schema` and parse it."""
+        mode = settings.OLLAMA_JSON_MODE
+        response_format = None
+        if mode == "json_schema" and schema is not None:
+            response_format = {
+                "type": "json_schema",
+                "json_schema": {"name": "response", "schema": schema},
+            }
+        elif mode in ("json_schema", "json_object"):
+            response_format = {"type": "json_object"}
 
-        raw = raw.strip()
-        if raw.startswith("```"):
-            parts = raw.split("```")
-            raw = parts[1]
-            if raw.startswith("json"):
-                raw = raw[4:]
-        raw = raw.strip()
+        if schema is not None and mode != "json_schema":
+            prompt += _schema_hint(schema)
+
+        raw = await self.generate(prompt, system, response_format=response_format)
 
         try:
-            return json.loads(raw)
-        except json.JSONDecodeError as exc:
+            return parse_json_lenient(raw)
+        except ValueError as exc:
             raise ValueError(
                 f"Ollama returned non-JSON output:\n{raw[:400]}"
             ) from exc
@@ -85,42 +134,120 @@ class OllamaClient:
 class GeminiClient:
     """
     Reads from .env:
-        GEMINI_API_KEY  — Google AI Studio key
-        GEMINI_MODEL    — e.g. gemini-1.5-pro
+        GEMINI_API_KEY       — Google AI Studio key
+        GEMINI_MODEL         — e.g. gemini-1.5-pro
+        GEMINI_API_ENDPOINT  — optional host override (REST transport), e.g. a local mock
     """
 
     def __init__(self):
-        genai.configure(api_key=settings.GEMINI_API_KEY)
-        self.model = genai.GenerativeModel(settings.GEMINI_MODEL)
-
-    async def generate(self, prompt: str) -> str:
-        import asyncio
-        loop = asyncio.get_event_loop()
-        response = await loop.run_in_executor(
-            None,
-            lambda: self.model.generate_content(
-                prompt,
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.3,
-                    max_output_tokens=4096,
-                ),
-            ),
+        self._genai = None
+        self._model = None
+        self._init_lock = threading.Lock()
+        self.latency = LatencyTracker()
+        self.breaker = CircuitBreaker(
+            "gemini",
+            failure_ratio=settings.CIRCUIT_FAILURE_RATIO,
+            latency_budget_seconds=settings.GEMINI_LATENCY_BUDGET_SECONDS or None,
+            window=settings.CIRCUIT_WINDOW,
+            min_calls=settings.CIRCUIT_MIN_CALLS,
+            open_seconds=settings.CIRCUIT_OPEN_SECONDS,
         )
+
+    @property
+    def model(self):
+        """The GenerativeModel, created (with the SDK import) on first access."""
+        if self._model is None:
+            with self._init_lock:
+                if self._model is None:
+                    import google.generativeai as genai
+
+                    if settings.GEMINI_API_ENDPOINT:
+                        genai.configure(
+                            api_key=settings.GEMINI_API_KEY,
+                            transport="rest",
+                            client_options={"api_endpoint": settings.GEMINI_API_ENDPOINT},
+                        )
+                    else:
+                        genai.configure(api_key=settings.GEMINI_API_KEY)
+                    self._genai = genai
+                    self._model = genai.GenerativeModel(settings.GEMINI_MODEL)
+        return self._model
+
+    def warm_up(self) -> None:
+        self.model
+
+    async def generate(self, prompt: str, **config: Any) -> str:
+        delay = None
+        if settings.GEMINI_HEDGE_ENABLED:
+            delay = hedge_delay(
+                self.latency, settings.GEMINI_HEDGE_QUANTILE, settings.GEMINI_HEDGE_DELAY_SECONDS
+            )
+        return await hedged(lambda: self._generate_once(prompt, config), delay)
+
+    @traced("llm.gemini.generate")
+    async def _generate_once(self, prompt: str, config: dict[str, Any]) -> str:
+        if not self.breaker.allow():
+            raise CircuitOpenError("Gemini circuit is open")
+
+        timeout = settings.GEMINI_TIMEOUT_SECONDS
+        left = remaining()
+        if left is not None:
+            timeout = max(0.1, min(timeout, left))
+
+        if self._model is None:
+            # First call: keep the SDK import off the event loop.
+            await asyncio.to_thread(self.warm_up)
+        model = self.model
+        generation_config = self._genai.types.GenerationConfig(
+            temperature=0.3,
+            max_output_tokens=4096,
+            **config,
+        )
+        loop = asyncio.get_running_loop()
+        started = time.monotonic()
+        try:
+            # The SDK call runs in a thread that cannot be cancelled; its own
+            # request timeout makes sure the thread does not outlive the wait.
+            response = await asyncio.wait_for(
+                loop.run_in_executor(
+                    None,
+                    lambda: model.generate_content(
+                        prompt,
+                        generation_config=generation_config,
+                        request_options={"timeout": timeout},
+                    ),
+                ),
+                timeout,
+            )
+        except asyncio.CancelledError:
+            self.breaker.cancelled()
+            raise
+        except Exception:
+            self.breaker.record(ok=False)
+            raise
+
+        elapsed = time.monotonic() - started
+        self.breaker.record(ok=True, latency_seconds=elapsed)
+        self.latency.record(elapsed)
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            metrics.record_tokens("gemini", usage.prompt_token_count, usage.candidates_token_count)
         return response.text.strip()
 
-    async def generate_json(self, prompt: str) -> dict:
-        raw = await self.generate(prompt)
-        raw = raw.strip()
-        if raw.startswith("```"):
-            parts = raw.split("```")
-            raw = parts[1]
-            if raw.startswith("json"):
-                raw = raw[4:]
-        raw = raw.strip()
+    async def generate_json(self, prompt: str, schema: dict | None = None) -> dict:
+        config: dict[str, Any] = {}
+        if settings.GEMINI_JSON_MODE:
+            config["response_mime_type"] = "application/json"
+            if schema is not None:
+                config["response_schema"] = to_gemini_schema(schema)
+        elif schema is not None:
+            prompt += _schema_hint(schema)
+
+        raw = await self.generate(prompt, **config)
 
         try:
-            return json.loads(raw)
-        except json.JSONDecodeError as exc:
+            return parse_json_lenient(raw)
+        except ValueError as exc:
             raise ValueError(
                 f"Gemini returned non-JSON output:\n{raw[:400]}"
             ) from exc
@@ -0,0 +1,289 @@
+"""
+Pool of OpenAI-compatible backends for the local extraction model.
+
+  - Backends are OLLAMA_BASE_URL plus any extra base URLs in
+    Settings.OLLAMA_BACKENDS (comma-separated); duplicates are dropped.
+  - Each request goes to the healthy backend with the fewest requests in
+    flight (least outstanding requests), ties broken at random.
+  - Connection errors, timeouts, 429 and 5xx fail over to the next backend.
+    Other 4xx are the request's fault and are raised straight away.
+  - Passive ejection: after OLLAMA_EJECT_AFTER_FAILURES consecutive failures
+    a backend is taken out of rotation for OLLAMA_EJECT_SECONDS.
+  - Circuit breakers: each backend also has a core.resilience.CircuitBreaker
+    that opens when too many recent calls failed or ran over
+    OLLAMA_LATENCY_BUDGET_SECONDS. A backend with an open circuit gets no
+    traffic until its half-open trial call succeeds.
+  - Active probes: every OLLAMA_HEALTH_INTERVAL_SECONDS each backend gets the
+    same PONG prompt as /ping-ollama; a success lifts an ejection straight
+    away. Probes never touch the circuit breaker: a PONG says nothing about
+    how real extraction calls fare, so an open circuit only closes through
+    its half-open trial call.
+
+If every backend is ejected the pool still tries them (fewest failures
+first) rather than failing without a request being sent. If every circuit
+is open it raises CircuitOpenError instead.
+"""
+
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Optional
+
+import httpx
+
+from core.config import settings
+from core.resilience import CircuitBreaker, CircuitOpenError, LatencyTracker
+from core.tracing import inject_headers, span
+
+logger = logging.getLogger(__name__)
+
+PING_PROMPT = "Reply with just the word PONG."
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class Backend:
+    def __init__(self, base_url: str, breaker: CircuitBreaker):
+        self.base_url = base_url.rstrip("/")
+        self.breaker = breaker
+        self.outstanding = 0
+        self.consecutive_failures = 0
+        self.ejected_until = 0.0
+        self.requests = 0
+        self.failures = 0
+        self.last_error: Optional[str] = None
+
+    def available(self, now: float) -> bool:
+        return now >= self.ejected_until
+
+    def stats(self, now: float) -> dict:
+        return {
+            "url": self.base_url,
+            "healthy": self.available(now),
+            "outstanding": self.outstanding,
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "ejected_for_seconds": round(max(0.0, self.ejected_until - now), 1),
+            "circuit": self.breaker.stats(),
+            "last_error": self.last_error,
+        }
+
+
+def _is_retryable(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+class BackendPool:
+    def __init__(
+        self,
+        urls: list[str],
+        api_key: str,
+        eject_after_failures: int = 3,
+        eject_seconds: float = 30.0,
+        timeout_seconds: float = 120.0,
+        latency_budget_seconds: Optional[float] = None,
+    ):
+        self.backends = [
+            Backend(
+                url,
+                CircuitBreaker(
+                    f"ollama:{url}",
+                    failure_ratio=settings.CIRCUIT_FAILURE_RATIO,
+                    latency_budget_seconds=latency_budget_seconds,
+                    window=settings.CIRCUIT_WINDOW,
+                    min_calls=settings.CIRCUIT_MIN_CALLS,
+                    open_seconds=settings.CIRCUIT_OPEN_SECONDS,
+                ),
+            )
+            for url in urls
+        ]
+        self.latency = LatencyTracker()
+        self.api_key = api_key
+        self.eject_after_failures = max(1, eject_after_failures)
+        self.eject_seconds = eject_seconds
+        self.timeout_seconds = timeout_seconds
+        self._client: Optional[httpx.AsyncClient] = None
+        self._probe_task: Optional[asyncio.Task] = None
+
+    def _http(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=self.timeout_seconds)
+        return self._client
+
+    def _headers(self) -> dict[str, str]:
+        return {
+            "Content-Type": "application/json",
+            "Authorization": f"Bearer {self.api_key}",
+        }
+
+    def _pick(self, tried: set[int]) -> Optional[Backend]:
+        now = time.monotonic()
+        candidates = [b for b in self.backends if id(b) not in tried and b.breaker.available()]
+        if not candidates:
+            return None
+        healthy = [b for b in candidates if b.available(now)]
+        if healthy:
+            least = min(b.outstanding for b in healthy)
+            return random.choice([b for b in healthy if b.outstanding == least])
+        return min(candidates, key=lambda b: (b.consecutive_failures, b.ejected_until))
+
+    def _record_success(self, backend: Backend) -> None:
+        if backend.consecutive_failures or not backend.available(time.monotonic()):
+            logger.info("LLM backend back in rotation", extra={"backend": backend.base_url})
+        backend.consecutive_failures = 0
+        backend.ejected_until = 0.0
+
+    def _record_failure(self, backend: Backend, exc: Exception) -> None:
+        backend.failures += 1
+        backend.consecutive_failures += 1
+        backend.last_error = f"{type(exc).__name__}: {exc}"[:200]
+        if backend.consecutive_failures >= self.eject_after_failures:
+            backend.ejected_until = time.monotonic() + self.eject_seconds
+            logger.warning(
+                "LLM backend ejected",
+                extra={
+                    "backend": backend.base_url,
+                    "failures": backend.consecutive_failures,
+                    "eject_seconds": self.eject_seconds,
+                    "error": backend.last_error,
+                },
+            )
+
+    async def _post(self, backend: Backend, payload: dict[str, Any], measure: bool = True) -> dict:
+        """
+        POST one request to one backend. With measure=False (health pings) the
+        call feeds neither the hedge tracker nor the circuit breaker.
+        """
+        backend.outstanding += 1
+        backend.requests += 1
+        started = time.monotonic()
+        try:
+            with span("llm.ollama.request", backend=backend.base_url) as current:
+                resp = await self._http().post(
+                    f"{backend.base_url}/v1/chat/completions",
+                    headers=inject_headers(self._headers()),
+                    json=payload,
+                )
+                if current is not None:
+                    current.set_attribute("http.status_code", resp.status_code)
+                resp.raise_for_status()
+                data = resp.json()
+        except asyncio.CancelledError:
+            if measure:
+                backend.breaker.cancelled()
+            raise
+        except httpx.HTTPError as exc:
+            if measure:
+                backend.breaker.record(ok=not _is_retryable(exc))
+            raise
+        finally:
+            backend.outstanding -= 1
+        if not measure:
+            return data
+        elapsed = time.monotonic() - started
+        backend.breaker.record(ok=True, latency_seconds=elapsed)
+        self.latency.record(elapsed)
+        return data
+
+    async def chat_completion(self, payload: dict[str, Any]) -> dict:
+        """POST payload to /v1/chat/completions, failing over between backends."""
+        tried: set[int] = set()
+        last_exc: Optional[Exception] = None
+        while True:
+            backend = self._pick(tried)
+            if backend is None:
+                raise last_exc or CircuitOpenError("every LLM backend has an open circuit")
+            tried.add(id(backend))
+            if not backend.breaker.allow():
+                continue
+            try:
+                data = await self._post(backend, payload)
+            except httpx.HTTPError as exc:
+                if not _is_retryable(exc):
+                    raise
+                self._record_failure(backend, exc)
+                last_exc = exc
+                logger.warning(
+                    "LLM backend failed, failing over",
+                    extra={"backend": backend.base_url, "error": backend.last_error},
+                )
+                continue
+            self._record_success(backend)
+            return data
+
+    async def ping(self, backend: Backend, model: str) -> str:
+        """Send the PONG prompt to one backend and return its reply."""
+        data = await self._post(
+            backend,
+            {
+                "model": model,
+                "messages": [{"role": "user", "content": PING_PROMPT}],
+                "temperature": 0,
+                "max_tokens": 5,
+            },
+            measure=False,
+        )
+        return data["choices"][0]["message"]["content"].strip()
+
+    async def probe(self, backend: Backend, model: str) -> dict:
+        """Ping one backend, update its health and return its status."""
+        started = time.monotonic()
+        try:
+            reply = await self.ping(backend, model)
+        except httpx.HTTPError as exc:
+            self._record_failure(backend, exc)
+            # A failed probe ejects right away — there is no request to fail over.
+            backend.ejected_until = time.monotonic() + self.eject_seconds
+            return {**backend.stats(time.monotonic()), "status": "error"}
+        self._record_success(backend)
+        return {
+            **backend.stats(time.monotonic()),
+            "status": "ok",
+            "response": reply,
+            "latency_ms": round((time.monotonic() - started) * 1000, 1),
+        }
+
+    async def probe_all(self, model: str) -> list[dict]:
+        return list(await asyncio.gather(*(self.probe(b, model) for b in self.backends)))
+
+    async def _probe_loop(self, model: str, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.probe_all(model)
+            except Exception:
+                logger.exception("LLM health probe failed")
+
+    def start_health_checks(self, model: str, interval: float) -> None:
+        if interval > 0 and self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._probe_loop(model, interval))
+
+    async def aclose(self) -> None:
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            self._probe_task = None
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def stats(self) -> list[dict]:
+        now = time.monotonic()
+        return [b.stats(now) for b in self.backends]
+
+
+def backend_urls() -> list[str]:
+    urls = [settings.OLLAMA_BASE_URL, *settings.OLLAMA_BACKENDS.split(",")]
+    return list(dict.fromkeys(u.strip().rstrip("/") for u in urls if u.strip()))
+
+
+ollama_pool = BackendPool(
+    urls=backend_urls(),
+    api_key=settings.OLLAMA_API_KEY,
+    eject_after_failures=settings.OLLAMA_EJECT_AFTER_FAILURES,
+    eject_seconds=settings.OLLAMA_EJECT_SECONDS,
+    timeout_seconds=settings.OLLAMA_TIMEOUT_SECONDS,
+    latency_budget_seconds=settings.OLLAMA_LATENCY_BUDGET_SECONDS or None,
+)
@@ -0,0 +1,17 @@
+"""
+Logging for the FIR Analyser: fir_common.logging_config configured from
+Settings. Level is DEBUG when Settings.DEBUG is set, INFO otherwise, and
+Settings.LOG_QUEUE_SIZE records are buffered before new ones are dropped.
+
+Never log raw FIR text — log the masked text, shortened with redact_for_log.
+"""
+
+from fir_common import logging_config as _logging_config
+from fir_common.logging_config import redact_for_log  # noqa: F401 - re-exported for the service's modules
+
+from core.config import settings
+
+
+def setup_logging():
+    """Install the queue-backed JSON handler on the root logger and start it."""
+    return _logging_config.setup_logging(debug=settings.DEBUG, queue_size=settings.LOG_QUEUE_SIZE)
@@ -0,0 +1,48 @@
+"""
+Prometheus metrics for the FIR Analyser, served at GET /metrics
+(fir_common.metrics with the fir_analyser prefix).
+
+  fir_analyser_http_request_duration_seconds{method,route,status}  histogram
+  fir_analyser_stage_duration_seconds{stage}       extract_fields / build_and_mask / legal_analysis
+  fir_analyser_pdf_extraction_duration_seconds{method}   digital / ocr / failed
+  fir_analyser_llm_tokens_total{provider,kind}     kind = prompt / completion
+  fir_analyser_errors_total{exception}             HTTPException subclasses (fir_analysis.exceptions)
+                                                   and unhandled exceptions, by class name
+  fir_analyser_cache_{hits,misses}_total{cache}, fir_analyser_cache_hit_ratio{cache}
+                                                   read at scrape time from every cache passed
+                                                   to register_cache()
+"""
+
+from fir_common.metrics import ServiceMetrics, render, timed  # noqa: F401 - render is re-exported
+
+# LLM stages routinely take tens of seconds; the default buckets stop at 10s.
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60, 90, 120, 180)
+
+_metrics = ServiceMetrics("fir_analyser", LATENCY_BUCKETS)
+
+STAGE_LATENCY = _metrics.histogram("stage_duration_seconds", "Analysis pipeline stage latency", ["stage"])
+PDF_EXTRACTION_LATENCY = _metrics.histogram(
+    "pdf_extraction_duration_seconds", "PDF text extraction latency by method", ["method"]
+)
+LLM_TOKENS = _metrics.counter("llm_tokens", "Tokens reported by the LLM providers", ["provider", "kind"])
+
+instrument = _metrics.instrument
+register_cache = _metrics.register_cache
+observe_request = _metrics.observe_request
+record_error = _metrics.record_error
+
+
+def timed_stage(stage: str):
+    """Record the decorated function's duration (sync or async) under `stage`."""
+    return timed(STAGE_LATENCY, stage)
+
+
+def observe_pdf_extraction(method: str, seconds: float) -> None:
+    PDF_EXTRACTION_LATENCY.labels(method).observe(seconds)
+
+
+def record_tokens(provider: str, prompt_tokens: int | None, completion_tokens: int | None) -> None:
+    if prompt_tokens:
+        LLM_TOKENS.labels(provider, "prompt").inc(prompt_tokens)
+    if completion_tokens:
+        LLM_TOKENS.labels(provider, "completion").inc(completion_tokens)
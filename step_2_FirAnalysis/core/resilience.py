@@ -0,0 +1,224 @@
+"""
+Tail-latency controls for LLM calls.
+
+LatencyTracker   rolling window of recent call latencies; hedging uses its p95.
+CircuitBreaker   opens when too many recent calls failed or ran over the
+                 latency budget, rejects calls while open, then lets a single
+                 trial call through (half-open) after open_seconds.
+hedged()         starts a second attempt if the first has not finished after
+                 `delay`, returns whichever succeeds first, cancels the other.
+Deadlines        the request deadline lives in a contextvar, set by the
+                 middleware in main.py. stage() runs one pipeline stage
+                 within min(stage budget, time left on the request) and
+                 raises DeadlineExceeded when that runs out.
+"""
+
+import asyncio
+import contextvars
+import logging
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    pass
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+# ── Deadlines ───────────────────────────────────────────────────────────
+
+@contextmanager
+def deadline_scope(seconds: Optional[float]):
+    """Limit everything inside to `seconds` (never extends an outer deadline)."""
+    current = _deadline.get()
+    if seconds is None:
+        yield current
+        return
+    new = time.monotonic() + seconds
+    if current is not None:
+        new = min(new, current)
+    token = _deadline.set(new)
+    try:
+        yield new
+    finally:
+        _deadline.reset(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left before the current deadline, or None if there is none."""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+async def stage(name: str, budget_seconds: Optional[float], awaitable: Awaitable[Any]) -> Any:
+    left = remaining()
+    timeout = budget_seconds if budget_seconds and budget_seconds > 0 else None
+    if left is not None:
+        timeout = left if timeout is None else min(timeout, left)
+    if timeout is not None and timeout <= 0:
+        if asyncio.iscoroutine(awaitable):
+            awaitable.close()
+        raise DeadlineExceeded(f"no time left for {name}")
+    with deadline_scope(timeout):
+        try:
+            return await asyncio.wait_for(awaitable, timeout)
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"{name} did not finish within {timeout:.1f}s")
+
+
+# ── Latency tracking / hedging ─────────────────────────────────────────
+
+class LatencyTracker:
+    def __init__(self, window: int = 200):
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def record(self, seconds: float) -> None:
+        self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def hedge_delay(
+    tracker: LatencyTracker, quantile: float, fallback_seconds: float, min_samples: int = 20
+) -> float:
+    """Hedge after the observed `quantile` latency, or fallback_seconds until enough samples exist."""
+    if len(tracker) < min_samples:
+        return fallback_seconds
+    return tracker.quantile(quantile)
+
+
+async def hedged(call: Callable[[], Awaitable[Any]], delay: Optional[float]) -> Any:
+    """
+    Run call(); if it is still pending after `delay` seconds run a second
+    call() alongside it. The first success wins and the other is cancelled.
+    If one attempt fails the other is still awaited; if both fail the last
+    error is raised. delay=None disables hedging.
+    """
+    if delay is None:
+        return await call()
+
+    first = asyncio.ensure_future(call())
+    pending = {first}
+    error: Optional[BaseException] = None
+    try:
+        done, _ = await asyncio.wait(pending, timeout=delay)
+        if done:
+            pending = set()
+            return first.result()
+
+        logger.info("Hedging slow LLM call", extra={"hedge_after_seconds": round(delay, 2)})
+        pending.add(asyncio.ensure_future(call()))
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    return task.result()
+                error = task.exception()
+        raise error
+    finally:
+        for task in pending:
+            task.cancel()
+
+
+# ── Circuit breaker ────────────────────────────────────────────────────
+
+class CircuitBreaker:
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+    def __init__(
+        self,
+        name: str,
+        failure_ratio: float = 0.5,
+        latency_budget_seconds: Optional[float] = None,
+        window: int = 20,
+        min_calls: int = 5,
+        open_seconds: float = 30.0,
+    ):
+        self.name = name
+        self.failure_ratio = failure_ratio
+        self.latency_budget_seconds = latency_budget_seconds
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self._outcomes: deque[bool] = deque(maxlen=window)   # True = bad (error or too slow)
+        self.state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.opened_count = 0
+
+    def allow(self) -> bool:
+        """May a call be sent now? In half-open state only one trial call is let through."""
+        if self.state == self.OPEN and time.monotonic() - self._opened_at >= self.open_seconds:
+            self.state = self.HALF_OPEN
+            self._trial_in_flight = False
+        if self.state == self.CLOSED:
+            return True
+        if self.state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return True
+        return False
+
+    def available(self) -> bool:
+        """Like allow() but without claiming the half-open trial slot."""
+        if self.state == self.OPEN:
+            return time.monotonic() - self._opened_at >= self.open_seconds
+        return self.state == self.CLOSED or not self._trial_in_flight
+
+    def record(self, ok: bool, latency_seconds: float = 0.0) -> None:
+        slow = self.latency_budget_seconds is not None and latency_seconds > self.latency_budget_seconds
+        bad = not ok or slow
+
+        if self.state == self.HALF_OPEN:
+            self._trial_in_flight = False
+            if bad:
+                self._open()
+            else:
+                self.reset()
+            return
+
+        self._outcomes.append(bad)
+        if (
+            len(self._outcomes) >= self.min_calls
+            and sum(self._outcomes) / len(self._outcomes) >= self.failure_ratio
+        ):
+            self._open()
+
+    def cancelled(self) -> None:
+        """A call was cancelled (e.g. lost a hedge race); free the half-open trial slot."""
+        self._trial_in_flight = False
+
+    def reset(self) -> None:
+        if self.state != self.CLOSED:
+            logger.info("Circuit closed", extra={"circuit": self.name})
+        self.state = self.CLOSED
+        self._outcomes.clear()
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+        self.opened_count += 1
+        logger.warning("Circuit opened", extra={"circuit": self.name, "open_seconds": self.open_seconds})
+
+    def stats(self) -> dict:
+        return {
+            "state": self.state,
+            "recent_bad": sum(self._outcomes),
+            "recent_calls": len(self._outcomes),
+            "opened_count": self.opened_count,
+        }
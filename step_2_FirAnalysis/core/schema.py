@@ -0,0 +1,66 @@
+"""
+JSON schemas for provider-native structured output.
+
+json_schema()      Pydantic model → self-contained JSON schema ($refs inlined),
+                   accepted by OpenAI-compatible `response_format`.
+to_gemini_schema() JSON schema → the OpenAPI subset Gemini's `response_schema`
+                   understands (upper-case types, nullable instead of anyOf null,
+                   unsupported keywords dropped).
+"""
+
+from typing import Iterable, Optional
+
+from pydantic import BaseModel
+
+_GEMINI_KEYS = {"type", "format", "description", "nullable", "enum", "items", "properties", "required"}
+
+
+def json_schema(model: type[BaseModel], only: Optional[Iterable[str]] = None) -> dict:
+    """
+    Schema for `model` with every $ref inlined. Pass `only` to keep just a
+    subset of top-level properties (all of them required).
+    """
+    schema = model.model_json_schema()
+    defs = schema.pop("$defs", {})
+    schema = _inline(schema, defs)
+    if only is not None:
+        keep = [key for key in only if key in schema["properties"]]
+        schema["properties"] = {key: schema["properties"][key] for key in keep}
+        schema["required"] = keep
+    return schema
+
+
+def _inline(node, defs: dict):
+    if isinstance(node, dict):
+        if "$ref" in node:
+            target = defs[node["$ref"].rsplit("/", 1)[-1]]
+            merged = {**target, **{k: v for k, v in node.items() if k != "$ref"}}
+            return _inline(merged, defs)
+        return {key: _inline(value, defs) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_inline(item, defs) for item in node]
+    return node
+
+
+def to_gemini_schema(schema: dict) -> dict:
+    variants = schema.get("anyOf")
+    if variants:
+        non_null = [v for v in variants if v.get("type") != "null"]
+        merged = {**non_null[0], **{k: v for k, v in schema.items() if k != "anyOf"}}
+        if len(non_null) < len(variants):
+            merged["nullable"] = True
+        return to_gemini_schema(merged)
+
+    out = {}
+    for key, value in schema.items():
+        if key not in _GEMINI_KEYS:
+            continue
+        if key == "type":
+            out["type"] = value.upper()
+        elif key == "properties":
+            out["properties"] = {name: to_gemini_schema(prop) for name, prop in value.items()}
+        elif key == "items":
+            out["items"] = to_gemini_schema(value)
+        else:
+            out[key] = value
+    return out
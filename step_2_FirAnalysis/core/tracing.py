@@ -0,0 +1,33 @@
+"""
+Tracing for the FIR Analyser: fir_common.tracing configured from Settings.
+
+Settings.TRACING_EXPORTER picks where spans go:
+    none     spans are created but not exported (default)
+    console  one JSON span per line on stdout
+    file     one JSON span per line appended to TRACING_FILE
+    otlp     OTLP/HTTP to TRACING_OTLP_ENDPOINT (a local collector or stand-in)
+"""
+
+from fir_common import tracing as _tracing
+from fir_common.tracing import (  # noqa: F401 - re-exported for the service's modules
+    current_traceparent,
+    inject_headers,
+    server_span,
+    shutdown_tracing,
+    span,
+    trace_requests,
+    traced,
+)
+
+from core.config import settings
+
+
+def setup_tracing(service_name: str, tracer_name: str) -> None:
+    _tracing.setup_tracing(
+        service_name,
+        tracer_name,
+        exporter=settings.TRACING_EXPORTER,
+        file=settings.TRACING_FILE,
+        otlp_endpoint=settings.TRACING_OTLP_ENDPOINT,
+        sample_ratio=settings.TRACING_SAMPLE_RATIO,
+    )
@@ -77,39 +77,7 @@ EXTRACTION_SYSTEM_PROMPT = """You are a legal document parser specialising in In
 Extract information accurately. If a field is not present, return null.
 Always respond in valid JSON only — no prose, no markdown fences."""
 
-EXTRACTION_PROMPT_TEMPLATE = """Extract the following fields from this FIR text and return a JSON object.
-
-JSON schema:
-{{
-  "fir_number": string | null,
-  "police_station": string | null,
-  "district": string | null,
-  "date_of_filing": "YYYY-MM-DD" | null,
-  "date_of_incident": "YYYY-MM-DD" | null,
-  "time_of_incident": "HH:MM" | null,
-  "victim_name": string | null,
-  "victim_age": string | null,
-  "victim_gender": "Male"|"Female"|"Other" | null,
-  "victim_address": string | null,
-  "victim_contact": string | null,
-  "accused_names": [string],
-  "witness_names": [string],
-  "incident_location": string | null,
-  "incident_description": string,
-  "ipc_sections": [string],
-  "other_acts": [string],
-  "case_nature": string | null,
-  "entities_for_masking": {{
-    "person": [string],
-    "accused": [string],
-    "witness": [string],
-    "location": [string],
-    "phone": [string],
-    "aadhaar": [string],
-    "address": [string],
-    "vehicle": [string]
-  }}
-}}
+EXTRACTION_PROMPT_TEMPLATE = """Extract the fields of the response schema from this FIR text and return a JSON object.
 
 FIR TEXT:
 {fir_text}
@@ -117,7 +85,7 @@ FIR TEXT:
 
 LEGAL_ANALYSIS_PROMPT_TEMPLATE = """You are an expert Indian criminal lawyer and legal analyst with deep knowledge of Indian court judgements.
 You will be given details of an FIR (First Information Report) with personal details masked for privacy.
-Analyse the case objectively and respond ONLY with a valid JSON object matching the schema below.
+Analyse the case objectively and respond ONLY with a valid JSON object matching the response schema.
 Today's date is {today}.
 
 IMPORTANT CONTEXT (Indian Judiciary):
@@ -136,49 +104,7 @@ Other Acts         : {other_acts}
 Incident description (masked):
 {masked_description}
 
-Respond with this exact JSON schema — no extra keys, no prose:
-{{
-  "estimated_duration_months": {{
-    "district_court_min": int,
-    "district_court_typical": int,
-    "district_court_max": int,
-    "including_appeals_typical": int,
-    "notes": string
-  }},
-  "cost_estimate_inr": {{
-    "advocate_fees_min": int,
-    "advocate_fees_max": int,
-    "court_fees_approx": int,
-    "miscellaneous_min": int,
-    "miscellaneous_max": int,
-    "total_min": int,
-    "total_max": int,
-    "notes": string
-  }},
-  "win_probability_percent": int (0-100),
-  "win_probability_reasoning": string (3-5 sentences — mention relevant past cases if you know any),
-  "key_strengths": [string (at least 2)],
-  "key_weaknesses": [string],
-  "recommended_action": "Proceed to Trial" | "Negotiate Settlement" | "Mediation / Lok Adalat" | "Drop the Case",
-  "recommended_action_reasoning": string,
-  "similar_past_cases": [
-    {{
-      "case_title": string (e.g. "State of Maharashtra vs Vijay Salaskar 2010"),
-      "court": string (e.g. "Supreme Court of India" or "Bombay High Court"),
-      "year": int,
-      "ipc_sections": [string],
-      "what_happened": string (2-3 sentences describing the facts of that case),
-      "judgement_summary": string (2-3 sentences on what the court decided and why),
-      "outcome": "Convicted" | "Acquitted" | "Settled" | "Compounded" | "Partially Convicted",
-      "sentence_or_relief": string (e.g. "3 years RI and fine of Rs 10,000"),
-      "relevance_to_current_case": string (1-2 sentences on why this case is relevant here)
-    }}
-  ],
-  "required_documents": [string],
-  "optional_but_helpful_documents": [string],
-  "immediate_next_steps": [string (ordered list of 4-6 steps victim should take NOW)],
-  "important_caveats": [string]
-}}
+No extra keys, no prose.
 
 For similar_past_cases:
 - Include 2 to 4 real Indian court cases that closely match the current IPC sections and facts.
@@ -186,4 +112,13 @@ For similar_past_cases:
 - If you know the exact citation (AIR, SCC, Cr.LJ), include it in case_title.
 - Only include cases you are confident about — do not fabricate case names or citations.
 - If no closely matching cases come to mind, return an empty array [].
-"""
\ No newline at end of file
+"""
+
+LEGAL_ANALYSIS_REPAIR_PROMPT_TEMPLATE = """{original_prompt}
+
+Your previous answer could not be used because these keys were missing or invalid:
+{keys}
+
+Respond ONLY with a JSON object containing exactly these keys, matching the response schema.
+Do not repeat any other keys.
+"""
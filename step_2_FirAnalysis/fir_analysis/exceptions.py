@@ -31,7 +31,7 @@ class OllamaUnavailableError(HTTPException):
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=(
                 f"Ollama endpoint is not reachable: {detail}. "
-                f"Check OLLAMA_BASE_URL in your .env file."
+                f"Check OLLAMA_BASE_URL / OLLAMA_BACKENDS in your .env file."
             ),
         )
 
@@ -41,4 +41,20 @@ class GeminiUnavailableError(HTTPException):
         super().__init__(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Gemini API error: {detail}",
-        )
\ No newline at end of file
+        )
+
+
+class StageDeadlineError(HTTPException):
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=f"Request deadline exceeded: {detail}",
+        )
+
+
+class IdempotencyConflictError(HTTPException):
+    def __init__(self, detail: str):
+        super().__init__(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=detail,
+        )
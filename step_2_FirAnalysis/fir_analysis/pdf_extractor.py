@@ -22,6 +22,8 @@ import io
 import logging
 from pathlib import Path
 
+from core.tracing import span, traced
+
 logger = logging.getLogger(__name__)
 
 MIN_CHARS_FOR_DIGITAL = 100
@@ -63,6 +65,7 @@ def extract_text_from_pdf(file_bytes: bytes) -> tuple[str, str]:
         raise RuntimeError(f"OCR extraction failed: {exc}")
 
 
+@traced("pdf.extract_digital")
 def _extract_digital(file_bytes: bytes) -> str:
     """Extract text from a digital (text-layer) PDF using pdfplumber."""
     import pdfplumber
@@ -82,15 +85,17 @@ def _extract_ocr(file_bytes: bytes) -> str:
     from pdf2image import convert_from_bytes
     from PIL import Image
 
-    images: list[Image.Image] = convert_from_bytes(
-        file_bytes,
-        dpi=300,
-        fmt="jpeg",
-    )
+    with span("ocr.rasterise", dpi=300):
+        images: list[Image.Image] = convert_from_bytes(
+            file_bytes,
+            dpi=300,
+            fmt="jpeg",
+        )
 
     text_parts = []
     for i, image in enumerate(images):
-        page_text = pytesseract.image_to_string(image, lang="eng")
+        with span("ocr.page", page=i + 1):
+            page_text = pytesseract.image_to_string(image, lang="eng")
         if page_text.strip():
             text_parts.append(f"--- Page {i + 1} ---\n{page_text}")
 
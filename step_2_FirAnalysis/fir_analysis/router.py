@@ -1,18 +1,22 @@
 """
 FIR Analysis Router
 ───────────────────
-GET  /ping-ollama    → Test Ollama connectivity
+GET  /ping-ollama    → Test connectivity of every Ollama backend
 POST /mask-preview   → See exactly what is masked and what Gemini receives
 POST /analyse        → Full pipeline — text input  (extract → mask → Gemini)
+                       honours an Idempotency-Key header for safe client retries
 POST /analyse-pdf    → Full pipeline — PDF upload  (extract text → same pipeline)
 POST /extract-only   → Only Ollama extraction (no Gemini, no cloud)
 GET  /sections       → IPC section reference
 """
 
-from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-import httpx
+import time
 
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException, Header
+
+from core import metrics
 from core.config import settings
+from core.idempotency import idempotency_store, fingerprint, IdempotencyKeyConflict
 from core.llm import ollama_client
 from fir_analysis.schemas import (
     FIRAnalysisRequest,
@@ -22,7 +26,11 @@ from fir_analysis.schemas import (
 )
 from fir_analysis.dependencies import get_fir_service
 from fir_analysis.service import FIRAnalysisService
-from fir_analysis.exceptions import FIRTooLargeError, OllamaUnavailableError
+from fir_analysis.exceptions import (
+    FIRTooLargeError,
+    OllamaUnavailableError,
+    IdempotencyConflictError,
+)
 from fir_analysis.constants import IPC_DESCRIPTIONS
 from fir_analysis.pdf_extractor import extract_text_from_pdf, validate_pdf
 
@@ -35,22 +43,17 @@ router = APIRouter()
     summary="Test Ollama Connection",
 )
 async def ping_ollama():
-    try:
-        response = await ollama_client.generate(prompt="Reply with just the word PONG.")
-        return {
-            "status": "ok",
-            "ollama_url": settings.OLLAMA_BASE_URL,
-            "model": settings.OLLAMA_MODEL,
-            "response": response,
-        }
-    except httpx.ConnectError as exc:
-        raise OllamaUnavailableError(str(exc))
-    except httpx.HTTPStatusError as exc:
+    backends = await ollama_client.ping()
+    healthy = [b for b in backends if b["status"] == "ok"]
+    if not healthy:
         raise OllamaUnavailableError(
-            f"HTTP {exc.response.status_code} — {exc.response.text[:200]}"
+            "; ".join(f"{b['url']}: {b['last_error']}" for b in backends)
         )
-    except httpx.HTTPError as exc:
-        raise OllamaUnavailableError(f"{type(exc).__name__}: {exc}")
+    return {
+        "status": "ok" if len(healthy) == len(backends) else "degraded",
+        "model": settings.OLLAMA_MODEL,
+        "backends": backends,
+    }
 
 
 
@@ -86,9 +89,21 @@ async def mask_preview(
 async def analyse_fir(
     req: FIRAnalysisRequest,
     service: FIRAnalysisService = Depends(get_fir_service),
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
 ) -> FIRAnalysisResponse:
     _check_size(req.fir_text)
-    return await service.analyse(req.fir_text)
+    if not idempotency_key:
+        return await service.analyse(req.fir_text)
+
+    try:
+        return await idempotency_store.run(
+            scope="analyse",
+            key=idempotency_key,
+            request_fingerprint=fingerprint(req.fir_text, req.language),
+            func=lambda: service.analyse(req.fir_text),
+        )
+    except IdempotencyKeyConflict as exc:
+        raise IdempotencyConflictError(str(exc))
 
 
 
@@ -115,10 +130,13 @@ async def analyse_fir_pdf(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
+    started = time.perf_counter()
     try:
         fir_text, method = extract_text_from_pdf(file_bytes)
     except RuntimeError as exc:
+        metrics.observe_pdf_extraction("failed", time.perf_counter() - started)
         raise HTTPException(status_code=422, detail=str(exc))
+    metrics.observe_pdf_extraction(method, time.perf_counter() - started)
 
     if len(fir_text.strip()) < 50:
         raise HTTPException(
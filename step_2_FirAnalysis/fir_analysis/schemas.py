@@ -43,6 +43,46 @@ class FIRExtractedFields(BaseModel):
 
 
 
+class EntitiesForMasking(BaseModel):
+    person: list[str] = []
+    accused: list[str] = []
+    witness: list[str] = []
+    location: list[str] = []
+    phone: list[str] = []
+    aadhaar: list[str] = []
+    address: list[str] = []
+    vehicle: list[str] = []
+
+
+# Shape the local model is asked to return from the raw FIR text. Its JSON
+# schema is sent as the response format, so field descriptions double as
+# extraction instructions (a docstring would end up in the schema too).
+class FIRExtractionLLMOutput(BaseModel):
+    fir_number: Optional[str] = None
+    police_station: Optional[str] = None
+    district: Optional[str] = None
+    date_of_filing: Optional[str] = Field(None, description="YYYY-MM-DD")
+    date_of_incident: Optional[str] = Field(None, description="YYYY-MM-DD")
+    time_of_incident: Optional[str] = Field(None, description="HH:MM")
+    victim_name: Optional[str] = None
+    victim_age: Optional[str] = None
+    victim_gender: Optional[str] = Field(None, description="Male / Female / Other")
+    victim_address: Optional[str] = None
+    victim_contact: Optional[str] = None
+    accused_names: list[str] = []
+    witness_names: list[str] = []
+    incident_location: Optional[str] = None
+    incident_description: str = ""
+    ipc_sections: list[str] = []
+    other_acts: list[str] = []
+    case_nature: Optional[str] = None
+    entities_for_masking: EntitiesForMasking = Field(
+        default_factory=EntitiesForMasking,
+        description="Every personal detail that appears in incident_description, by category",
+    )
+
+
+
 class MaskEntry(BaseModel):
     token: str = Field(description="Token used in place of real value, e.g. [PERSON_A]")
     original: str = Field(description="The real value that was replaced")
@@ -111,26 +151,63 @@ class RelevantCasesResponse(BaseModel):
 
 
 
+class DurationEstimate(BaseModel):
+    district_court_min: int
+    district_court_typical: int
+    district_court_max: int
+    including_appeals_typical: int
+    notes: str
+
+
+class CostEstimate(BaseModel):
+    advocate_fees_min: int
+    advocate_fees_max: int
+    court_fees_approx: int
+    miscellaneous_min: int
+    miscellaneous_max: int
+    total_min: int
+    total_max: int
+    notes: str
+
+
+class SimilarPastCase(BaseModel):
+    case_title: str = Field(description='e.g. "State of Maharashtra vs Vijay Salaskar 2010", with citation if known')
+    court: str = Field(description='e.g. "Supreme Court of India" or "Bombay High Court"')
+    year: int
+    ipc_sections: list[str]
+    what_happened: str = Field(description="2-3 sentences describing the facts of that case")
+    judgement_summary: str = Field(description="2-3 sentences on what the court decided and why")
+    outcome: str = Field(description="Convicted / Acquitted / Settled / Compounded / Partially Convicted")
+    sentence_or_relief: str = Field(description='e.g. "3 years RI and fine of Rs 10,000"')
+    relevance_to_current_case: str = Field(description="1-2 sentences on why this case is relevant here")
+
+
 class LegalAnalysis(BaseModel):
-    estimated_duration_months: dict = Field(
+    estimated_duration_months: DurationEstimate = Field(
         description="min / max / typical months to resolve at trial, district, high court."
     )
-    cost_estimate_inr: dict = Field(
+    cost_estimate_inr: CostEstimate = Field(
         description="Ranges: advocate_fees / court_fees / misc / total."
     )
     win_probability_percent: int = Field(ge=0, le=100)
-    win_probability_reasoning: str
-    key_strengths: list[str]
+    win_probability_reasoning: str = Field(
+        description="3-5 sentences — mention relevant past cases if you know any"
+    )
+    key_strengths: list[str] = Field(description="At least 2")
     key_weaknesses: list[str]
-    recommended_action: str
+    recommended_action: str = Field(
+        description='One of "Proceed to Trial", "Negotiate Settlement", "Mediation / Lok Adalat", "Drop the Case"'
+    )
     recommended_action_reasoning: str
-    similar_past_cases: list[dict] = Field(
+    similar_past_cases: list[SimilarPastCase] = Field(
         default=[],
         description="Real Indian court cases similar to this one, with outcome and relevance"
     )
     required_documents: list[str]
     optional_but_helpful_documents: list[str]
-    immediate_next_steps: list[str]
+    immediate_next_steps: list[str] = Field(
+        description="Ordered list of 4-6 steps the victim should take now"
+    )
     important_caveats: list[str]
 
 
@@ -6,15 +6,24 @@ FIRAnalysisService
 3. [Gemini] Send masked payload for legal analysis.
 """
 
+import logging
 from datetime import date
 from typing import Any
 
 import httpx
+from pydantic import ValidationError
 
+from core.config import settings
+from core.metrics import timed_stage
 from core.llm import OllamaClient, GeminiClient
+from core.logging_config import redact_for_log
+from core.resilience import CircuitOpenError, DeadlineExceeded, stage
+from core.schema import json_schema
+from core.tracing import span, traced
 from core.security import PIIMasker
 from fir_analysis.schemas import (
     FIRExtractedFields,
+    FIRExtractionLLMOutput,
     MaskedFIRPayload,
     MaskPreviewResponse,
     MaskEntry,
@@ -25,15 +34,19 @@ from fir_analysis.constants import (
     EXTRACTION_SYSTEM_PROMPT,
     EXTRACTION_PROMPT_TEMPLATE,
     LEGAL_ANALYSIS_PROMPT_TEMPLATE,
+    LEGAL_ANALYSIS_REPAIR_PROMPT_TEMPLATE,
 )
 from fir_analysis.exceptions import (
     ExtractionError,
     LegalAnalysisError,
     OllamaUnavailableError,
     GeminiUnavailableError,
+    StageDeadlineError,
 )
 from fir_analysis import utils
 
+logger = logging.getLogger(__name__)
+
 
 def _safe_list(value: Any) -> list:
     if not value:
@@ -104,12 +117,24 @@ class FIRAnalysisService:
         )
 
 
+    @traced("stage.extract_fields")
+    @timed_stage("extract_fields")
     async def _extract_fields(self, fir_text: str) -> dict[str, Any]:
         prompt = EXTRACTION_PROMPT_TEMPLATE.format(fir_text=fir_text)
         try:
-            data = await self.ollama.generate_json(
-                prompt=prompt, system=EXTRACTION_SYSTEM_PROMPT
+            data = await stage(
+                "extraction",
+                settings.EXTRACT_STAGE_TIMEOUT_SECONDS,
+                self.ollama.generate_json(
+                    prompt=prompt,
+                    system=EXTRACTION_SYSTEM_PROMPT,
+                    schema=json_schema(FIRExtractionLLMOutput),
+                ),
             )
+        except DeadlineExceeded as exc:
+            raise StageDeadlineError(str(exc))
+        except CircuitOpenError as exc:
+            raise OllamaUnavailableError(str(exc))
         except httpx.ConnectError as exc:
             raise OllamaUnavailableError(str(exc))
         except httpx.ConnectTimeout as exc:
@@ -127,6 +152,8 @@ class FIRAnalysisService:
         return data
 
 
+    @traced("stage.build_and_mask")
+    @timed_stage("build_and_mask")
     def _build_and_mask(
         self, raw: dict[str, Any]
     ) -> tuple[FIRExtractedFields, MaskedFIRPayload, PIIMasker]:
@@ -182,23 +209,26 @@ class FIRAnalysisService:
             _add_to_bucket("location", [extracted.incident_location])
 
         masker = PIIMasker()
-        masked_description = masker.mask(
-            extracted.incident_description, entities_for_masking
-        )
+        with span("mask.pii", entity_types=len(entities_for_masking)):
+            masked_description = masker.mask(
+                extracted.incident_description, entities_for_masking
+            )
 
-        print("\n" + "="*60)
-        print("🔒 MASKING TABLE (never sent to cloud)")
-        print("="*60)
         entries = masker.get_mask_entries()
-        if entries:
-            for entry in entries:
-                print(f"  [{entry['entity_type'].upper()}]  {entry['original']}  →  {entry['token']}")
-        else:
-            print("  (nothing masked — no PII found in description)")
-        print("-"*60)
-        print(f"  Original : {extracted.incident_description}")
-        print(f"  Masked   : {masked_description}")
-        print("="*60 + "\n")
+        logger.info(
+            "FIR description masked",
+            extra={"masked_entities": len(entries), "sample_rate": settings.LOG_SAMPLE_RATE},
+        )
+        if logger.isEnabledFor(logging.DEBUG):
+            # Originals stay on the server: only tokens, types and redacted text are logged.
+            logger.debug(
+                "Masking table",
+                extra={
+                    "tokens": [f"{e['entity_type']}:{e['token']}" for e in entries],
+                    "original_chars": len(extracted.incident_description),
+                    "masked": redact_for_log(masked_description, keep_chars=400),
+                },
+            )
 
         district_label = " / ".join(
             filter(None, [extracted.police_station, extracted.district])
@@ -216,6 +246,8 @@ class FIRAnalysisService:
         return extracted, masked_payload, masker
 
 
+    @traced("stage.legal_analysis")
+    @timed_stage("legal_analysis")
     async def _legal_analysis(self, payload: MaskedFIRPayload) -> LegalAnalysis:
 
         prompt = LEGAL_ANALYSIS_PROMPT_TEMPLATE.format(
@@ -228,17 +260,50 @@ class FIRAnalysisService:
             masked_description=payload.masked_description,
         )
 
-        print("\n" + "="*60)
-        print("📤 PROMPT SENT TO GEMINI")
-        print("="*60)
-        print(prompt)
-        print("="*60 + "\n")
+        logger.debug(
+            "Prompt sent to Gemini",
+            extra={"prompt_chars": len(prompt), "prompt": redact_for_log(prompt, keep_chars=400)},
+        )
+
+        try:
+            data = await stage(
+                "legal_analysis",
+                settings.LEGAL_STAGE_TIMEOUT_SECONDS,
+                self.gemini.generate_json(prompt, schema=json_schema(LegalAnalysis)),
+            )
+        except DeadlineExceeded as exc:
+            raise StageDeadlineError(str(exc))
+        except Exception as exc:
+            raise GeminiUnavailableError(str(exc))
 
         try:
-            data = await self.gemini.generate_json(prompt)
+            return LegalAnalysis(**data)
+        except ValidationError as exc:
+            bad_keys = sorted({str(err["loc"][0]) for err in exc.errors() if err["loc"]})
+            if not bad_keys:
+                # A model-level error (e.g. not an object) has no key to regenerate.
+                raise LegalAnalysisError(f"Schema mismatch: {exc}")
+
+        # Regenerate only the keys that failed instead of retrying the whole call.
+        logger.info("Repairing legal analysis keys", extra={"keys": bad_keys})
+        repair_prompt = LEGAL_ANALYSIS_REPAIR_PROMPT_TEMPLATE.format(
+            original_prompt=prompt,
+            keys="\n".join(f"- {key}" for key in bad_keys),
+        )
+        try:
+            patch = await stage(
+                "legal_analysis_repair",
+                settings.LEGAL_STAGE_TIMEOUT_SECONDS,
+                self.gemini.generate_json(
+                    repair_prompt, schema=json_schema(LegalAnalysis, only=bad_keys)
+                ),
+            )
+        except DeadlineExceeded as exc:
+            raise StageDeadlineError(str(exc))
         except Exception as exc:
             raise GeminiUnavailableError(str(exc))
 
+        data.update({key: patch[key] for key in bad_keys if key in patch})
         try:
             return LegalAnalysis(**data)
         except Exception as exc:
@@ -71,8 +71,3 @@ def estimate_page_count(text: str) -> int:
     """Rough estimate: ~300 words per page."""
     words = len(text.split())
     return max(1, words // 300)
-
-
-def redact_for_log(text: str, keep_chars: int = 80) -> str:
-    """Truncate FIR text for safe logging (avoid PII in logs)."""
-    return text[:keep_chars].replace("\n", " ") + "…"
\ No newline at end of file
@@ -1,16 +1,40 @@
-from fastapi import FastAPI
+import asyncio
+import logging
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
 
+from core import metrics
+
 from core.config import settings
+from core.idempotency import idempotency_store
+from core.llm import gemini_client
+from core.llm_pool import ollama_pool
+from core.logging_config import setup_logging
+from core.resilience import deadline_scope
+from core import tracing
 from fir_analysis.router import router as fir_router
 
+logger = logging.getLogger(__name__)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    print(f"🚀 FIR Analyser starting — Ollama: {settings.OLLAMA_BASE_URL}")
+    log_listener = setup_logging()
+    tracing.setup_tracing("fir-analyser", tracer_name="fir_analyser")
+    logger.info(
+        "FIR Analyser starting",
+        extra={"ollama_backends": [b.base_url for b in ollama_pool.backends], "debug": settings.DEBUG},
+    )
+    ollama_pool.start_health_checks(settings.OLLAMA_MODEL, settings.OLLAMA_HEALTH_INTERVAL_SECONDS)
+    if settings.WARM_UP_ON_STARTUP:
+        await asyncio.to_thread(gemini_client.warm_up)
     yield
-    print("🛑 FIR Analyser shutting down")
+    logger.info("FIR Analyser shutting down")
+    await ollama_pool.aclose()
+    tracing.shutdown_tracing()
+    log_listener.stop()
 
 
 app = FastAPI(
@@ -29,11 +53,43 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["traceparent"],
 )
 
+
+metrics.instrument(app)
+
+
+@app.middleware("http")
+async def request_deadline(request: Request, call_next):
+    """Start the request's deadline: REQUEST_DEADLINE_SECONDS, or less if X-Request-Timeout asks for it."""
+    seconds = settings.REQUEST_DEADLINE_SECONDS
+    try:
+        seconds = min(seconds, float(request.headers["x-request-timeout"]))
+    except (KeyError, ValueError):
+        pass
+    with deadline_scope(seconds if seconds > 0 else None):
+        return await call_next(request)
+
+
+tracing.trace_requests(app)
+
+
 app.include_router(fir_router, prefix="/api/v1/fir", tags=["FIR Analysis"])
 
 
+metrics.register_cache(
+    "idempotency",
+    lambda: (idempotency_store.replayed + idempotency_store.joined, idempotency_store.executed),
+)
+
+
+@app.get("/metrics", include_in_schema=False)
+async def prometheus_metrics():
+    body, content_type = metrics.render()
+    return Response(content=body, media_type=content_type)
+
+
 @app.get("/health")
 async def health():
     return {"status": "ok", "service": "FIR Analyser"}
\ No newline at end of file
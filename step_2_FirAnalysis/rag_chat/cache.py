@@ -0,0 +1,123 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+import numpy as np
+from .config import (
+    RAG_CACHE_SIMILARITY_THRESHOLD,
+    RAG_CACHE_TTL_SECONDS,
+    RAG_CACHE_MAX_ENTRIES_PER_PDF,
+    RAG_CACHE_MAX_PDFS,
+)
+
+
+class SemanticResponseCache:
+    """
+    Per-PDF cache of answers keyed by question embedding.
+
+    A lookup hits when a stored question for the same pdf_id has cosine
+    similarity >= threshold with the incoming one. Entries expire after
+    ttl_seconds; each PDF keeps at most max_entries_per_pdf (LRU) and at
+    most max_pdfs documents are tracked (LRU).
+
+    invalidate() bumps the PDF's generation. A turn reads generation() before
+    it retrieves, and store() drops the answer if the PDF was re-embedded in
+    the meantime, so a stale answer never lands after an invalidation.
+    """
+
+    def __init__(
+        self,
+        threshold: float = RAG_CACHE_SIMILARITY_THRESHOLD,
+        ttl_seconds: float = RAG_CACHE_TTL_SECONDS,
+        max_entries_per_pdf: int = RAG_CACHE_MAX_ENTRIES_PER_PDF,
+        max_pdfs: int = RAG_CACHE_MAX_PDFS,
+    ):
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        self.max_entries_per_pdf = max_entries_per_pdf
+        self.max_pdfs = max_pdfs
+        # pdf_id -> OrderedDict[question, (unit embedding, response, stored_at)]
+        self._entries: "OrderedDict[str, OrderedDict[str, tuple]]" = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._stale_writes = 0
+
+    @staticmethod
+    def _normalise(embedding) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def lookup(self, pdf_id: str, embedding) -> Optional[dict]:
+        query = self._normalise(embedding)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._entries.get(pdf_id)
+            if bucket:
+                self._expire(bucket, now)
+            if not bucket:
+                self._misses += 1
+                return None
+
+            questions = list(bucket.keys())
+            matrix = np.stack([bucket[q][0] for q in questions])
+            similarities = matrix @ query
+            best = int(np.argmax(similarities))
+            if similarities[best] < self.threshold:
+                self._misses += 1
+                return None
+
+            question = questions[best]
+            bucket.move_to_end(question)
+            self._entries.move_to_end(pdf_id)
+            self._hits += 1
+            response = dict(bucket[question][1])
+            response["cache_similarity"] = round(float(similarities[best]), 3)
+            return response
+
+    def generation(self, pdf_id: str) -> int:
+        with self._lock:
+            return self._generations.get(pdf_id, 0)
+
+    def store(self, pdf_id: str, question: str, embedding, response: dict, generation: int) -> None:
+        with self._lock:
+            if generation != self._generations.get(pdf_id, 0):
+                self._stale_writes += 1
+                return
+            bucket = self._entries.setdefault(pdf_id, OrderedDict())
+            bucket[question] = (self._normalise(embedding), dict(response), time.monotonic())
+            bucket.move_to_end(question)
+            self._entries.move_to_end(pdf_id)
+            while len(bucket) > self.max_entries_per_pdf:
+                bucket.popitem(last=False)
+                self._evictions += 1
+            while len(self._entries) > self.max_pdfs:
+                _, dropped = self._entries.popitem(last=False)
+                self._evictions += len(dropped)
+
+    def invalidate(self, pdf_id: str) -> None:
+        """Drop every cached answer for a PDF, e.g. after it is re-embedded."""
+        with self._lock:
+            self._entries.pop(pdf_id, None)
+            self._generations[pdf_id] = self._generations.get(pdf_id, 0) + 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "hit_rate": round(self._hits / lookups, 3) if lookups else 0.0,
+                "evictions": self._evictions,
+                "stale_writes": self._stale_writes,
+                "cached_pdfs": len(self._entries),
+                "cached_answers": sum(len(bucket) for bucket in self._entries.values()),
+            }
+
+    def _expire(self, bucket: OrderedDict, now: float) -> None:
+        for question in [q for q, (_, _, stored_at) in bucket.items() if now - stored_at >= self.ttl_seconds]:
+            del bucket[question]
+            self._evictions += 1
@@ -0,0 +1,205 @@
+"""
+FIR-layout-aware chunking for RAG ingestion.
+
+IF1 forms are a fixed sequence of numbered fields ("2. Acts & Sections:",
+"6. Complainant / Informant:", "12. FIR Contents:" ...). The text is cut at
+those headings, and the `--- Page N ---` markers from
+fir_analysis.pdf_extractor are stripped and turned into page metadata.
+Adjacent short sections are packed into one chunk up to chunk_size with no
+overlap. A section is only split further when it is larger than chunk_size
+on its own. Field rows that hold no text, such as signature lines, are dropped.
+
+Every chunk carries metadata {"sections": [...], "page_start", "page_end"},
+which vectorstore.search_with_scores can filter on. Text with fewer than
+two IF1 headings in order, such as a plain narrative, becomes a single
+"narrative" section.
+"""
+
+import re
+from dataclasses import dataclass
+
+from langchain_core.documents import Document
+
+# (section, IF1 field number, label start, full label). A numbered line opens
+# a field when the label start is followed by a colon ("6. Name: ...") or the
+# line holds the full label ("14. Signature / Thumb-impression of
+# Complainant"), so "2. Sections of the crowd ..." in a narrative does not.
+# Several numbers can share a section (9 and 10 are both property).
+IF1_HEADINGS = [
+    ("header", 1, r"dist(?:rict)?\b|p\.?\s?s\b|police station", None),
+    ("acts_sections", 2, r"acts?\b|sections?\b", r"acts?\s*(?:&|and)\s*sections?"),
+    ("occurrence", 3, r"occurrence", r"occurrence of offen[cs]e"),
+    ("information_type", 4, r"type", r"type of information"),
+    ("place", 5, r"place", r"place of occurrence"),
+    ("complainant", 6, r"complainant|informant|name\b", r"complainant\s*/\s*informant"),
+    ("accused", 7, r"accused|details of known", r"details of known\s*/\s*suspected\s*/\s*unknown accused"),
+    ("delay", 8, r"(?:reasons? for )?delay", r"reasons? for delay in reporting"),
+    ("property", 9, r"particulars|propert", r"particulars of propert(?:y|ies) stolen(?:\s*/\s*involved)?"),
+    ("property", 10, r"total value", r"total value of propert(?:y|ies)(?: stolen)?"),
+    ("inquest", 11, r"inquest|u\.?\s?d\.?\b", r"inquest report(?:\s*/\s*u\.?\s?d\.?\s*case no\.?)?"),
+    ("narrative", 12, r"(?:f\.?\s?i\.?\s?r\.?\s)?contents", r"(?:f\.?\s?i\.?\s?r\.?\s)?contents"),
+    ("action_taken", 13, r"action taken", r"action taken"),
+    ("signature", 14, r"signature", r"signature\s*/\s*thumb[- ]?impression of (?:the )?complainant"),
+    ("despatch", 15, r"date\s*(?:&|and)\s*time of despatch|despatch",
+     r"date\s*(?:&|and)\s*time of despatch to (?:the )?court"),
+]
+SECTION_NAMES = tuple(dict.fromkeys(name for name, _, _, _ in IF1_HEADINGS))
+# A form needs at least this many fields before its lines are read as headings.
+MIN_HEADINGS = 2
+
+
+def _heading_pattern(number: int, label: str, full: str | None) -> re.Pattern:
+    ends = [rf"(?:{label})[^:\n]{{0,40}}:"]
+    if full:
+        ends.append(rf"(?:{full})\s*(?:[:(]|$)")
+    return re.compile(rf"^\s*{number}\s*[.)]\s*(?:{'|'.join(ends)})", re.IGNORECASE)
+
+
+_HEADING_RE = {
+    number: (name, _heading_pattern(number, label, full))
+    for name, number, label, full in IF1_HEADINGS
+}
+_LINE_START_NUMBER = re.compile(r"^\s*(\d{1,2})\s*[.)]")
+_PAGE_MARKER = re.compile(r"^--- Page (\d+) ---$")
+# Sentence / line boundaries; "3." or "Rs 1." style numbers do not end a sentence.
+_SENTENCE_BREAK = re.compile(r"(?<=[^\d\s][.!?:])\s+|\s*\n\s*")
+
+
+@dataclass
+class _Section:
+    name: str
+    text: str
+    page_start: int
+    page_end: int
+
+
+def _heading(line: str, last_number: int) -> tuple[str, int] | None:
+    """
+    (section, number) when the line opens an IF1 field. Numbers must increase
+    through the form, so a numbered list inside the narrative is not taken
+    for a heading. A new "1." starts the next form.
+    """
+    match = _LINE_START_NUMBER.match(line)
+    if not match:
+        return None
+    number = int(match.group(1))
+    if number not in _HEADING_RE or not (number > last_number or number == 1):
+        return None
+    name, pattern = _HEADING_RE[number]
+    return (name, number) if pattern.match(line) else None
+
+
+def _is_form(lines: list[str]) -> bool:
+    """True when the text has at least MIN_HEADINGS IF1 field headings in order."""
+    found, number = 0, 0
+    for line in lines:
+        heading = _heading(line, number)
+        if heading:
+            found, number = found + 1, heading[1]
+            if found >= MIN_HEADINGS:
+                return True
+    return False
+
+
+def _has_content(text: str) -> bool:
+    # Drop a field whose body is empty or only blanks/underscores.
+    body = re.sub(r"^\s*\d{1,2}\s*[.)][^:\n]*:?", "", text, count=1)
+    return bool(re.search(r"[^\W_]", body))
+
+
+def split_sections(text: str) -> list[_Section]:
+    sections: list[_Section] = []
+    lines: list[str] = []
+    name, number, page = "narrative", 0, 1
+    start_page = end_page = None
+    text_lines = text.splitlines()
+    form = _is_form(text_lines)
+
+    def flush():
+        body = "\n".join(lines).strip()
+        if body and (name == "narrative" or _has_content(body)):
+            sections.append(_Section(name, body, start_page, end_page))
+
+    for line in text_lines:
+        marker = _PAGE_MARKER.match(line.strip())
+        if marker:
+            page = int(marker.group(1))
+            continue
+        heading = form and _heading(line, number)
+        if heading:
+            flush()
+            (name, number), lines, start_page = heading, [], None
+        lines.append(line)
+        if line.strip():
+            start_page = start_page or page
+            end_page = page
+    flush()
+
+    # Text above the first field (title, "Under Section 154 Cr.P.C.") belongs
+    # to the form header, not the narrative.
+    if form and sections and sections[0].name == "narrative" and not _heading(sections[0].text, 0):
+        sections[0].name = "header"
+    return sections
+
+
+def _split_long(text: str, size: int) -> list[str]:
+    """Pack sentences (hard-wrapping any longer than size) into pieces of at most size."""
+    units = []
+    for sentence in filter(None, _SENTENCE_BREAK.split(text)):
+        while len(sentence) > size:
+            cut = sentence.rfind(" ", 0, size)
+            cut = cut if cut > 0 else size
+            units.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        units.append(sentence)
+
+    pieces, current = [], ""
+    for unit in units:
+        if current and len(current) + 1 + len(unit) > size:
+            pieces.append(current)
+            current = unit
+        else:
+            current = f"{current} {unit}" if current else unit
+    if current:
+        pieces.append(current)
+    return pieces
+
+
+def _document(parts: list[_Section]) -> Document:
+    return Document(
+        page_content="\n".join(part.text for part in parts),
+        metadata={
+            "sections": list(dict.fromkeys(part.name for part in parts)),
+            "page_start": parts[0].page_start,
+            "page_end": parts[-1].page_end,
+        },
+    )
+
+
+def split_fir_text(text: str, chunk_size: int = 1000) -> list[Document]:
+    docs: list[Document] = []
+    packed: list[_Section] = []
+    packed_len = 0
+
+    for section in split_sections(text):
+        if len(section.text) > chunk_size:
+            if packed:
+                docs.append(_document(packed))
+                packed, packed_len = [], 0
+            pieces = [
+                _Section(section.name, piece, section.page_start, section.page_end)
+                for piece in _split_long(section.text, chunk_size)
+            ]
+            docs.extend(_document([piece]) for piece in pieces[:-1])
+            # The tail piece can still take the short sections that follow.
+            packed, packed_len = [pieces[-1]], len(pieces[-1].text)
+            continue
+        if packed and packed_len + 1 + len(section.text) > chunk_size:
+            docs.append(_document(packed))
+            packed, packed_len = [], 0
+        packed.append(section)
+        packed_len += len(section.text) + (1 if packed_len else 0)
+
+    if packed:
+        docs.append(_document(packed))
+    return docs
@@ -1,9 +1,88 @@
 from dotenv import load_dotenv
 import os
-import chromadb
+import threading
 
 load_dotenv()
 
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 
-chroma_client = chromadb.PersistentClient(path="./chroma_db")
+# Chat session registry — idle sessions are dropped after the TTL and the
+# least recently used session is evicted once the cap is reached.
+RAG_SESSION_TTL_SECONDS = float(os.getenv("RAG_SESSION_TTL_SECONDS", "1800"))
+RAG_MAX_SESSIONS = int(os.getenv("RAG_MAX_SESSIONS", "256"))
+
+# Gemini transport used by rag_chat.llm — connections are pooled and reused
+# across chat turns; 429/5xx responses are retried with jittered backoff.
+GEMINI_TIMEOUT_SECONDS = float(os.getenv("GEMINI_TIMEOUT_SECONDS", "60"))
+GEMINI_CONNECT_TIMEOUT_SECONDS = float(os.getenv("GEMINI_CONNECT_TIMEOUT_SECONDS", "10"))
+GEMINI_MAX_RETRIES = int(os.getenv("GEMINI_MAX_RETRIES", "3"))
+GEMINI_BACKOFF_BASE_SECONDS = float(os.getenv("GEMINI_BACKOFF_BASE_SECONDS", "0.5"))
+GEMINI_MAX_CONNECTIONS = int(os.getenv("GEMINI_MAX_CONNECTIONS", "100"))
+# Host override for a local stand-in (benchmarks/mock_llm_server.py).
+GEMINI_API_ENDPOINT = os.getenv("GEMINI_API_ENDPOINT", "https://generativelanguage.googleapis.com").rstrip("/")
+
+# Retrieval — k chunks are fetched with their similarity scores and only
+# chunks scoring at least RAG_SCORE_THRESHOLD (cosine, 0-1) reach the prompt.
+# RAG_SEARCH_TYPE is "similarity" or "mmr" (diversified over RAG_FETCH_K).
+RAG_RETRIEVAL_K = int(os.getenv("RAG_RETRIEVAL_K", "3"))
+RAG_SEARCH_TYPE = os.getenv("RAG_SEARCH_TYPE", "similarity")
+RAG_FETCH_K = int(os.getenv("RAG_FETCH_K", "20"))
+RAG_MMR_LAMBDA = float(os.getenv("RAG_MMR_LAMBDA", "0.5"))
+RAG_SCORE_THRESHOLD = float(os.getenv("RAG_SCORE_THRESHOLD", "0.35"))
+
+# Embeddings (rag_chat/embeddings.py) — RAG_EMBEDDING_BACKEND is "torch"
+# (sentence-transformers) or "onnx" (int8 model exported by
+# `python -m rag_chat.export_onnx` into RAG_ONNX_MODEL_DIR).
+# RAG_EMBEDDING_THREADS = 0 leaves the runtime's default thread count.
+RAG_EMBEDDING_BACKEND = os.getenv("RAG_EMBEDDING_BACKEND", "torch").lower()
+RAG_EMBEDDING_MODEL = os.getenv("RAG_EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+RAG_ONNX_MODEL_DIR = os.getenv("RAG_ONNX_MODEL_DIR", "models/all-MiniLM-L6-v2-onnx-int8")
+RAG_EMBEDDING_BATCH_SIZE = int(os.getenv("RAG_EMBEDDING_BATCH_SIZE", "32"))
+RAG_EMBEDDING_THREADS = int(os.getenv("RAG_EMBEDDING_THREADS", "0"))
+
+# Chunking at ingestion: "fir" cuts on IF1 field headings and page markers
+# (rag_chat/chunking.py, no overlap); "recursive" is the generic character
+# splitter with RAG_CHUNK_OVERLAP.
+RAG_CHUNKING = os.getenv("RAG_CHUNKING", "fir").lower()
+RAG_CHUNK_SIZE = int(os.getenv("RAG_CHUNK_SIZE", "1000"))
+RAG_CHUNK_OVERLAP = int(os.getenv("RAG_CHUNK_OVERLAP", "100"))
+
+# FAISS index type per deployment (rag_chat/faiss_index.py): flat (exact),
+# hnsw (faster search on large stores) or ivfpq (compressed, trained).
+# Existing stores keep their type until `python -m rag_chat.rebuild_index`.
+RAG_FAISS_INDEX = os.getenv("RAG_FAISS_INDEX", "flat").lower()
+RAG_HNSW_M = int(os.getenv("RAG_HNSW_M", "32"))
+RAG_HNSW_EF_CONSTRUCTION = int(os.getenv("RAG_HNSW_EF_CONSTRUCTION", "80"))
+RAG_HNSW_EF_SEARCH = int(os.getenv("RAG_HNSW_EF_SEARCH", "64"))
+RAG_IVF_NLIST = int(os.getenv("RAG_IVF_NLIST", "256"))
+RAG_IVF_NPROBE = int(os.getenv("RAG_IVF_NPROBE", "16"))
+RAG_PQ_M = int(os.getenv("RAG_PQ_M", "48"))          # sub-quantisers; must divide the embedding size
+RAG_PQ_NBITS = int(os.getenv("RAG_PQ_NBITS", "8"))
+
+# Semantic response cache — a new question whose embedding is within
+# RAG_CACHE_SIMILARITY_THRESHOLD (cosine) of an earlier question on the same
+# PDF is answered from the cache, as long as the session has no history yet.
+RAG_CACHE_ENABLED = os.getenv("RAG_CACHE_ENABLED", "true").lower() == "true"
+RAG_CACHE_SIMILARITY_THRESHOLD = float(os.getenv("RAG_CACHE_SIMILARITY_THRESHOLD", "0.92"))
+RAG_CACHE_TTL_SECONDS = float(os.getenv("RAG_CACHE_TTL_SECONDS", "86400"))
+RAG_CACHE_MAX_ENTRIES_PER_PDF = int(os.getenv("RAG_CACHE_MAX_ENTRIES_PER_PDF", "64"))
+RAG_CACHE_MAX_PDFS = int(os.getenv("RAG_CACHE_MAX_PDFS", "256"))
+
+# Build the embedding model and the Chroma client at startup (warm_up in
+# controllers) instead of on the first request that needs them.
+RAG_WARM_UP = os.getenv("RAG_WARM_UP", "false").lower() == "true"
+
+_chroma_client = None
+_chroma_lock = threading.Lock()
+
+
+def get_chroma_client():
+    """The Chroma PersistentClient, opened on first use."""
+    global _chroma_client
+    if _chroma_client is None:
+        with _chroma_lock:
+            if _chroma_client is None:
+                import chromadb
+
+                _chroma_client = chromadb.PersistentClient(path="./chroma_db")
+    return _chroma_client
@@ -1,28 +1,37 @@
-from .vectorstore import get_vectorstore, vectorstores, embed_text_for_pdf
-from .memory import ChromaDBChatMemory
+import asyncio
+import json
+from operator import itemgetter
+from .vectorstore import get_vectorstore, vectorstores, embed_text_for_pdf, search_with_scores, embed_query, get_embeddings
+from .config import RAG_SCORE_THRESHOLD, RAG_CACHE_ENABLED, get_chroma_client
+from .memory import SessionRegistry
+from .cache import SemanticResponseCache
 from .llm import GeminiChatLLM
 from langchain_core.messages import HumanMessage, AIMessage
 from .utils import extract_text_from_file
+from core import metrics
 
-memory_instances = {}
+session_registry = SessionRegistry()
+response_cache = SemanticResponseCache()
+
+metrics.register_cache("rag_sessions", lambda: itemgetter("reused", "created")(session_registry.stats()))
+metrics.register_cache("rag_answers", lambda: itemgetter("hits", "misses")(response_cache.stats()))
+
+def warm_up():
+    """Load the embedding model and open Chroma before the first request needs them."""
+    get_embeddings().embed_query("warm up")
+    get_chroma_client()
 
 def embed_controller(text: str, pdf_id: str):
     embed_text_for_pdf(text, pdf_id)
+    response_cache.invalidate(pdf_id)
     return {"message": f"Embedding stored for PDF ID: {pdf_id}"}
 
-def _calculate_relevance_score(query: str, docs: list) -> float:
-    """Calculate relevance score based on document similarity and content quality"""
-    if not docs:
-        return 0.0
-    
-    avg_length = sum(len(doc.page_content) for doc in docs) / len(docs)
-    
-    if avg_length < 100:
+def _calculate_relevance_score(scored_docs: list) -> float:
+    """Relevance of the retrieval = similarity of the best matching chunk"""
+    if not scored_docs:
         return 0.0
-    
-    relevance = min(avg_length / 500, 1.0)  
-    
-    return relevance
+
+    return max(score for _, score in scored_docs)
 
 def _is_learning_related_query(query: str) -> bool:
     """Check if query is related to learning/roadmaps/skills"""
@@ -37,32 +46,51 @@ def _is_learning_related_query(query: str) -> bool:
     query_lower = query.lower()
     return any(keyword in query_lower for keyword in learning_keywords)
 
-def generate_controller(pdf_id: str, message: str, session_id: str):
-    vectorstore = get_vectorstore(pdf_id) 
+async def _prepare_turn(pdf_id: str, message: str, session_id: str, sections: list[str] | None = None) -> dict:
+    """Retrieve context and build the prompt for one chat turn."""
+    # Read before retrieval: if the PDF is re-embedded while this turn runs,
+    # the answer it produces must not be cached.
+    cache_generation = response_cache.generation(pdf_id)
+    # FAISS loads and Chroma reads block, so they run off the event loop.
+    vectorstore = await asyncio.to_thread(get_vectorstore, pdf_id)
     if not vectorstore:
         raise ValueError("No embeddings found for this PDF ID")
 
-    session_key = f"{pdf_id}_{session_id}"
-    if session_key not in memory_instances:
-        memory_instances[session_key] = ChromaDBChatMemory(pdf_id, session_id)
-
-    memory = memory_instances[session_key]
+    memory = await asyncio.to_thread(session_registry.get, pdf_id, session_id)
+    history = await asyncio.to_thread(memory.get_recent_messages)
+    query_embedding = await asyncio.to_thread(embed_query, message)
+
+    # A cached answer is only valid when no earlier turn could change it, and
+    # answers restricted to some FIR sections are not shared with unfiltered ones.
+    cacheable = RAG_CACHE_ENABLED and not history and not sections
+    turn = {
+        "pdf_id": pdf_id,
+        "memory": memory,
+        "query_embedding": query_embedding,
+        "cacheable": cacheable,
+        "cache_generation": cache_generation,
+        "cached": response_cache.lookup(pdf_id, query_embedding) if cacheable else None,
+    }
+    if turn["cached"]:
+        return turn
 
-    retriever = vectorstore.as_retriever(search_kwargs={"k": 3})
-    docs = retriever.invoke(message)
+    scored_docs = await asyncio.to_thread(
+        search_with_scores, vectorstore, message, query_embedding=query_embedding, sections=sections
+    )
+    # Chunks below the threshold would only pad the prompt — leave them out.
+    docs = [doc for doc, score in scored_docs if score >= RAG_SCORE_THRESHOLD]
 
     context = "\n\n".join(d.page_content for d in docs)
-    history = memory.get_recent_messages()
 
     history_text = ""
     for msg in history[-6:]:  
         role = "Human" if isinstance(msg, HumanMessage) else "Assistant"
         history_text += f"{role}: {msg.content}\n"
 
-    relevance_score = _calculate_relevance_score(message, docs)
+    relevance_score = _calculate_relevance_score(scored_docs)
     is_learning_query = _is_learning_related_query(message)
     
-    has_relevant_context = relevance_score > 0.4 and is_learning_query
+    has_relevant_context = bool(docs) and is_learning_query
 
     if has_relevant_context:
         prompt = f"""Context from learning resource:
@@ -102,24 +130,99 @@ Can I help you with your learning goals instead?"
 """
         mode = "out_of_scope"
 
-    llm = GeminiChatLLM()
-    answer = llm.invoke(prompt)
-
-    memory.add_message(HumanMessage(content=message))
-    memory.add_message(AIMessage(content=answer))
+    turn.update({
+        "docs": docs,
+        "prompt": prompt,
+        "mode": mode,
+        "relevance_score": relevance_score,
+    })
+    return turn
+
+async def _finish_turn(turn: dict, message: str, answer: str, session_id: str) -> dict:
+    """Persist the exchange to chat memory and build the response body."""
+    memory = turn["memory"]
+    await asyncio.to_thread(memory.add_message, HumanMessage(content=message))
+    await asyncio.to_thread(memory.add_message, AIMessage(content=answer))
+
+    if turn["cached"]:
+        result = {k: turn["cached"][k] for k in ("source_documents", "relevance_score", "context_type")}
+    else:
+        result = {
+            "source_documents": len(turn["docs"]),
+            "relevance_score": round(turn["relevance_score"], 2),
+            "context_type": turn["mode"],
+        }
+        # Only answers grounded in the document are worth reusing.
+        if turn["cacheable"] and turn["mode"] == "rag":
+            response_cache.store(
+                turn["pdf_id"],
+                message,
+                turn["query_embedding"],
+                dict(result, answer=answer),
+                generation=turn["cache_generation"],
+            )
 
     return {
         "answer": answer,
-        "source_documents": len(docs),
-        "relevance_score": round(relevance_score, 2),
-        "context_type": mode,  
+        **result,
+        "cached": bool(turn["cached"]),
         "session_id": session_id,
-        "message_count": memory.get_message_count()
+        "message_count": await asyncio.to_thread(memory.get_message_count)
     }
 
+def _sse(event: str, data: dict) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+async def generate_controller(pdf_id: str, message: str, session_id: str, sections: list[str] | None = None):
+    turn = await _prepare_turn(pdf_id, message, session_id, sections)
+
+    if turn["cached"]:
+        answer = turn["cached"]["answer"]
+    else:
+        llm = GeminiChatLLM()
+        answer = await llm.ainvoke(turn["prompt"])
+
+    return await _finish_turn(turn, message, answer, session_id)
+
+async def generate_stream_controller(pdf_id: str, message: str, session_id: str, sections: list[str] | None = None):
+    """
+    Same turn as generate_controller, but returns an async iterator of
+    server-sent events: one "token" event per Gemini chunk, then a "done"
+    event carrying the usual response body once the answer is persisted.
+    """
+    turn = await _prepare_turn(pdf_id, message, session_id, sections)
+
+    async def event_stream():
+        if turn["cached"]:
+            answer = turn["cached"]["answer"]
+            yield _sse("token", {"text": answer})
+            yield _sse("done", await _finish_turn(turn, message, answer, session_id))
+            return
+
+        llm = GeminiChatLLM()
+        parts = []
+        try:
+            async for text in llm.astream(turn["prompt"]):
+                parts.append(text)
+                yield _sse("token", {"text": text})
+        except Exception as e:
+            yield _sse("error", {"detail": str(e)})
+            return
+
+        yield _sse("done", await _finish_turn(turn, message, "".join(parts), session_id))
+
+    return event_stream()
+
+def session_stats_controller():
+    return session_registry.stats()
+
+def cache_stats_controller():
+    return response_cache.stats()
+
 async def embed_file_controller(file, pdf_id: str):
     text = await extract_text_from_file(file)
     embed_text_for_pdf(text, pdf_id)
+    response_cache.invalidate(pdf_id)
     return {
         "message": f"File embedded successfully for PDF ID: {pdf_id}",
         "chars_embedded": len(text)
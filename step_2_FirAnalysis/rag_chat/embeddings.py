@@ -0,0 +1,101 @@
+"""
+Embedding backends for rag_chat, selected with RAG_EMBEDDING_BACKEND:
+
+  torch — HuggingFaceEmbeddings (sentence-transformers on PyTorch)
+  onnx  — the same model exported to ONNX and int8-quantised
+          (python -m rag_chat.export_onnx), run on ONNX Runtime
+
+Both produce unit-normalised mean-pooled vectors, so FAISS indexes built with
+one backend can be searched with the other (benchmarks/test_bench_embeddings.py
+checks cosine parity).
+"""
+
+import os
+from typing import List
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+from .config import (
+    RAG_EMBEDDING_BACKEND,
+    RAG_EMBEDDING_BATCH_SIZE,
+    RAG_EMBEDDING_MODEL,
+    RAG_EMBEDDING_THREADS,
+    RAG_ONNX_MODEL_DIR,
+)
+
+MAX_SEQ_LENGTH = 256  # all-MiniLM-L6-v2's sentence-transformers limit
+
+
+class OnnxEmbeddings(Embeddings):
+    """
+    Runs an exported transformer on ONNX Runtime with mean pooling and L2
+    normalisation — the sentence-transformers pipeline for MiniLM, minus torch.
+
+    model_dir holds model.onnx and tokenizer.json (see rag_chat/export_onnx.py).
+    """
+
+    def __init__(self, model_dir: str, batch_size: int = 32, threads: int = 0):
+        import onnxruntime as ort
+        from tokenizers import Tokenizer
+
+        model_path = os.path.join(model_dir, "model.onnx")
+        if not os.path.exists(model_path):
+            raise FileNotFoundError(
+                f"{model_path} not found — run `python -m rag_chat.export_onnx` first"
+            )
+
+        options = ort.SessionOptions()
+        if threads > 0:
+            options.intra_op_num_threads = threads
+            options.inter_op_num_threads = 1
+        options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+        self.session = ort.InferenceSession(model_path, options, providers=["CPUExecutionProvider"])
+        self.input_names = {i.name for i in self.session.get_inputs()}
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(model_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=MAX_SEQ_LENGTH)
+        self.tokenizer.enable_padding()
+        self.batch_size = batch_size
+
+    def _embed_batch(self, texts: List[str]) -> np.ndarray:
+        encoded = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([e.ids for e in encoded], dtype=np.int64)
+        attention_mask = np.array([e.attention_mask for e in encoded], dtype=np.int64)
+        feeds = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self.input_names:
+            feeds["token_type_ids"] = np.array([e.type_ids for e in encoded], dtype=np.int64)
+
+        hidden = self.session.run(None, feeds)[0]                  # (batch, seq, dim)
+        mask = attention_mask[..., None].astype(hidden.dtype)
+        pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        return pooled / np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        vectors = []
+        for start in range(0, len(texts), self.batch_size):
+            vectors.extend(self._embed_batch(texts[start:start + self.batch_size]).tolist())
+        return vectors
+
+    def embed_query(self, text: str) -> List[float]:
+        return self._embed_batch([text])[0].tolist()
+
+
+def load_embeddings(backend: str = RAG_EMBEDDING_BACKEND) -> Embeddings:
+    if backend == "onnx":
+        return OnnxEmbeddings(
+            RAG_ONNX_MODEL_DIR, batch_size=RAG_EMBEDDING_BATCH_SIZE, threads=RAG_EMBEDDING_THREADS
+        )
+    if backend != "torch":
+        raise ValueError(f"Unknown RAG_EMBEDDING_BACKEND {backend!r} (expected torch or onnx)")
+
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    if RAG_EMBEDDING_THREADS > 0:
+        import torch
+
+        torch.set_num_threads(RAG_EMBEDDING_THREADS)
+    return HuggingFaceEmbeddings(
+        model_name=RAG_EMBEDDING_MODEL,
+        encode_kwargs={"batch_size": RAG_EMBEDDING_BATCH_SIZE},
+    )
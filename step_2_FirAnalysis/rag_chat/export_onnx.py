@@ -0,0 +1,72 @@
+"""
+Export the rag_chat embedding model to ONNX and quantise it to int8 for
+RAG_EMBEDDING_BACKEND=onnx.
+
+Run from step_2_FirAnalysis/ (needs torch, transformers, onnx, onnxruntime —
+only at export time):
+    python -m rag_chat.export_onnx
+    python -m rag_chat.export_onnx --out models/minilm-onnx --no-quantise
+
+Writes model.onnx (int8 unless --no-quantise) and tokenizer.json to --out
+(default RAG_ONNX_MODEL_DIR).
+"""
+
+import argparse
+import os
+import tempfile
+
+from .config import RAG_EMBEDDING_MODEL, RAG_ONNX_MODEL_DIR
+
+
+def _hub_name(model: str) -> str:
+    # sentence-transformers accepts bare names for its own models.
+    return model if "/" in model else f"sentence-transformers/{model}"
+
+
+def export(model: str, out_dir: str, quantise: bool = True, opset: int = 17) -> str:
+    import torch
+    from transformers import AutoModel, AutoTokenizer
+
+    os.makedirs(out_dir, exist_ok=True)
+    tokenizer = AutoTokenizer.from_pretrained(_hub_name(model))
+    encoder = AutoModel.from_pretrained(_hub_name(model)).eval()
+    tokenizer.save_pretrained(out_dir)  # writes tokenizer.json
+
+    sample = tokenizer(["export sample"], return_tensors="pt")
+    inputs = ("input_ids", "attention_mask", "token_type_ids")
+    dynamic = {name: {0: "batch", 1: "sequence"} for name in inputs}
+    dynamic["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    model_path = os.path.join(out_dir, "model.onnx")
+    with tempfile.TemporaryDirectory() as tmp:
+        fp32_path = os.path.join(tmp, "model.fp32.onnx") if quantise else model_path
+        with torch.no_grad():
+            torch.onnx.export(
+                encoder,
+                tuple(sample[name] for name in inputs),
+                fp32_path,
+                input_names=list(inputs),
+                output_names=["last_hidden_state"],
+                dynamic_axes=dynamic,
+                opset_version=opset,
+            )
+        if quantise:
+            from onnxruntime.quantization import QuantType, quantize_dynamic
+
+            quantize_dynamic(fp32_path, model_path, weight_type=QuantType.QInt8)
+    return model_path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--model", default=RAG_EMBEDDING_MODEL)
+    parser.add_argument("--out", default=RAG_ONNX_MODEL_DIR)
+    parser.add_argument("--no-quantise", action="store_true", help="keep fp32 weights")
+    args = parser.parse_args()
+
+    path = export(args.model, args.out, quantise=not args.no_quantise)
+    print(f"wrote {path} ({os.path.getsize(path) / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+FAISS index construction for rag_chat, selected with RAG_FAISS_INDEX:
+
+  flat  — exact search over float32 vectors (IndexFlatL2), the original
+  hnsw  — graph search (IndexHNSWFlat): lower latency on large stores,
+          same memory as flat plus the graph
+  ivfpq — inverted lists + product quantisation (IndexIVFPQ): a fraction of
+          the memory, approximate distances; needs training data
+
+All three use squared L2 on unit vectors, so vectorstore's distance →
+cosine mapping holds. IVF-PQ falls back to flat when a store has too few
+vectors to train on (a single FIR rarely has more than a few dozen chunks).
+"""
+
+import logging
+
+import numpy as np
+
+from .config import (
+    RAG_FAISS_INDEX,
+    RAG_HNSW_EF_CONSTRUCTION,
+    RAG_HNSW_EF_SEARCH,
+    RAG_HNSW_M,
+    RAG_IVF_NLIST,
+    RAG_IVF_NPROBE,
+    RAG_PQ_M,
+    RAG_PQ_NBITS,
+)
+
+logger = logging.getLogger(__name__)
+
+INDEX_KINDS = ("flat", "hnsw", "ivfpq")
+# k-means wants ~39 points per centroid; below that FAISS warns and quality drops.
+MIN_POINTS_PER_CENTROID = 39
+
+
+def _pq_m(dim: int, m: int) -> int:
+    """Largest sub-quantiser count <= m that divides dim."""
+    while dim % m:
+        m -= 1
+    return m
+
+
+def build_index(vectors: np.ndarray, kind: str = RAG_FAISS_INDEX):
+    """Build, train (if needed) and fill an index of the given kind."""
+    import faiss
+
+    if kind not in INDEX_KINDS:
+        raise ValueError(f"Unknown RAG_FAISS_INDEX {kind!r} (expected one of {', '.join(INDEX_KINDS)})")
+
+    vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+    count, dim = vectors.shape
+
+    if kind == "ivfpq":
+        nlist = min(RAG_IVF_NLIST, count // MIN_POINTS_PER_CENTROID)
+        if nlist < 1 or count < 2 ** RAG_PQ_NBITS:
+            logger.info("Too few vectors for IVF-PQ, using a flat index", extra={"vectors": count})
+            kind = "flat"
+        else:
+            index = faiss.IndexIVFPQ(faiss.IndexFlatL2(dim), dim, nlist, _pq_m(dim, RAG_PQ_M), RAG_PQ_NBITS)
+            index.train(vectors)
+
+    if kind == "flat":
+        index = faiss.IndexFlatL2(dim)
+    elif kind == "hnsw":
+        index = faiss.IndexHNSWFlat(dim, RAG_HNSW_M)
+        index.hnsw.efConstruction = RAG_HNSW_EF_CONSTRUCTION
+
+    index.add(vectors)
+    configure_search(index)
+    return index
+
+
+def configure_search(index) -> None:
+    """
+    Apply the search-time knobs (efSearch, nprobe). These are not all kept
+    by write_index, so call this after loading as well as after building.
+    """
+    import faiss
+
+    if isinstance(index, faiss.IndexHNSW):
+        index.hnsw.efSearch = RAG_HNSW_EF_SEARCH
+    ivf = faiss.try_extract_index_ivf(index)
+    if ivf is not None:
+        ivf.nprobe = RAG_IVF_NPROBE
+        # MMR reconstructs the fetched vectors by id.
+        ivf.make_direct_map()
+
+
+def index_kind(index) -> str:
+    import faiss
+
+    if isinstance(index, faiss.IndexHNSW):
+        return "hnsw"
+    if faiss.try_extract_index_ivf(index) is not None:
+        return "ivfpq"
+    return "flat"
+
+
+def stored_vectors(index) -> np.ndarray | None:
+    """The exact vectors held by a flat or HNSW index; None for IVF-PQ (lossy)."""
+    if index_kind(index) == "ivfpq":
+        return None
+    return index.reconstruct_n(0, index.ntotal)
@@ -1,8 +1,69 @@
+import asyncio
+import json
 import os
+import random
+import time
+import httpx
 import requests
-from typing import Optional, List
+from typing import Optional, List, Any, AsyncIterator
 from langchain_core.language_models import LLM
-from langchain_core.callbacks import CallbackManagerForLLMRun
+from langchain_core.outputs import GenerationChunk
+from langchain_core.callbacks import CallbackManagerForLLMRun, AsyncCallbackManagerForLLMRun
+from .config import (
+    GEMINI_TIMEOUT_SECONDS,
+    GEMINI_CONNECT_TIMEOUT_SECONDS,
+    GEMINI_MAX_RETRIES,
+    GEMINI_BACKOFF_BASE_SECONDS,
+    GEMINI_MAX_CONNECTIONS,
+    GEMINI_API_ENDPOINT,
+)
+from core.tracing import traced
+
+GEMINI_API_BASE = f"{GEMINI_API_ENDPOINT}/v1beta/models"
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+_async_client: Optional[httpx.AsyncClient] = None
+_sync_session: Optional[requests.Session] = None
+
+
+def get_async_client() -> httpx.AsyncClient:
+    """Shared keep-alive client so chat turns reuse open TLS connections."""
+    global _async_client
+    if _async_client is None or _async_client.is_closed:
+        _async_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(GEMINI_TIMEOUT_SECONDS, connect=GEMINI_CONNECT_TIMEOUT_SECONDS),
+            limits=httpx.Limits(
+                max_connections=GEMINI_MAX_CONNECTIONS,
+                max_keepalive_connections=GEMINI_MAX_CONNECTIONS,
+            ),
+        )
+    return _async_client
+
+
+def get_sync_session() -> requests.Session:
+    global _sync_session
+    if _sync_session is None:
+        _sync_session = requests.Session()
+    return _sync_session
+
+
+async def aclose_http_client():
+    """Close the pooled client — call from the app's shutdown hook."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+def _backoff_delay(attempt: int, retry_after: Optional[str] = None) -> float:
+    """Full-jitter exponential backoff, honouring Retry-After when Gemini sends it."""
+    if retry_after:
+        try:
+            return min(float(retry_after), GEMINI_TIMEOUT_SECONDS)
+        except ValueError:
+            pass
+    return random.uniform(0, GEMINI_BACKOFF_BASE_SECONDS * (2 ** attempt))
+
 
 class GeminiChatLLM(LLM):
     model_name: str = "gemini-flash-latest"
@@ -16,13 +77,8 @@ class GeminiChatLLM(LLM):
     def _identifying_params(self):
         return {"model_name": self.model_name}
 
-    def _call(
-        self,
-        prompt: str,
-        stop: Optional[List[str]] = None,
-        run_manager: Optional[CallbackManagerForLLMRun] = None,
-    ) -> str:
-        url = f"https://generativelanguage.googleapis.com/v1beta/models/{self.model_name}:generateContent"
+    def _request(self, prompt: str, method: str = "generateContent") -> tuple[str, dict, dict]:
+        url = f"{GEMINI_API_BASE}/{self.model_name}:{method}"
         headers = {
             "Content-Type": "application/json",
             "X-goog-api-key": self.api_key
@@ -30,8 +86,111 @@ class GeminiChatLLM(LLM):
         payload = {
             "contents": [{"parts": [{"text": prompt}]}]
         }
+        return url, headers, payload
+
+    @staticmethod
+    def _parse(data: dict) -> str:
+        return data["candidates"][0]["content"]["parts"][0]["text"]
+
+    @staticmethod
+    def _parse_chunk(data: dict) -> str:
+        # Stream chunks can carry only finishReason / usage with no parts.
+        candidates = data.get("candidates") or []
+        if not candidates:
+            return ""
+        parts = candidates[0].get("content", {}).get("parts") or []
+        return "".join(part.get("text", "") for part in parts)
 
-        response = requests.post(url, headers=headers, json=payload)
-        response.raise_for_status()
+    @traced("llm.gemini.chat")
+    def _call(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+    ) -> str:
+        url, headers, payload = self._request(prompt)
+        session = get_sync_session()
+
+        for attempt in range(GEMINI_MAX_RETRIES + 1):
+            try:
+                response = session.post(
+                    url,
+                    headers=headers,
+                    json=payload,
+                    timeout=(GEMINI_CONNECT_TIMEOUT_SECONDS, GEMINI_TIMEOUT_SECONDS),
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if attempt == GEMINI_MAX_RETRIES:
+                    raise
+                time.sleep(_backoff_delay(attempt))
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < GEMINI_MAX_RETRIES:
+                time.sleep(_backoff_delay(attempt, response.headers.get("Retry-After")))
+                continue
+            response.raise_for_status()
+            return self._parse(response.json())
+
+    @traced("llm.gemini.chat")
+    async def _acall(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+    ) -> str:
+        url, headers, payload = self._request(prompt)
+        client = get_async_client()
+
+        for attempt in range(GEMINI_MAX_RETRIES + 1):
+            try:
+                response = await client.post(url, headers=headers, json=payload)
+            except (httpx.ConnectError, httpx.TimeoutException, httpx.RemoteProtocolError):
+                if attempt == GEMINI_MAX_RETRIES:
+                    raise
+                await asyncio.sleep(_backoff_delay(attempt))
+                continue
+
+            if response.status_code in RETRYABLE_STATUS_CODES and attempt < GEMINI_MAX_RETRIES:
+                await asyncio.sleep(_backoff_delay(attempt, response.headers.get("Retry-After")))
+                continue
+            response.raise_for_status()
+            return self._parse(response.json())
+
+    @traced("llm.gemini.stream")
+    async def _astream(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[GenerationChunk]:
+        url, headers, payload = self._request(prompt, method="streamGenerateContent")
+        client = get_async_client()
 
-        return response.json()["candidates"][0]["content"]["parts"][0]["text"]
+        # Retries are only safe before the first chunk has been handed out.
+        for attempt in range(GEMINI_MAX_RETRIES + 1):
+            try:
+                async with client.stream(
+                    "POST", url, headers=headers, json=payload, params={"alt": "sse"}
+                ) as response:
+                    if response.status_code in RETRYABLE_STATUS_CODES and attempt < GEMINI_MAX_RETRIES:
+                        retry_after = response.headers.get("Retry-After")
+                    else:
+                        if response.is_error:
+                            await response.aread()
+                        response.raise_for_status()
+                        async for line in response.aiter_lines():
+                            if not line.startswith("data:"):
+                                continue
+                            text = self._parse_chunk(json.loads(line[5:]))
+                            if not text:
+                                continue
+                            if run_manager:
+                                await run_manager.on_llm_new_token(text)
+                            yield GenerationChunk(text=text)
+                        return
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if attempt == GEMINI_MAX_RETRIES:
+                    raise
+                retry_after = None
+            await asyncio.sleep(_backoff_delay(attempt, retry_after))
@@ -1,8 +1,12 @@
+import threading
+import time
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 from typing import List
 from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
-from .config import chroma_client
+from .config import get_chroma_client, RAG_SESSION_TTL_SECONDS, RAG_MAX_SESSIONS
+from core.tracing import traced
 from datetime import datetime
 
 class ChromaDBChatMemory:
@@ -11,6 +15,7 @@ class ChromaDBChatMemory:
         self.session_id = session_id
         self.k = k
         self.collection_name = f"chat_history_{pdf_id}{session_id}".replace("-", "")
+        chroma_client = get_chroma_client()
         try:
             self.collection = chroma_client.create_collection(
                 name=self.collection_name,
@@ -19,6 +24,7 @@ class ChromaDBChatMemory:
         except Exception:
             self.collection = chroma_client.get_collection(name=self.collection_name)
 
+    @traced("chroma.write")
     def add_message(self, message: BaseMessage):
         message_id = str(uuid.uuid4())
         timestamp = datetime.now().isoformat()
@@ -33,6 +39,7 @@ class ChromaDBChatMemory:
             }],
             ids=[message_id]
         )
+    @traced("chroma.read")
     def get_recent_messages(self) -> List[BaseMessage]:
         results = self.collection.get(include=["documents", "metadatas"])
         if not results["documents"]:
@@ -49,6 +56,77 @@ class ChromaDBChatMemory:
             else:
                 output.append(AIMessage(content=content))
         return output
+    @traced("chroma.read")
     def get_message_count(self) -> int:
         results = self.collection.get()
         return len(results["documents"])
+
+
+class SessionRegistry:
+    """
+    Holds one ChromaDBChatMemory per pdf_id/session_id pair.
+
+    Sessions idle for longer than ttl_seconds are dropped, and once
+    max_sessions is reached the least recently used session is evicted.
+    Chat history itself lives in Chroma, so an evicted session is simply
+    re-opened on its next message.
+    """
+
+    def __init__(self, ttl_seconds: float = RAG_SESSION_TTL_SECONDS, max_sessions: int = RAG_MAX_SESSIONS):
+        self.ttl_seconds = ttl_seconds
+        self.max_sessions = max_sessions
+        self._sessions: "OrderedDict[str, tuple[ChromaDBChatMemory, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._created = 0
+        self._reused = 0
+        self._expired = 0
+        self._evicted = 0
+
+    def get(self, pdf_id: str, session_id: str) -> ChromaDBChatMemory:
+        session_key = f"{pdf_id}_{session_id}"
+        now = time.monotonic()
+        with self._lock:
+            self._expire(now)
+            entry = self._sessions.get(session_key)
+            if entry is not None:
+                self._sessions[session_key] = (entry[0], now)
+                self._sessions.move_to_end(session_key)
+                self._reused += 1
+                return entry[0]
+
+        memory = ChromaDBChatMemory(pdf_id, session_id)
+
+        with self._lock:
+            entry = self._sessions.get(session_key)
+            if entry is not None:
+                memory = entry[0]
+            else:
+                self._created += 1
+            self._sessions[session_key] = (memory, now)
+            self._sessions.move_to_end(session_key)
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self._evicted += 1
+        return memory
+
+    def stats(self) -> dict:
+        with self._lock:
+            self._expire(time.monotonic())
+            return {
+                "live_sessions": len(self._sessions),
+                "max_sessions": self.max_sessions,
+                "ttl_seconds": self.ttl_seconds,
+                "created": self._created,
+                "reused": self._reused,
+                "expired": self._expired,
+                "evicted": self._evicted,
+            }
+
+    def _expire(self, now: float) -> None:
+        # Entries are kept in last-used order, so the oldest sit at the front.
+        while self._sessions:
+            session_key, (_, last_used) = next(iter(self._sessions.items()))
+            if now - last_used < self.ttl_seconds:
+                break
+            del self._sessions[session_key]
+            self._expired += 1
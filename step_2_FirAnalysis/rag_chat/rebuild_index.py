@@ -0,0 +1,79 @@
+"""
+Rebuild saved vector stores with another FAISS index type (RAG_FAISS_INDEX
+only applies to stores embedded after it is set).
+
+Run from step_2_FirAnalysis/:
+    python -m rag_chat.rebuild_index --list                  # current type and size of each store
+    python -m rag_chat.rebuild_index --kind hnsw             # every store in vectorstores_storage/
+    python -m rag_chat.rebuild_index --kind ivfpq PDF_ID ...
+
+Vectors are reused from flat and HNSW stores. IVF-PQ stores only keep
+compressed codes, so their documents are re-embedded.
+"""
+
+import argparse
+import os
+
+from .config import RAG_FAISS_INDEX
+from .faiss_index import INDEX_KINDS, index_kind, stored_vectors
+from .vectorstore import (
+    VECTORSTORE_DIR,
+    build_vectorstore,
+    get_embeddings,
+    load_vectorstore,
+    vectorstores,
+)
+
+
+def _index_bytes(pdf_id: str) -> int:
+    path = os.path.join(VECTORSTORE_DIR, pdf_id, "index.faiss")
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def rebuild(pdf_id: str, kind: str) -> tuple[str, int]:
+    """Rebuild one store as `kind`; returns (previous kind, vector count)."""
+    vectorstore = load_vectorstore(pdf_id)
+    if vectorstore is None:
+        raise FileNotFoundError(f"No saved vector store for {pdf_id}")
+
+    previous = index_kind(vectorstore.index)
+    doc_ids = [vectorstore.index_to_docstore_id[i] for i in range(vectorstore.index.ntotal)]
+    docs = [vectorstore.docstore.search(doc_id) for doc_id in doc_ids]
+    vectors = stored_vectors(vectorstore.index)
+    if vectors is None:
+        vectors = get_embeddings().embed_documents([doc.page_content for doc in docs])
+
+    rebuilt = build_vectorstore(docs, vectors, kind)
+    rebuilt.save_local(os.path.join(VECTORSTORE_DIR, pdf_id))
+    vectorstores[pdf_id] = rebuilt
+    return previous, len(docs)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("pdf_ids", nargs="*", help="stores to rebuild (default: all)")
+    parser.add_argument("--kind", choices=INDEX_KINDS, default=RAG_FAISS_INDEX)
+    parser.add_argument("--list", action="store_true", help="only report each store's type and size")
+    args = parser.parse_args()
+
+    pdf_ids = args.pdf_ids or sorted(
+        name for name in os.listdir(VECTORSTORE_DIR) if os.path.isdir(os.path.join(VECTORSTORE_DIR, name))
+    )
+    for pdf_id in pdf_ids:
+        if args.list:
+            vectorstore = load_vectorstore(pdf_id)
+            kind = index_kind(vectorstore.index) if vectorstore else "missing"
+            count = vectorstore.index.ntotal if vectorstore else 0
+            print(f"{pdf_id:<40} {kind:<6} {count:>8} vectors {_index_bytes(pdf_id) / 1024:>10.1f} KiB")
+            continue
+        before = _index_bytes(pdf_id)
+        previous, count = rebuild(pdf_id, args.kind)
+        actual = index_kind(vectorstores[pdf_id].index)
+        print(
+            f"{pdf_id:<40} {previous} -> {actual:<6} {count:>8} vectors "
+            f"{before / 1024:>10.1f} -> {_index_bytes(pdf_id) / 1024:.1f} KiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 from fastapi import UploadFile, File, Form
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from .schemas import EmbedRequest, GenerateRequest
-from .controllers import embed_controller, embed_file_controller, generate_controller
+from .controllers import embed_controller, embed_file_controller, generate_controller, generate_stream_controller, session_stats_controller, cache_stats_controller
 
 router = APIRouter(prefix="/rag", tags=["RAG Chat"])
 
@@ -25,9 +26,26 @@ async def embed_file(
 @router.post("/generate")
 async def generate_answer(req: GenerateRequest):
     try:
-        return generate_controller(req.pdfId, req.message, req.sessionId)
+        return await generate_controller(req.pdfId, req.message, req.sessionId, req.sections)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/generate/stream")
+async def generate_answer_stream(req: GenerateRequest):
+    try:
+        events = await generate_stream_controller(req.pdfId, req.message, req.sessionId, req.sections)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+    return StreamingResponse(
+        events,
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
+@router.get("/sessions/stats")
+async def session_stats():
+    return session_stats_controller()
 
+@router.get("/cache/stats")
+async def cache_stats():
+    return cache_stats_controller()
@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, field_validator
+from typing import List, Optional
+from .chunking import SECTION_NAMES
 
 class EmbedRequest(BaseModel):
     text: str
@@ -9,3 +10,13 @@ class GenerateRequest(BaseModel):
     pdfId: str
     message: str
     sessionId: Optional[str] = "default"
+    # Restrict retrieval to these FIR sections, e.g. ["accused", "property"].
+    sections: Optional[List[str]] = None
+
+    @field_validator("sections")
+    @classmethod
+    def _known_sections(cls, value):
+        unknown = sorted(set(value or []) - set(SECTION_NAMES))
+        if unknown:
+            raise ValueError(f"unknown sections {unknown}; expected any of {list(SECTION_NAMES)}")
+        return value
@@ -1,7 +1,11 @@
 from fastapi import UploadFile
-from resume_analysis.utils import extract_resume_text_from_bytes 
+from fir_analysis.pdf_extractor import extract_text_from_pdf
 
 async def extract_text_from_file(file: UploadFile) -> str:
     content = await file.read()
-    text = extract_resume_text_from_bytes(content, filename=file.filename)
-    return text
+    # PDFs go through the FIR extractor so the text keeps its
+    # "--- Page N ---" markers for chunking (rag_chat/chunking.py).
+    if content[:5] == b"%PDF-":
+        text, _ = extract_text_from_pdf(content)
+        return text
+    return content.decode("utf-8", errors="replace")
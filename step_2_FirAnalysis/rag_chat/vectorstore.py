@@ -1,21 +1,68 @@
 import os
 import pickle
+import threading
+import uuid
+from typing import TYPE_CHECKING, Optional
 from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain_huggingface import HuggingFaceEmbeddings
-from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from .config import (
+    RAG_RETRIEVAL_K, RAG_SEARCH_TYPE, RAG_FETCH_K, RAG_MMR_LAMBDA, RAG_FAISS_INDEX,
+    RAG_CHUNKING, RAG_CHUNK_SIZE, RAG_CHUNK_OVERLAP,
+)
+from .chunking import split_fir_text
+from .embeddings import load_embeddings
+from .faiss_index import build_index, configure_search
+from core.tracing import span, traced
+
+if TYPE_CHECKING:
+    from langchain_community.vectorstores import FAISS
 
 vectorstores = {}
 VECTORSTORE_DIR = "vectorstores_storage" 
 
 os.makedirs(VECTORSTORE_DIR, exist_ok=True)
 
-embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+# The embedding model (rag_chat/embeddings.py, torch or ONNX backend) and
+# FAISS are loaded on first use, not at import.
+_embeddings = None
+_embeddings_lock = threading.Lock()
+
+
+def get_embeddings():
+    global _embeddings
+    if _embeddings is None:
+        with _embeddings_lock:
+            if _embeddings is None:
+                _embeddings = load_embeddings()
+    return _embeddings
+
+def build_vectorstore(docs: list[Document], vectors: list[list[float]], kind: str = RAG_FAISS_INDEX) -> "FAISS":
+    """Wrap a `kind` index (flat / hnsw / ivfpq) over precomputed vectors in a LangChain FAISS store."""
+    import numpy as np
+    from langchain_community.docstore.in_memory import InMemoryDocstore
+    from langchain_community.vectorstores import FAISS
 
+    index = build_index(np.array(vectors, dtype=np.float32), kind)
+    ids = [str(uuid.uuid4()) for _ in docs]
+    return FAISS(
+        embedding_function=get_embeddings(),
+        index=index,
+        docstore=InMemoryDocstore(dict(zip(ids, docs))),
+        index_to_docstore_id=dict(enumerate(ids)),
+    )
+
+def split_text(text: str) -> list[Document]:
+    if RAG_CHUNKING == "fir":
+        return split_fir_text(text, chunk_size=RAG_CHUNK_SIZE)
+    splitter = RecursiveCharacterTextSplitter(chunk_size=RAG_CHUNK_SIZE, chunk_overlap=RAG_CHUNK_OVERLAP)
+    return splitter.create_documents([text])
+
+@traced("faiss.build")
 def embed_text_for_pdf(text: str, pdf_id: str):
-    splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=100)
-    docs = splitter.create_documents([text])
+    docs = split_text(text)
+    vectors = get_embeddings().embed_documents([doc.page_content for doc in docs])
 
-    vectorstore = FAISS.from_documents(docs, embeddings)
+    vectorstore = build_vectorstore(docs, vectors)
     vectorstores[pdf_id] = vectorstore
     
     save_path = os.path.join(VECTORSTORE_DIR, pdf_id)
@@ -23,12 +70,16 @@ def embed_text_for_pdf(text: str, pdf_id: str):
     
     return vectorstore
 
+@traced("faiss.load")
 def load_vectorstore(pdf_id: str):
     """Load vectorstore from disk if it exists"""
     save_path = os.path.join(VECTORSTORE_DIR, pdf_id)
     
     if os.path.exists(save_path):
-        vectorstore = FAISS.load_local(save_path, embeddings, allow_dangerous_deserialization=True)
+        from langchain_community.vectorstores import FAISS
+
+        vectorstore = FAISS.load_local(save_path, get_embeddings(), allow_dangerous_deserialization=True)
+        configure_search(vectorstore.index)
         vectorstores[pdf_id] = vectorstore
         return vectorstore
     
@@ -43,4 +94,52 @@ def get_vectorstore(pdf_id: str):
     if vectorstore:
         return vectorstore
     
-    return None
\ No newline at end of file
+    return None
+
+def _distance_to_similarity(distance: float) -> float:
+    """
+    all-MiniLM-L6-v2 embeddings are unit-normalised, so FAISS's squared L2
+    distance maps to cosine similarity as 1 - d / 2. Clamped to 0-1.
+    """
+    return max(0.0, min(1.0, 1.0 - float(distance) / 2.0))
+
+def search_with_scores(
+    vectorstore: "FAISS",
+    query: str,
+    k: int = RAG_RETRIEVAL_K,
+    search_type: str = RAG_SEARCH_TYPE,
+    query_embedding: Optional[list[float]] = None,
+    sections: Optional[list[str]] = None,
+) -> list[tuple[Document, float]]:
+    """
+    Return up to k (document, cosine similarity) pairs, best first.
+    Pass query_embedding when the caller has already embedded the query.
+    `sections` keeps only chunks tagged with one of those FIR sections
+    (chunks from stores embedded without section metadata always pass).
+    """
+    if query_embedding is None:
+        query_embedding = embed_query(query)
+
+    search_filter = None
+    if sections:
+        wanted = set(sections)
+        search_filter = lambda metadata: "sections" not in metadata or bool(wanted & set(metadata["sections"]))
+
+    fetch_k = max(RAG_FETCH_K, k)
+    with span("faiss.search", k=k, search_type=search_type, sections=",".join(sections or [])):
+        if search_type == "mmr":
+            results = vectorstore.max_marginal_relevance_search_with_score_by_vector(
+                query_embedding, k=k, fetch_k=fetch_k, lambda_mult=RAG_MMR_LAMBDA, filter=search_filter
+            )
+        else:
+            results = vectorstore.similarity_search_with_score_by_vector(
+                query_embedding, k=k, filter=search_filter, fetch_k=fetch_k
+            )
+
+    scored = [(doc, _distance_to_similarity(distance)) for doc, distance in results]
+    scored.sort(key=lambda pair: pair[1], reverse=True)
+    return scored
+
+@traced("embedding.query")
+def embed_query(query: str) -> list[float]:
+    return get_embeddings().embed_query(query)